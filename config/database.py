@@ -1,14 +1,116 @@
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from config.settings import DATABASE_HOST, DB_NAME, DB_PASSWORD, DB_USERNAME
+from config.settings import (
+    DATABASE_HOST,
+    DATABASE_REPLICA_URLS,
+    DB_MAX_OVERFLOW,
+    DB_NAME,
+    DB_PASSWORD,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_CACHE_SIZE,
+    DB_USERNAME,
+    REPLICA_RETRY_SECONDS,
+)
+from utils import metrics
+from utils.dbpool import instrumentedPool, reportPoolUsage
+from utils.stickiness import markWrite, writeMarks
 
 DATABASE_URL = f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@{DATABASE_HOST}/{DB_NAME}?options=-csearch_path=public"
 
-engine = create_engine(DATABASE_URL)
+# asyncpg keeps an LRU of prepared statements per connection, so the repeated
+# lookup queries issued by the services are parsed and planned only once.
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{DB_USERNAME}:{DB_PASSWORD}@{DATABASE_HOST}/{DB_NAME}?prepared_statement_cache_size={DB_STATEMENT_CACHE_SIZE}"
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+    "pool_timeout": DB_POOL_TIMEOUT,
+}
+
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=instrumentedPool(QueuePool, "sync"),
+    pool_logging_name="sync",
+    **POOL_OPTIONS,
+)
+reportPoolUsage(engine.pool, "sync")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _createAsyncEngine(url, name: str):
+    asyncEngine = create_async_engine(
+        url,
+        connect_args={"server_settings": {"search_path": "public"}},
+        poolclass=instrumentedPool(AsyncAdaptedQueuePool, name),
+        pool_logging_name=name,
+        **POOL_OPTIONS,
+    )
+    reportPoolUsage(asyncEngine.sync_engine.pool, name)
+    return asyncEngine
+
+
+class PrimarySession(AsyncSession):
+    """
+    Session on the primary. Once a commit succeeds, the user set in
+    info["userUlId"] by the auth dependencies has their reads pinned to the
+    primary for READ_YOUR_WRITES_SECONDS.
+    """
+
+    async def commit(self) -> None:
+        await super().commit()
+        userUlId = self.info.get("userUlId")
+        if userUlId:
+            await markWrite(userUlId)
+
+
+async_engine = _createAsyncEngine(ASYNC_DATABASE_URL, "async")
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=PrimarySession, autoflush=False, expire_on_commit=False
+)
+
+
+class Replica:
+    def __init__(self, url: str, index: int):
+        self.name = f"replica{index}"
+        self.engine = _createAsyncEngine(
+            make_url(url)
+            .set(drivername="postgresql+asyncpg")
+            .update_query_dict(
+                {"prepared_statement_cache_size": str(DB_STATEMENT_CACHE_SIZE)}
+            ),
+            self.name,
+        )
+        # Read paths check info["replica"] before writing anything
+        self.sessionmaker = async_sessionmaker(
+            bind=self.engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+            info={"replica": True},
+        )
+        self.skipUntil = 0.0
+
+
+replicas = [Replica(url, index) for index, url in enumerate(DATABASE_REPLICA_URLS)]
+_replicaTurns = itertools.count()
+
 Base = declarative_base()
 
 
@@ -21,4 +123,73 @@ def get_db():
         db.close()
 
 
-print("🚀 Database connected successfully!!")
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def _openReplicaSession() -> Optional[AsyncSession]:
+    # Round-robin, starting one further along on every call and skipping
+    # replicas that recently failed to connect
+    start = next(_replicaTurns)
+    for offset in range(len(replicas)):
+        replica = replicas[(start + offset) % len(replicas)]
+        if replica.skipUntil > time.monotonic():
+            continue
+
+        db = replica.sessionmaker()
+        try:
+            # Connect now, so a dead replica is noticed here and not in
+            # the middle of the service
+            await db.connection()
+        except (SQLAlchemyError, OSError) as e:
+            await db.close()
+            replica.skipUntil = time.monotonic() + REPLICA_RETRY_SECONDS
+            metrics.increment("db_replica_errors_total")
+            print(f"Replica {replica.name} unavailable, skipping it: {e!r}")
+            continue
+
+        metrics.increment("db_reads_replica_total")
+        return db
+    return None
+
+
+@asynccontextmanager
+async def readSession(userUlId: Optional[str] = None):
+    """
+    Session for read-only work: a replica when one is configured and
+    reachable, otherwise the primary. A user who committed a write in the
+    last READ_YOUR_WRITES_SECONDS reads from the primary.
+    """
+    db = None
+    if replicas and not (userUlId and await writeMarks.wroteRecently(userUlId)):
+        db = await _openReplicaSession()
+    if db is None:
+        metrics.increment("db_reads_primary_total")
+        db = AsyncSessionLocal()
+
+    async with db:
+        yield db
+
+
+# Dependency to get a session for anonymous read-only endpoints
+async def get_read_db():
+    async with readSession() as db:
+        yield db
+
+
+def readDbFor(principalDependency):
+    """
+    Build a read-session dependency for endpoints authenticated by
+    principalDependency. It depends on the principal itself, so the
+    read-your-writes check does not rely on parameter order, and FastAPI
+    resolves the principal only once per request.
+    """
+
+    async def get_principal_read_db(principal=Depends(principalDependency)):
+        async with readSession(principal.userUlId) as db:
+            yield db
+
+    return get_principal_read_db
+
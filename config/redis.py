@@ -1,16 +1,21 @@
-import redis
-import json
-from datetime import datetime
+import redis.asyncio as aioredis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
 
 from config.settings import REDIS_HOST, REDIS_PORT
 
 
-redisStore = redis.Redis(
-    host=f"{REDIS_HOST}", port=REDIS_PORT, db=0, decode_responses=True
-)
+# Async client returning raw bytes, shared by the cache, token revocation
+# and the password reset codes
+redisCache = aioredis.Redis(host=f"{REDIS_HOST}", port=REDIS_PORT, db=0)
 
-try:
-    redisStore.ping()
-    print("✅ Redis Connected successfully!!")
-except redis.ConnectionError:
-    print("❌ Unable to connect with Redis!!")
+# Pub/sub subscribers get their own client without retries. The default
+# retry policy reconnects and resubscribes silently, dropping whatever was
+# published meanwhile; failing instead lets the subscriber rebuild its state.
+redisSubscriber = aioredis.Redis(
+    host=f"{REDIS_HOST}",
+    port=REDIS_PORT,
+    db=0,
+    retry=Retry(NoBackoff(), 0),
+    health_check_interval=30,
+)
@@ -15,3 +15,35 @@ DATABASE_HOST = os.getenv("DATABASE_HOST")
 
 REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", os.cpu_count() or 1))
+HASH_QUEUE_SIZE = int(os.getenv("HASH_QUEUE_SIZE", 64))
+
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 500))
+
+# Connection pool, per engine and per worker process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+
+# Comma-separated replica URLs for read-only endpoints; empty reads the primary
+DATABASE_REPLICA_URLS = [
+    url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+]
+# Reads by a user who wrote within this many seconds go to the primary
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", 5))
+# How long a replica that failed to connect is skipped
+REPLICA_RETRY_SECONDS = int(os.getenv("REPLICA_RETRY_SECONDS", 10))
+
+JOB_CACHE_TTL = int(os.getenv("JOB_CACHE_TTL", 60))
+
+PRINCIPAL_CACHE_TTL = int(os.getenv("PRINCIPAL_CACHE_TTL", 60))
+
+BULK_JOB_MAX_ITEMS = int(os.getenv("BULK_JOB_MAX_ITEMS", 5000))
+
+BULK_STATUS_MAX_ITEMS = int(os.getenv("BULK_STATUS_MAX_ITEMS", 5000))
+
+# Optional replica or warehouse connection for reports/funnel.py
+REPORTS_DATABASE_URL = os.getenv("REPORTS_DATABASE_URL")
@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Header
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy.orm import Session
-from config.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import get_async_db
 import models, schemas
-from utils.hash import hash_password, verify_password
 from ulid import ULID
-import json
+from utils.serialization import dumps
 from services import auth
 from typing import Optional
 
@@ -13,18 +12,20 @@ router = APIRouter()
 
 
 @router.get("/")
-def testAuthRoute():
+async def testAuthRoute():
     return Response(
         status_code=status.HTTP_200_OK,
         media_type="application/json",
-        content=json.dumps({"message": "Auth route is running..."}),
+        content=dumps({"message": "Auth route is running..."}),
     )
 
 
 @router.post("/register")
-def registerUser(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def registerUser(
+    user: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)
+):
     try:
-        new_user = auth.registerUserService(user, db)
+        new_user = await auth.registerUserService(user, db)
 
         response_data = {
             "message": "User registered successfully",
@@ -39,7 +40,7 @@ def registerUser(user: schemas.UserCreate, db: Session = Depends(get_db)):
 
         return Response(
             status_code=status.HTTP_201_CREATED,
-            content=json.dumps(response_data),
+            content=dumps(response_data),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -52,15 +53,17 @@ def registerUser(user: schemas.UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login")
-def login(user: schemas.UserLogin, db: Session = Depends(get_db)):
+async def login(
+    user: schemas.UserLogin, db: AsyncSession = Depends(get_async_db)
+):
     try:
-        token = auth.userLoginService(user, db)
+        token = await auth.userLoginService(user, db)
 
         response_data = {"message": "Login successfully", "token": token}
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(response_data),
+            content=dumps(response_data),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -73,13 +76,15 @@ def login(user: schemas.UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/forgot-password")
-def forgotPassword(reqBody: schemas.ForgotPassword, db: Session = Depends(get_db)):
+async def forgotPassword(
+    reqBody: schemas.ForgotPassword, db: AsyncSession = Depends(get_async_db)
+):
     try:
-        auth.forgotPasswordService(reqBody, db)
+        await auth.forgotPasswordService(reqBody, db)
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps({"message": "Email sent!!"}),
+            content=dumps({"message": "Email sent!!"}),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -92,13 +97,15 @@ def forgotPassword(reqBody: schemas.ForgotPassword, db: Session = Depends(get_db
 
 
 @router.post("/reset-password")
-def resetPassword(reqBody: schemas.ResetUserPassword, db: Session = Depends(get_db)):
+async def resetPassword(
+    reqBody: schemas.ResetUserPassword, db: AsyncSession = Depends(get_async_db)
+):
     try:
-        auth.resetPassword(reqBody, db)
+        await auth.resetPassword(reqBody, db)
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps({"message": "Password updated successfully!!"}),
+            content=dumps({"message": "Password updated successfully!!"}),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -111,7 +118,7 @@ def resetPassword(reqBody: schemas.ResetUserPassword, db: Session = Depends(get_
 
 
 @router.post("/logout")
-def logout(authorization: Optional[str] = Header(None)):
+async def logout(authorization: Optional[str] = Header(None)):
     """
     Logout endpoint that immediately expires the provided token.
     Expects Authorization header with Bearer token.
@@ -138,11 +145,53 @@ def logout(authorization: Optional[str] = Header(None)):
             )
 
         # Call logout service
-        result = auth.logoutService(token)
+        result = await auth.logoutService(token)
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(result),
+            content=dumps(result),
+            media_type="application/json",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Logout failed: {str(e)}",
+        )
+
+
+@router.post("/logout-all")
+async def logoutAll(authorization: Optional[str] = Header(None)):
+    """
+    Revoke every token issued to the caller, on all devices.
+    Expects Authorization header with Bearer token.
+    """
+    try:
+        if not authorization:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authorization header missing",
+            )
+
+        try:
+            scheme, token = authorization.split()
+            if scheme.lower() != "bearer":
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid authentication scheme",
+                )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authorization header format",
+            )
+
+        result = await auth.logoutAllService(token)
+
+        return Response(
+            status_code=status.HTTP_200_OK,
+            content=dumps(result),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -1,33 +1,54 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Response
-from sqlalchemy.orm import Session
-from config.database import get_db
-from middlewares.candidate import get_current_candidate
-import models
-import json
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import AsyncSessionLocal, get_async_db, get_read_db
+from middlewares.candidate import get_candidate_read_db, get_current_candidate
+from utils.principal import Principal
+import models, schemas
+from utils.serialization import dumps
 from services import candidate
+from utils import cache
+from utils.ulidtype import canonicalUlid
 
 router = APIRouter()
 
 
 @router.get("/")
-def testCandidateRoute():
+async def testCandidateRoute():
     return Response(
         status_code=status.HTTP_200_OK,
         media_type="application/json",
-        content=json.dumps({"message": "Candidate route is running..."}),
+        content=dumps({"message": "Candidate route is running..."}),
     )
 
 
 @router.get("/jobs")
-def fetchJobListing(page: int = 1, limit: int = 10, db: Session = Depends(get_db)):
+async def fetchJobListing(
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+):
     try:
-        response_data = candidate.fetchJobListing(page, limit, db)
+        # The session is only opened on a cache miss. It is on the primary:
+        # a rebuild right after an invalidation must see the write, and a
+        # lagging replica would cache the old body under the new version.
+        async def build() -> bytes:
+            async with AsyncSessionLocal() as db:
+                response_data = await candidate.fetchJobListing(
+                    page, limit, cursor, include_total, db
+                )
+            return dumps(response_data)
+
+        cacheKey = await cache.jobListingKey(page, limit, cursor, include_total)
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(response_data),
+            content=await cache.readThrough(cacheKey, build),
             media_type="application/json",
         )
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -35,19 +56,53 @@ def fetchJobListing(page: int = 1, limit: int = 10, db: Session = Depends(get_db
         )
 
 
-@router.get("/jobs/{jobId}")
-def fetchJobInfo(
-    jobId: str,
-    db: Session = Depends(get_db),
+# Declared before /jobs/{jobId} so "search" is not captured as a job id
+@router.get("/jobs/search")
+async def searchJobs(
+    q: str,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
     try:
-        responseData = candidate.fetchJobInfo(jobId, db)
+        response_data = await candidate.searchJobs(q, limit, cursor, db)
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(responseData),
+            content=dumps(response_data),
             media_type="application/json",
         )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to search jobs due to: {str(e)}",
+        )
+
+
+@router.get("/jobs/{jobId}")
+async def fetchJobInfo(jobId: str):
+    try:
+        # Canonical id, so every spelling shares one cache entry
+        jobId = canonicalUlid(jobId)
+
+        # The session is only opened on a cache miss, on the primary for
+        # the same reason as in fetchJobListing
+        async def build() -> bytes:
+            async with AsyncSessionLocal() as db:
+                responseData = await candidate.fetchJobInfo(jobId, db)
+            return dumps(responseData)
+
+        cacheKey = await cache.jobDetailKey(jobId)
+
+        return Response(
+            status_code=status.HTTP_200_OK,
+            content=await cache.readThrough(cacheKey, build),
+            media_type="application/json",
+        )
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -56,17 +111,17 @@ def fetchJobInfo(
 
 
 @router.post("/jobs-application/{jobId}")
-def sendJobApplication(
+async def sendJobApplication(
     jobId: str,
-    current_user: models.User = Depends(get_current_candidate),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_candidate),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        candidate.sendJobApplication(jobId, current_user, db)
+        await candidate.sendJobApplication(jobId, current_user, db)
 
         return Response(
             status_code=status.HTTP_201_CREATED,
-            content=json.dumps({"message": "Job application submitted successfully!!"}),
+            content=dumps({"message": "Job application submitted successfully!!"}),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -79,18 +134,22 @@ def sendJobApplication(
 
 
 @router.get("/applied-jobs")
-def fetchCandidateAppliedJobs(
+async def fetchCandidateAppliedJobs(
     page: int = 1,
     limit: int = 10,
-    current_user: models.User = Depends(get_current_candidate),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+    current_user: Principal = Depends(get_current_candidate),
+    db: AsyncSession = Depends(get_candidate_read_db),
 ):
     try:
-        response_data = candidate.fetchCandidateAppliedJobs(page, limit, current_user, db)
+        response_data = await candidate.fetchCandidateAppliedJobs(
+            page, limit, cursor, include_total, current_user, db
+        )
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(response_data),
+            content=dumps(response_data),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -100,3 +159,51 @@ def fetchCandidateAppliedJobs(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unable to fetch applied jobs due to: {str(e)}",
         )
+
+
+@router.get("/recommended-jobs")
+async def fetchRecommendedJobs(
+    limit: int = 10,
+    current_user: Principal = Depends(get_current_candidate),
+    db: AsyncSession = Depends(get_candidate_read_db),
+):
+    try:
+        response_data = await candidate.fetchRecommendedJobs(limit, current_user, db)
+
+        return Response(
+            status_code=status.HTTP_200_OK,
+            content=dumps(response_data),
+            media_type="application/json",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to fetch recommended jobs due to: {str(e)}",
+        )
+
+
+@router.patch("/profile")
+async def updateCandidateProfile(
+    profile: schemas.CandidateProfileUpdate,
+    current_user: Principal = Depends(get_current_candidate),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        response_data = await candidate.updateCandidateProfile(
+            profile, current_user, db
+        )
+
+        return Response(
+            status_code=status.HTTP_200_OK,
+            content=dumps(response_data),
+            media_type="application/json",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to update profile due to: {str(e)}",
+        )
@@ -1,43 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from sqlalchemy.orm import Session
-from config.database import get_db
-from middlewares.recruiter import get_current_recruiter
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import get_async_db
+from middlewares.recruiter import get_current_recruiter, get_recruiter_read_db
+from utils.principal import Principal
 import models, schemas
 from services.recruiter import (
+    bulkUpdateJobApplicationStatusService,
     deleteRecruiterJobService,
+    exportJobApplicationsService,
     fetchJobApplicationService,
     fetchRecruiterJobInfoService,
     getRecruiterJobsService,
+    parseBulkJobs,
+    recruiterBulkJobCreationService,
+    recruiterDashboardService,
     recruiterJobCreationService,
+    searchCandidatesService,
     updateJobApplicationStatusService,
     updateRecruiterJobService,
 )
-import json
+from utils.serialization import dumps
 import math
 
 router = APIRouter()
 
 
 @router.get("/")
-def testRecruiterRoute():
+async def testRecruiterRoute():
     return Response(
         status_code=status.HTTP_200_OK,
         media_type="application/json",
-        content=json.dumps({"message": "Recruiter route is running..."}),
+        content=dumps({"message": "Recruiter route is running..."}),
     )
 
 
 @router.post("/jobs")
-def recruiterJobCreation(
+async def recruiterJobCreation(
     job_data: schemas.JobCreate,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        responseData = recruiterJobCreationService(job_data, current_user, db)
+        responseData = await recruiterJobCreationService(job_data, current_user, db)
         return Response(
             status_code=status.HTTP_201_CREATED,
-            content=json.dumps(responseData),
+            content=dumps(responseData),
             media_type="application/json",
         )
     except Exception as e:
@@ -47,21 +56,57 @@ def recruiterJobCreation(
         )
 
 
+@router.post("/jobs/bulk")
+async def recruiterBulkJobCreation(
+    request: Request,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Create many jobs at once from a JSON array of jobs, or NDJSON when sent
+    with an application/x-ndjson content type. Returns a result per item.
+    """
+    try:
+        items = parseBulkJobs(
+            await request.body(), request.headers.get("content-type", "")
+        )
+        responseData = await recruiterBulkJobCreationService(items, current_user, db)
+
+        return Response(
+            status_code=status.HTTP_201_CREATED,
+            content=dumps(responseData),
+            media_type="application/json",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Bulk job creation failed due to: {str(e)}",
+        )
+
+
 @router.get("/jobs")
-def getRecruiterJobs(
+async def getRecruiterJobs(
     page: int = 1,
     limit: int = 10,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_recruiter_read_db),
 ):
     try:
-        responseData = getRecruiterJobsService(page, limit, current_user, db)
+        responseData = await getRecruiterJobsService(
+            page, limit, cursor, include_total, current_user, db
+        )
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(responseData),
+            content=dumps(responseData),
             media_type="application/json",
         )
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -70,19 +115,21 @@ def getRecruiterJobs(
 
 
 @router.get("/jobs/{jobId}")
-def fetchRecruiterJobInfo(
+async def fetchRecruiterJobInfo(
     jobId: str,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_recruiter_read_db),
 ):
     try:
-        responseData = fetchRecruiterJobInfoService(jobId, current_user, db)
+        responseData = await fetchRecruiterJobInfoService(jobId, current_user, db)
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(responseData),
+            content=dumps(responseData),
             media_type="application/json",
         )
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -91,16 +138,16 @@ def fetchRecruiterJobInfo(
 
 
 @router.delete("/jobs/{jobId}")
-def deleteRecruiterJob(
+async def deleteRecruiterJob(
     jobId: str,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        deleteRecruiterJobService(jobId, current_user, db)
+        await deleteRecruiterJobService(jobId, current_user, db)
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps({"message": "Job deleted successfully"}),
+            content=dumps({"message": "Job deleted successfully"}),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -113,18 +160,20 @@ def deleteRecruiterJob(
 
 
 @router.patch("/jobs/{jobId}")
-def updateRecruiterJobs(
+async def updateRecruiterJobs(
     jobId: str,
     job_data: schemas.JobUpdate,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        responseData = updateRecruiterJobService(jobId, current_user, db)
+        responseData = await updateRecruiterJobService(
+            jobId, job_data, current_user, db
+        )
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(responseData),
+            content=dumps(responseData),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -136,20 +185,51 @@ def updateRecruiterJobs(
         )
 
 
+@router.get("/dashboard")
+async def recruiterDashboard(
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_recruiter_read_db),
+):
+    try:
+        responseData = await recruiterDashboardService(
+            limit, cursor, current_user, db
+        )
+
+        return Response(
+            status_code=status.HTTP_200_OK,
+            content=dumps(responseData),
+            media_type="application/json",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to fetch dashboard due to: {str(e)}",
+        )
+
+
 @router.get("/job-applications/{jobId}")
-def fetchJobApplications(
+async def fetchJobApplications(
     jobId: str,
     page: int = 1,
     limit: int = 10,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+    sort: Optional[str] = None,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_recruiter_read_db),
 ):
     try:
-        responseData = fetchJobApplicationService(jobId, page, limit, current_user, db)
+        responseData = await fetchJobApplicationService(
+            jobId, page, limit, cursor, include_total, sort, current_user, db
+        )
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(responseData),
+            content=dumps(responseData),
             media_type="application/json",
         )
     except HTTPException as e:
@@ -161,19 +241,51 @@ def fetchJobApplications(
         )
 
 
+@router.get("/job-applications/{jobId}/export")
+async def exportJobApplications(
+    jobId: str,
+    format: str = "csv",
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_recruiter_read_db),
+):
+    """
+    Stream every application of a job as CSV or NDJSON.
+    """
+    try:
+        content = await exportJobApplicationsService(jobId, format, current_user, db)
+
+        return StreamingResponse(
+            content,
+            status_code=status.HTTP_200_OK,
+            media_type="text/csv" if format == "csv" else "application/x-ndjson",
+            headers={
+                "Content-Disposition": f'attachment; filename="applications-{jobId}.{format}"'
+            },
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to export the job applications due to: {str(e)}",
+        )
+
+
 @router.patch("/job-application/{applicationId}/status/{latestStatus}")
-def updateJobApplicationStatus(
+async def updateJobApplicationStatus(
     applicationId: str,
     latestStatus: str,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        updateJobApplicationStatusService(applicationId, latestStatus, current_user, db)
+        await updateJobApplicationStatusService(
+            applicationId, latestStatus, current_user, db
+        )
 
         return Response(
             status_code=status.HTTP_200_OK,
-            content=json.dumps(
+            content=dumps(
                 {"message": "Job application status updated successfully!!"}
             ),
             media_type="application/json",
@@ -186,3 +298,55 @@ def updateJobApplicationStatus(
             detail=f"Unable to update the status of job application due to: {str(e)}",
         )
 
+
+@router.patch("/job-applications/status")
+async def bulkUpdateJobApplicationStatus(
+    reqBody: schemas.JobApplicationBulkStatus,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        responseData = await bulkUpdateJobApplicationStatusService(
+            reqBody, current_user, db
+        )
+
+        return Response(
+            status_code=status.HTTP_200_OK,
+            content=dumps(responseData),
+            media_type="application/json",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to update the status of job applications due to: {str(e)}",
+        )
+
+
+@router.get("/candidates")
+async def searchCandidates(
+    skills: str,
+    mode: str = "all",
+    page: int = 1,
+    limit: int = 10,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_recruiter_read_db),
+):
+    try:
+        responseData = await searchCandidatesService(
+            skills, mode, page, limit, current_user, db
+        )
+
+        return Response(
+            status_code=status.HTTP_200_OK,
+            content=dumps(responseData),
+            media_type="application/json",
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to search candidates due to: {str(e)}",
+        )
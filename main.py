@@ -1,12 +1,39 @@
-from fastapi import FastAPI, status
-from config.redis import redisStore
-import models
-from config.database import engine
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response, status
+from utils.serialization import dumps
+from config.database import async_engine, replicas
+from config.redis import redisCache, redisSubscriber
 from controllers import auth, recruiter, candidate
+from utils import metrics
+from utils.hash import shutdownHashPool
+from utils.health import checkDependencies, readiness, warmPools
+from utils.recommendations import jobIndex
+from utils.revocation import revocationFilter
+from utils.skills import skillIndex
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    revocationFilter.start()
+    jobIndex.start()
+    skillIndex.start()
+    # Uvicorn only accepts connections once this returns, so requests never
+    # wait on pool connections being opened
+    await warmPools()
+    yield
+    await skillIndex.stop()
+    await jobIndex.stop()
+    await revocationFilter.stop()
+    shutdownHashPool()
+    await async_engine.dispose()
+    for replica in replicas:
+        await replica.engine.dispose()
+    await redisCache.aclose()
+    await redisSubscriber.aclose()
 
-models.Base.metadata.create_all(bind=engine)
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/")
@@ -14,6 +41,42 @@ def homeRoute():
     return {"status": True, "message": "Welcome to home Page!!"}
 
 
+@app.get("/metrics")
+def metricsRoute():
+    return metrics.snapshot()
+
+
+@app.get("/healthz")
+def healthRoute():
+    # Liveness only: the process is up and serving
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readyRoute():
+    checks = await checkDependencies()
+    ready = readiness.warmed and not any(checks.values())
+
+    return Response(
+        status_code=(
+            status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        content=dumps(
+            {
+                "status": "ready" if ready else "not ready",
+                "warmed": readiness.warmed,
+                "checks": {name: error or "ok" for name, error in checks.items()},
+                "indexes": {
+                    "job_recommendations": jobIndex.ready,
+                    "candidate_skills": skillIndex.ready,
+                    "token_revocations": revocationFilter.ready,
+                },
+            }
+        ),
+        media_type="application/json",
+    )
+
+
 # defining routes
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(recruiter.router, prefix="/recruiter", tags=["Recruiter"])
@@ -1,13 +1,14 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException, Header, status
-import models
-from config.database import get_db
+from middlewares.principal import attachPrincipal, resolvePrincipal
+from config.database import get_async_db, readDbFor
 from utils.token import verifyCandidateToken
 
 
-def get_current_candidate(
-    authorization: Optional[str] = Header(None), db: Session = Depends(get_db)
+async def get_current_candidate(
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
     if not authorization:
         raise HTTPException(
@@ -30,15 +31,21 @@ def get_current_candidate(
         )
 
     # Verify the token
-    token_result = verifyCandidateToken(token)
+    token_result = await verifyCandidateToken(token)
     if not token_result["valid"]:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=token_result["error"]
         )
 
-    # Get user from database
-    user_id = token_result["data"]["userUlId"]
-    user = db.query(models.User).filter(models.User.userUlId == user_id).first()
+    # Reject on the role claim before touching the cache or the database
+    claims = token_result["data"]
+    if claims.get("role_id", 2) != 2:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied. Candidate role required",
+        )
+
+    user = await resolvePrincipal(claims["userUlId"], db)
 
     if not user:
         raise HTTPException(
@@ -48,7 +55,12 @@ def get_current_candidate(
     if user.role_id != 2:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Recruiter role required",
+            detail="Access denied. Candidate role required",
         )
 
+    attachPrincipal(db, user)
     return user
+
+
+# Read-only session for endpoints authenticated as a candidate
+get_candidate_read_db = readDbFor(get_current_candidate)
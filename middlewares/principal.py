@@ -0,0 +1,36 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import models
+from utils.principal import Principal, principalCache
+
+
+async def resolvePrincipal(user_id: str, db: AsyncSession) -> Optional[Principal]:
+    principal = principalCache.get(user_id)
+    if principal is not None:
+        return principal
+
+    # Cache miss: confirm the user still exists and pick up its current role
+    row = (
+        await db.execute(
+            select(
+                models.User.userUlId,
+                models.User.role_id,
+                models.User.email,
+                models.User.full_name,
+            ).where(models.User.userUlId == user_id)
+        )
+    ).first()
+    if row is None:
+        return None
+
+    principal = Principal(*row)
+    principalCache.set(principal)
+    return principal
+
+
+def attachPrincipal(db: AsyncSession, principal: Principal) -> None:
+    # Commits on db pin the user's reads to the primary (read-your-writes)
+    db.info["userUlId"] = principal.userUlId
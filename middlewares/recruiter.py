@@ -1,15 +1,16 @@
 from typing import Optional
 
 from fastapi import Depends, HTTPException, Header, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.database import get_db
-import models
+from config.database import get_async_db, readDbFor
+from middlewares.principal import attachPrincipal, resolvePrincipal
 from utils.token import verifyRecruiterToken
 
 
-def get_current_recruiter(
-    authorization: Optional[str] = Header(None), db: Session = Depends(get_db)
+async def get_current_recruiter(
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
     if not authorization:
         raise HTTPException(
@@ -32,15 +33,21 @@ def get_current_recruiter(
         )
 
     # Verify the token
-    token_result = verifyRecruiterToken(token)
+    token_result = await verifyRecruiterToken(token)
     if not token_result["valid"]:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=token_result["error"]
         )
 
-    # Get user from database
-    user_id = token_result["data"]["userUlId"]
-    user = db.query(models.User).filter(models.User.userUlId == user_id).first()
+    # Reject on the role claim before touching the cache or the database
+    claims = token_result["data"]
+    if claims.get("role_id", 3) != 3:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied. Recruiter role required",
+        )
+
+    user = await resolvePrincipal(claims["userUlId"], db)
 
     if not user:
         raise HTTPException(
@@ -53,4 +60,9 @@ def get_current_recruiter(
             detail="Access denied. Recruiter role required",
         )
 
+    attachPrincipal(db, user)
     return user
+
+
+# Read-only session for endpoints authenticated as a recruiter
+get_recruiter_read_db = readDbFor(get_current_recruiter)
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from alembic import op
+from sqlalchemy import text
+
+
+def createIndexConcurrently(
+    name: str,
+    table: str,
+    columns: str,
+    unique: bool = False,
+    using: Optional[str] = None,
+) -> None:
+    """
+    Build an index on a live table without blocking writes. A leftover
+    INVALID index from an interrupted build is dropped and rebuilt.
+    Must be called inside op.get_context().autocommit_block().
+    """
+    isValid = (
+        op.get_bind()
+        .execute(
+            text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = 'public' AND c.relname = :name"
+            ),
+            {"name": name},
+        )
+        .scalar()
+    )
+    if isValid:
+        return
+    if isValid is not None:
+        dropIndexConcurrently(name)
+
+    op.execute(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY {name} "
+        f"ON public.{table} {f'USING {using} ' if using else ''}({columns})"
+    )
+
+
+def dropIndexConcurrently(name: str) -> None:
+    op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS public.{name}")
@@ -0,0 +1,99 @@
+"""baseline schema
+
+Creates the tables previously made by Base.metadata.create_all. Databases
+that were already created that way are left untouched, so both fresh and
+existing deployments can run `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names(schema="public"))
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("userUlId", sa.String),
+            sa.Column("email", sa.String),
+            sa.Column("password", sa.String),
+            sa.Column("full_name", sa.String),
+            sa.Column("role_id", sa.Integer),
+            sa.Column("created_at", sa.DateTime),
+            sa.Column("skills", sa.String),
+            sa.Column("bio", sa.String),
+            schema="public",
+        )
+        op.create_index("ix_public_users_id", "users", ["id"], schema="public")
+        op.create_index(
+            "ix_public_users_userUlId", "users", ["userUlId"], schema="public"
+        )
+        op.create_index(
+            "ix_public_users_email", "users", ["email"], unique=True, schema="public"
+        )
+
+    if "jobs" not in existing:
+        op.create_table(
+            "jobs",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("ulid", sa.String),
+            sa.Column("title", sa.String),
+            sa.Column("description", sa.Text),
+            sa.Column("requirements", sa.Text),
+            sa.Column("recruiter_id", sa.String),
+            sa.Column("created_at", sa.DateTime),
+            schema="public",
+        )
+        op.create_index("ix_public_jobs_id", "jobs", ["id"], schema="public")
+        op.create_index("ix_public_jobs_ulid", "jobs", ["ulid"], schema="public")
+        op.create_index("ix_public_jobs_title", "jobs", ["title"], schema="public")
+
+    if "job_applications" not in existing:
+        op.create_table(
+            "job_applications",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("ulid", sa.String),
+            sa.Column("job_id", sa.String),
+            sa.Column("candidate_id", sa.String),
+            sa.Column("status", sa.String),
+            sa.Column("applied_at", sa.DateTime),
+            schema="public",
+        )
+        op.create_index(
+            "ix_public_job_applications_id",
+            "job_applications",
+            ["id"],
+            schema="public",
+        )
+        op.create_index(
+            "ix_public_job_applications_ulid",
+            "job_applications",
+            ["ulid"],
+            schema="public",
+        )
+
+    if "listing_counters" not in existing:
+        op.create_table(
+            "listing_counters",
+            sa.Column("scope", sa.String, primary_key=True),
+            sa.Column("owner_id", sa.String, primary_key=True),
+            sa.Column("total", sa.BigInteger, nullable=False),
+            schema="public",
+        )
+
+
+def downgrade():
+    op.drop_table("listing_counters", schema="public")
+    op.drop_table("job_applications", schema="public")
+    op.drop_table("jobs", schema="public")
+    op.drop_table("users", schema="public")
@@ -0,0 +1,77 @@
+"""composite and unique indexes for service queries
+
+Built with CREATE INDEX CONCURRENTLY so they can be added to live tables.
+Duplicate (candidate_id, job_id) applications left behind by the old
+check-then-insert race are removed first, keeping the earliest one.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+from migrations.helpers import createIndexConcurrently, dropIndexConcurrently
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    # Public job listing, keyset ordered
+    ("ix_jobs_created_at_ulid", "jobs", "created_at, ulid", False),
+    # A recruiter's jobs, keyset ordered; also serves recruiter_id lookups
+    (
+        "ix_jobs_recruiter_created_at_ulid",
+        "jobs",
+        "recruiter_id, created_at, ulid",
+        False,
+    ),
+    # Duplicate title check on job creation
+    ("ix_jobs_recruiter_title", "jobs", "recruiter_id, title", False),
+    # A candidate's applications, keyset ordered
+    (
+        "ix_job_applications_candidate_applied_at_ulid",
+        "job_applications",
+        "candidate_id, applied_at, ulid",
+        False,
+    ),
+    # A job's applications, keyset ordered
+    (
+        "ix_job_applications_job_applied_at_ulid",
+        "job_applications",
+        "job_id, applied_at, ulid",
+        False,
+    ),
+    # "Already applied" check; one application per candidate and job
+    (
+        "uq_job_applications_candidate_job",
+        "job_applications",
+        "candidate_id, job_id",
+        True,
+    ),
+]
+
+
+def upgrade():
+    op.execute(
+        "DELETE FROM public.job_applications a USING public.job_applications b "
+        "WHERE a.candidate_id = b.candidate_id AND a.job_id = b.job_id "
+        "AND a.id > b.id"
+    )
+    # Application counters may include the removed duplicates; they are
+    # reseeded on next read
+    op.execute(
+        "DELETE FROM public.listing_counters "
+        "WHERE scope IN ('job_applications', 'candidate_applications')"
+    )
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            createIndexConcurrently(name, table, columns, unique=unique)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _, _ in reversed(INDEXES):
+            dropIndexConcurrently(name)
@@ -0,0 +1,43 @@
+"""full-text search column and GIN index on jobs
+
+Adding a stored generated column rewrites the jobs table under an
+exclusive lock, so run this in a quiet window on large databases. The GIN
+index is then built concurrently.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+from migrations.helpers import createIndexConcurrently, dropIndexConcurrently
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(requirements, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE public.jobs ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+
+    with op.get_context().autocommit_block():
+        createIndexConcurrently(
+            "ix_jobs_search_vector", "jobs", "search_vector", using="gin"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        dropIndexConcurrently("ix_jobs_search_vector")
+
+    op.execute("ALTER TABLE public.jobs DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,66 @@
+"""normalised skills and the user to skill association
+
+Backfills both tables from the free-text users.skills column, using the
+same normalisation as utils/skills.parseSkills: split on , ; | or newline,
+collapse whitespace, lowercase, and drop empty or over-long names.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+PARSED_SKILLS_SQL = """
+    SELECT u."userUlId" AS user_id,
+           lower(btrim(regexp_replace(part, '\\s+', ' ', 'g'))) AS name
+    FROM public.users u,
+         regexp_split_to_table(coalesce(u.skills, ''), '[,;|\\n]') AS part
+"""
+
+
+def upgrade():
+    op.create_table(
+        "skills",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.String, nullable=False, unique=True),
+        schema="public",
+    )
+    op.create_table(
+        "user_skills",
+        sa.Column("user_id", sa.String, primary_key=True),
+        sa.Column("skill_id", sa.Integer, primary_key=True),
+        schema="public",
+    )
+
+    op.execute(
+        "INSERT INTO public.skills (name) "
+        f"SELECT DISTINCT name FROM ({PARSED_SKILLS_SQL}) parsed "
+        "WHERE name <> '' AND length(name) <= 64 "
+        "ON CONFLICT (name) DO NOTHING"
+    )
+    op.execute(
+        "INSERT INTO public.user_skills (user_id, skill_id) "
+        f"SELECT DISTINCT parsed.user_id, s.id FROM ({PARSED_SKILLS_SQL}) parsed "
+        "JOIN public.skills s ON s.name = parsed.name "
+        "WHERE parsed.user_id IS NOT NULL "
+        "ON CONFLICT DO NOTHING"
+    )
+
+    # Created after the backfill; the tables are new, so no CONCURRENTLY
+    op.create_index(
+        "ix_user_skills_skill_user",
+        "user_skills",
+        ["skill_id", "user_id"],
+        schema="public",
+    )
+
+
+def downgrade():
+    op.drop_table("user_skills", schema="public")
+    op.drop_table("skills", schema="public")
@@ -0,0 +1,39 @@
+"""per-job, per-status application counters
+
+The backfill sets exact totals. Its INSERT can be run again by hand after
+the deploy to pick up applications the previous release accepted in the
+meantime.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "job_status_counters",
+        sa.Column("job_id", sa.String, primary_key=True),
+        sa.Column("status", sa.String, primary_key=True),
+        sa.Column("total", sa.BigInteger, nullable=False),
+        schema="public",
+    )
+
+    op.execute(
+        "INSERT INTO public.job_status_counters (job_id, status, total) "
+        "SELECT job_id, coalesce(status, 'pending'), count(*) "
+        "FROM public.job_applications WHERE job_id IS NOT NULL "
+        "GROUP BY job_id, coalesce(status, 'pending') "
+        "ON CONFLICT (job_id, status) DO UPDATE SET total = EXCLUDED.total"
+    )
+
+
+def downgrade():
+    op.drop_table("job_status_counters", schema="public")
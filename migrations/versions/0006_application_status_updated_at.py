@@ -0,0 +1,48 @@
+"""status_updated_at on job_applications, and indexes for report extraction
+
+Adding a nullable column without a default does not rewrite the table.
+Applications decided before this revision keep a NULL status_updated_at and
+are left out of time-to-decision figures.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+from migrations.helpers import createIndexConcurrently, dropIndexConcurrently
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_job_applications_applied_at", "job_applications", "applied_at"),
+    (
+        "ix_job_applications_status_updated_at",
+        "job_applications",
+        "status_updated_at",
+    ),
+]
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE public.job_applications "
+        "ADD COLUMN IF NOT EXISTS status_updated_at timestamp without time zone"
+    )
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            createIndexConcurrently(name, table, columns)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            dropIndexConcurrently(name)
+
+    op.execute(
+        "ALTER TABLE public.job_applications DROP COLUMN IF EXISTS status_updated_at"
+    )
@@ -0,0 +1,100 @@
+"""store ULID columns as native uuid
+
+Converts every column holding a 26-character ULID string to uuid (16
+bytes) with a plpgsql decoder. Each ALTER TABLE rewrites its table and
+rebuilds its indexes under an exclusive lock, so run this in a maintenance
+window. Values that are not valid ULIDs become NULL; in a primary key
+column that makes the migration fail, leaving the data unchanged.
+
+listing_counters.owner_id keeps text: it holds ULIDs of different
+entities and is never joined.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+# table -> ULID columns, converted with one ALTER TABLE (one rewrite) each
+COLUMNS = {
+    "users": ['"userUlId"'],
+    "jobs": ["ulid", "recruiter_id"],
+    "job_applications": ["ulid", "job_id", "candidate_id"],
+    "job_status_counters": ["job_id"],
+    "user_skills": ["user_id"],
+}
+
+ULID_TO_UUID = """
+CREATE OR REPLACE FUNCTION public.ulid_to_uuid(value text) RETURNS uuid AS $$
+DECLARE
+    alphabet constant text := '0123456789ABCDEFGHJKMNPQRSTVWXYZ';
+    bits varbit := B'';
+    hex text := '';
+    digit int;
+BEGIN
+    IF length(value) <> 26 THEN
+        RETURN NULL;
+    END IF;
+    FOR i IN 1..26 LOOP
+        digit := strpos(alphabet, upper(substr(value, i, 1))) - 1;
+        IF digit < 0 THEN
+            RETURN NULL;
+        END IF;
+        bits := bits || digit::bit(5);
+    END LOOP;
+    -- 26 base32 digits carry 130 bits; a valid ULID leaves the top two at 0
+    IF substring(bits FROM 1 FOR 2) <> B'00' THEN
+        RETURN NULL;
+    END IF;
+    FOR i IN 0..31 LOOP
+        hex := hex || to_hex(substring(bits FROM 3 + i * 4 FOR 4)::bit(4)::int);
+    END LOOP;
+    RETURN hex::uuid;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE STRICT
+"""
+
+UUID_TO_ULID = """
+CREATE OR REPLACE FUNCTION public.uuid_to_ulid(value uuid) RETURNS text AS $$
+DECLARE
+    alphabet constant text := '0123456789ABCDEFGHJKMNPQRSTVWXYZ';
+    bits bit(130) := B'00' || ('x' || replace(value::text, '-', ''))::bit(128);
+    result text := '';
+BEGIN
+    FOR i IN 0..25 LOOP
+        result := result
+            || substr(alphabet, substring(bits FROM 1 + i * 5 FOR 5)::bit(5)::int + 1, 1);
+    END LOOP;
+    RETURN result;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE STRICT
+"""
+
+
+def _alter(table: str, columns: list, newType: str, using: str) -> None:
+    clauses = ", ".join(
+        f"ALTER COLUMN {column} TYPE {newType} USING public.{using}({column})"
+        for column in columns
+    )
+    op.execute(f"ALTER TABLE public.{table} {clauses}")
+
+
+def upgrade():
+    op.execute(ULID_TO_UUID)
+    op.execute(UUID_TO_ULID)
+
+    for table, columns in COLUMNS.items():
+        _alter(table, columns, "uuid", "ulid_to_uuid")
+
+
+def downgrade():
+    for table, columns in COLUMNS.items():
+        _alter(table, columns, "varchar", "uuid_to_ulid")
+
+    op.execute("DROP FUNCTION IF EXISTS public.uuid_to_ulid(uuid)")
+    op.execute("DROP FUNCTION IF EXISTS public.ulid_to_uuid(text)")
@@ -0,0 +1,27 @@
+"""version on jobs, bumped whenever a job's content changes
+
+Keys the per-worker cache of encoded job JSON. On Postgres 11+ adding a
+NOT NULL column with a constant default is a catalog change and does not
+rewrite the table.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE public.jobs "
+        "ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1"
+    )
+
+
+def downgrade():
+    op.execute("ALTER TABLE public.jobs DROP COLUMN IF EXISTS version")
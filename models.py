@@ -1,17 +1,37 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 
+from utils.ulidtype import ULIDType
+
 Base = declarative_base()
 
+# Title ranks above requirements, which rank above the description
+JOB_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(requirements, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
 
 class User(Base):
     __tablename__ = "users"
     __table_args__ = {"schema": "public"}  # Add this line
 
     id = Column(Integer, primary_key=True, index=True)
-    userUlId = Column(String, index=True)
+    userUlId = Column(ULIDType, index=True)
     email = Column(String, unique=True, index=True)
     password = Column(String)
     full_name = Column(String)
@@ -23,15 +43,33 @@ class User(Base):
 
 class Job(Base):
     __tablename__ = "jobs"
-    __table_args__ = {"schema": "public"}  # Add this line
+    __table_args__ = (
+        # Keep in sync with the migrations in migrations/versions
+        # Keyset pagination of the public listing and of a recruiter's jobs
+        Index("ix_jobs_created_at_ulid", "created_at", "ulid"),
+        Index(
+            "ix_jobs_recruiter_created_at_ulid", "recruiter_id", "created_at", "ulid"
+        ),
+        # Duplicate title check on job creation
+        Index("ix_jobs_recruiter_title", "recruiter_id", "title"),
+        # Full-text job search
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        {"schema": "public"},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    ulid = Column(String, index=True)
+    ulid = Column(ULIDType, index=True)
     title = Column(String, index=True)
     description = Column(Text)
     requirements = Column(Text)
-    recruiter_id = Column(String)
+    recruiter_id = Column(ULIDType)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Bumped on every content change; keys the encoded job cache
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # Maintained by Postgres; deferred so listings don't load it
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(JOB_SEARCH_VECTOR_SQL, persisted=True))
+    )
 
     # Relationships
     # recruiter = relationship("User", back_populates="jobs")
@@ -40,20 +78,97 @@ class Job(Base):
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
-    __table_args__ = {"schema": "public"}  # Add this line
+    __table_args__ = (
+        # Keyset pagination of a candidate's and of a job's applications
+        Index(
+            "ix_job_applications_candidate_applied_at_ulid",
+            "candidate_id",
+            "applied_at",
+            "ulid",
+        ),
+        Index(
+            "ix_job_applications_job_applied_at_ulid", "job_id", "applied_at", "ulid"
+        ),
+        # One application per candidate and job
+        Index(
+            "uq_job_applications_candidate_job",
+            "candidate_id",
+            "job_id",
+            unique=True,
+        ),
+        # Incremental extraction by reports/funnel.py
+        Index("ix_job_applications_applied_at", "applied_at"),
+        Index("ix_job_applications_status_updated_at", "status_updated_at"),
+        {"schema": "public"},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    ulid = Column(String, index=True)
-    job_id = Column(String)
-    candidate_id = Column(String)
+    ulid = Column(ULIDType, index=True)
+    job_id = Column(ULIDType)
+    candidate_id = Column(ULIDType)
     status = Column(String, default="pending")
     applied_at = Column(DateTime, default=datetime.utcnow)
+    # Set when a recruiter accepts or rejects the application
+    status_updated_at = Column(DateTime)
 
     # Relationships
     # job = relationship("Job", back_populates="applications")
     # candidate = relationship("User", back_populates="applications")
 
 
+class ListingCounter(Base):
+    """
+    Row counts maintained alongside writes so paginated listings can report
+    totals without a COUNT(*). scope is one of the names in services/counters.py
+    and owner_id the ULID the listing is filtered by.
+    """
+
+    __tablename__ = "listing_counters"
+    __table_args__ = {"schema": "public"}
+
+    scope = Column(String, primary_key=True)
+    owner_id = Column(String, primary_key=True)
+    total = Column(BigInteger, nullable=False, default=0)
+
+
+class JobStatusCounter(Base):
+    """
+    Applications per job and status, kept current in the same transaction as
+    every application insert and status change; see services/counters.py.
+    """
+
+    __tablename__ = "job_status_counters"
+    __table_args__ = {"schema": "public"}
+
+    job_id = Column(ULIDType, primary_key=True)
+    status = Column(String, primary_key=True)
+    total = Column(BigInteger, nullable=False, default=0)
+
+
+class Skill(Base):
+    """
+    Normalised skill names parsed from User.skills; see utils/skills.py.
+    """
+
+    __tablename__ = "skills"
+    __table_args__ = {"schema": "public"}
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+
+class UserSkill(Base):
+    __tablename__ = "user_skills"
+    __table_args__ = (
+        # Users having a given skill
+        Index("ix_user_skills_skill_user", "skill_id", "user_id"),
+        {"schema": "public"},
+    )
+
+    user_id = Column(ULIDType, primary_key=True)
+    skill_id = Column(Integer, primary_key=True)
+
+
 # Add back_populates to User model
 # User.jobs = relationship("Job", back_populates="recruiter")
 # User.applications = relationship("JobApplication", back_populates="candidate")
@@ -0,0 +1,325 @@
+"""
+Hiring funnel report.
+
+    python -m reports.funnel --output-dir report_output [--format auto|parquet|csv] [--full]
+
+Streams jobs, job_applications and users in chunks from REPORTS_DATABASE_URL
+(a replica, ideally) or the main database, and keeps a local copy of the
+rows it needs under <output-dir>/facts. Each run after the first fetches
+only rows newer than the watermark saved by the previous run, then
+recomputes the funnel aggregates from the local copy, so the database is
+only asked for new rows but the aggregation still covers all of them.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pandas as pd
+from sqlalchemy import create_engine, or_, select
+
+import models
+from config.database import DATABASE_URL
+from config.settings import REPORTS_DATABASE_URL
+
+CHUNK_SIZE = 50000
+WATERMARK_FILE = "watermark.json"
+# Rows committed slightly out of timestamp order are re-read and deduplicated
+WATERMARK_OVERLAP = timedelta(minutes=5)
+DECIDED_STATUSES = ("accepted", "rejected")
+
+FACTS = {
+    "applications": "application_id",
+    "jobs": "job_id",
+    "candidates": "candidate_id",
+}
+DATE_COLUMNS = {
+    "applications": ["applied_at", "status_updated_at"],
+    "jobs": ["created_at"],
+    "candidates": ["created_at"],
+}
+
+
+def _readChunks(engine, query):
+    # stream_results keeps a server-side cursor, so only one chunk is held
+    # in memory at a time while reading
+    with engine.connect().execution_options(stream_results=True) as conn:
+        yield from pd.read_sql(query, conn, chunksize=CHUNK_SIZE)
+
+
+def _extract(engine, query, partsDir: str, fileFormat: str) -> None:
+    """
+    Write the rows of query to partsDir as one file per chunk, each written
+    as soon as it arrives.
+    """
+    for number, chunk in enumerate(_readChunks(engine, query)):
+        _write(chunk, os.path.join(partsDir, f"part-{number:06d}"), fileFormat)
+
+
+def _since(column, watermark: Optional[datetime]):
+    return column > watermark - WATERMARK_OVERLAP
+
+
+def applicationsQuery(watermark: Optional[datetime]):
+    application = models.JobApplication
+    query = select(
+        application.ulid.label("application_id"),
+        application.job_id,
+        application.candidate_id,
+        application.status,
+        application.applied_at,
+        application.status_updated_at,
+    )
+    if watermark is not None:
+        # Late decisions on older applications are picked up as well
+        query = query.where(
+            or_(
+                _since(application.applied_at, watermark),
+                _since(application.status_updated_at, watermark),
+            )
+        )
+    return query
+
+
+def jobsQuery(watermark: Optional[datetime]):
+    query = select(
+        models.Job.ulid.label("job_id"),
+        models.Job.recruiter_id,
+        models.Job.title,
+        models.Job.created_at,
+    )
+    if watermark is not None:
+        query = query.where(_since(models.Job.created_at, watermark))
+    return query
+
+
+def candidatesQuery(watermark: Optional[datetime]):
+    query = select(
+        models.User.userUlId.label("candidate_id"), models.User.created_at
+    ).where(models.User.role_id == 2)
+    if watermark is not None:
+        query = query.where(_since(models.User.created_at, watermark))
+    return query
+
+
+def _resolveFormat(requested: str) -> str:
+    if requested != "auto":
+        return requested
+    for engineName in ("pyarrow", "fastparquet"):
+        if importlib.util.find_spec(engineName) is not None:
+            return "parquet"
+    return "csv"
+
+
+def _write(frame: pd.DataFrame, path: str, fileFormat: str) -> None:
+    if fileFormat == "parquet":
+        frame.to_parquet(f"{path}.parquet", index=False)
+    else:
+        frame.to_csv(f"{path}.csv", index=False)
+
+
+def _read(path: str, fileFormat: str, dateColumns: list) -> Optional[pd.DataFrame]:
+    filePath = f"{path}.{fileFormat}"
+    if not os.path.exists(filePath):
+        return None
+    if fileFormat == "parquet":
+        return pd.read_parquet(filePath)
+    return pd.read_csv(filePath, parse_dates=dateColumns)
+
+
+def _merge(frames: list, key: str, columns: list, dateColumns: list) -> pd.DataFrame:
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(
+            {column: pd.Series(dtype="datetime64[ns]") for column in dateColumns},
+            columns=columns,
+        )
+    merged = pd.concat(frames, ignore_index=True)
+    for column in dateColumns:
+        merged[column] = pd.to_datetime(merged[column])
+    # Fresh rows come last, so they replace the stored copy of the same key
+    return merged.drop_duplicates(subset=key, keep="last").reset_index(drop=True)
+
+
+def _latest(*series: pd.Series) -> Optional[datetime]:
+    values = [value.max() for value in series if value.notna().any()]
+    return max(values).to_pydatetime() if values else None
+
+
+def _funnel(frame: pd.DataFrame, keys: list) -> pd.DataFrame:
+    return (
+        frame.groupby(keys, dropna=False)
+        .agg(
+            applications=("application_id", "size"),
+            pending=("is_pending", "sum"),
+            accepted=("is_accepted", "sum"),
+            rejected=("is_rejected", "sum"),
+            median_hours_to_decision=("hours_to_decision", "median"),
+            mean_hours_to_decision=("hours_to_decision", "mean"),
+        )
+        .assign(
+            acceptance_rate=lambda totals: (
+                totals["accepted"] / (totals["accepted"] + totals["rejected"])
+            ).round(4)
+        )
+        .reset_index()
+    )
+
+
+def buildReports(
+    applications: pd.DataFrame, jobs: pd.DataFrame, candidates: pd.DataFrame
+) -> dict:
+    """
+    Aggregate the stored facts into per-job, per-recruiter and weekly funnel
+    tables with acceptance rate and time to decision.
+    """
+    frame = applications.merge(
+        jobs[["job_id", "recruiter_id", "title"]], on="job_id", how="left"
+    )
+    status = frame["status"].fillna("pending")
+    frame["is_pending"] = status == "pending"
+    frame["is_accepted"] = status == "accepted"
+    frame["is_rejected"] = status == "rejected"
+    frame["hours_to_decision"] = (
+        (frame["status_updated_at"] - frame["applied_at"]).dt.total_seconds() / 3600
+    ).where(status.isin(DECIDED_STATUSES))
+    frame["week"] = frame["applied_at"].dt.to_period("W").dt.start_time
+
+    weekly = _funnel(frame, ["week"])
+    for name, source in (("new_jobs", jobs), ("new_candidates", candidates)):
+        perWeek = (
+            source.assign(week=source["created_at"].dt.to_period("W").dt.start_time)
+            .groupby("week")
+            .size()
+            .rename(name)
+        )
+        weekly = weekly.merge(perWeek, on="week", how="outer")
+    countColumns = [
+        "applications",
+        "pending",
+        "accepted",
+        "rejected",
+        "new_jobs",
+        "new_candidates",
+    ]
+    weekly[countColumns] = weekly[countColumns].fillna(0).astype("int64")
+    weekly = weekly.sort_values("week")
+
+    return {
+        "job_funnel": _funnel(frame, ["job_id", "recruiter_id", "title"]),
+        "recruiter_funnel": _funnel(frame, ["recruiter_id"]),
+        "weekly_funnel": weekly,
+    }
+
+
+def run(outputDir: str, fileFormat: str = "auto", full: bool = False) -> dict:
+    fileFormat = _resolveFormat(fileFormat)
+    factsDir = os.path.join(outputDir, "facts")
+    os.makedirs(factsDir, exist_ok=True)
+
+    watermarkPath = os.path.join(outputDir, WATERMARK_FILE)
+    watermarks = {}
+    if not full and os.path.exists(watermarkPath):
+        with open(watermarkPath) as f:
+            stored = json.load(f)
+        if stored.get("format") == fileFormat:
+            watermarks = {
+                name: datetime.fromisoformat(value)
+                for name, value in stored.get("watermarks", {}).items()
+                if value
+            }
+
+    engine = create_engine(REPORTS_DATABASE_URL or DATABASE_URL)
+    queries = {
+        "applications": applicationsQuery,
+        "jobs": jobsQuery,
+        "candidates": candidatesQuery,
+    }
+    facts = {}
+    for name, buildQuery in queries.items():
+        path = os.path.join(factsDir, name)
+        # Without the stored facts a watermark would skip rows for good
+        if name in watermarks and not os.path.exists(f"{path}.{fileFormat}"):
+            watermarks.pop(name)
+
+        # Parts left by a failed run are fetched again from the old watermark
+        partsDir = f"{path}.incoming"
+        shutil.rmtree(partsDir, ignore_errors=True)
+        os.makedirs(partsDir)
+        query = buildQuery(watermarks.get(name))
+        _extract(engine, query, partsDir, fileFormat)
+
+        frames = []
+        if name in watermarks:
+            frames.append(_read(path, fileFormat, DATE_COLUMNS[name]))
+        for part in sorted(os.listdir(partsDir)):
+            frames.append(
+                _read(
+                    os.path.join(partsDir, os.path.splitext(part)[0]),
+                    fileFormat,
+                    DATE_COLUMNS[name],
+                )
+            )
+        facts[name] = _merge(
+            frames,
+            FACTS[name],
+            [column.name for column in query.selected_columns],
+            DATE_COLUMNS[name],
+        )
+        _write(facts[name], path, fileFormat)
+        shutil.rmtree(partsDir)
+    engine.dispose()
+
+    reports = buildReports(facts["applications"], facts["jobs"], facts["candidates"])
+    for name, frame in reports.items():
+        _write(frame, os.path.join(outputDir, name), fileFormat)
+
+    # Saved last, so a failed run is simply repeated from the old watermark
+    with open(watermarkPath, "w") as f:
+        json.dump(
+            {
+                "format": fileFormat,
+                "completed_at": datetime.utcnow().isoformat(),
+                "watermarks": {
+                    "applications": _isoformat(
+                        _latest(
+                            facts["applications"]["applied_at"],
+                            facts["applications"]["status_updated_at"],
+                        )
+                    ),
+                    "jobs": _isoformat(_latest(facts["jobs"]["created_at"])),
+                    "candidates": _isoformat(
+                        _latest(facts["candidates"]["created_at"])
+                    ),
+                },
+            },
+            f,
+            indent=2,
+        )
+
+    return {name: len(frame) for name, frame in reports.items()}
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the hiring funnel report")
+    parser.add_argument("--output-dir", default="report_output")
+    parser.add_argument("--format", choices=("auto", "parquet", "csv"), default="auto")
+    parser.add_argument(
+        "--full", action="store_true", help="ignore the watermark and reload all rows"
+    )
+    args = parser.parse_args()
+
+    rowCounts = run(args.output_dir, args.format, args.full)
+    for name, count in rowCounts.items():
+        print(f"{name}: {count} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,18 @@ class JobApplicationOut(JobApplicationBase):
         from_attributes = True
 
 
+class JobApplicationBulkStatus(BaseModel):
+    status: str
+    application_ids: Optional[List[str]] = None
+    job_id: Optional[str] = None  # all pending applications of this job
+
+    @validator("job_id", always=True)
+    def target_validator(cls, v, values):
+        if (v is None) == (values.get("application_ids") is None):
+            raise ValueError("Provide exactly one of application_ids or job_id")
+        return v
+
+
 class JobCreate(BaseModel):
     title: str
     description: str
@@ -120,6 +132,11 @@ class JobUpdate(BaseModel):
         return v
 
 
+class CandidateProfileUpdate(BaseModel):
+    skills: Optional[str] = None
+    bio: Optional[str] = None
+
+
 class ForgotPassword(BaseModel):
     email: str
 
@@ -0,0 +1,84 @@
+"""
+Import-time budget report.
+
+    python scripts/importtime.py [--module main] [--top 20] [--budget-ms 1500]
+
+Imports the module in a fresh interpreter under `python -X importtime` and
+lists the imports with the highest cumulative and self time. With
+--budget-ms it exits non-zero when the total import time is over budget,
+so it can guard cold-start time in CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# "import time:      1234 |       5678 |   package.module"
+_PREFIX = "import time:"
+
+
+def measure(module: str) -> list:
+    """
+    Return (module, self microseconds, cumulative microseconds, depth) for
+    every import made while importing module.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        selfTime, cumulative, name = line[len(_PREFIX) :].split("|")
+        if not selfTime.strip().isdigit():
+            # Column header line
+            continue
+        # One space after the column separator, then two per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(selfTime), int(cumulative), depth))
+    return imports
+
+
+def _table(title: str, rows: list, key: int, top: int) -> None:
+    print(f"\n{title}")
+    print(f"{'ms':>9}  {'self ms':>9}  module")
+    for name, selfTime, cumulative, _ in sorted(rows, key=lambda row: -row[key])[:top]:
+        print(f"{cumulative / 1000:9.1f}  {selfTime / 1000:9.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report import-time cost")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    imports = measure(args.module)
+    # The module's own top-level entry covers everything it imports, and
+    # leaves out what the interpreter loads at startup (site, encodings)
+    totalMs = next(
+        cumulative
+        for name, _, cumulative, depth in imports
+        if depth == 0 and name == args.module
+    ) / 1000
+
+    print(f"Importing {args.module}: {totalMs:.1f} ms")
+    _table("Highest cumulative time (module and everything it imports):", imports, 2, args.top)
+    _table("Highest self time (module body only):", imports, 1, args.top)
+
+    if args.budget_ms is not None and totalMs > args.budget_ms:
+        raise SystemExit(
+            f"\nImport time {totalMs:.1f} ms is over the {args.budget_ms:.0f} ms budget"
+        )
+
+
+if __name__ == "__main__":
+    main()
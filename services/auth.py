@@ -2,19 +2,34 @@ import datetime
 import math
 import random
 from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
-from config.database import get_db
-from config.redis import redisStore
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import get_async_db
+from config.redis import redisCache
 import schemas, models
 from ulid import ULID
-from utils.hash import hash_password, verify_password
-from utils.token import createRecruiterToken, createCandidateToken, blacklistToken
+from services.skills import replaceUserSkills
+from utils.skills import CANDIDATE_ROLE_ID, parseSkills, publishUserSkills
+from utils.hash import hashPasswordAsync, verifyPasswordAsync
+from utils.token import (
+    blacklistToken,
+    createCandidateToken,
+    createRecruiterToken,
+    invalidatePrincipal,
+    revokeAllTokens,
+    verifyCandidateToken,
+    verifyRecruiterToken,
+)
 from utils.utils import generateUniqueSixDigitToken
 
 
-def registerUserService(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def registerUserService(
+    user: schemas.UserCreate, db: AsyncSession = Depends(get_async_db)
+):
     try:
-        existing = db.query(models.User).filter(models.User.email == user.email).first()
+        existing = await db.scalar(
+            select(models.User).where(models.User.email == user.email)
+        )
         if existing:
             raise HTTPException(
                 status_code=400,
@@ -25,14 +40,23 @@ def registerUserService(user: schemas.UserCreate, db: Session = Depends(get_db))
             userUlId=str(ULID()),
             email=user.email,
             full_name=user.full_name,
-            password=hash_password(user.password),
+            password=await hashPasswordAsync(user.password),
             role_id=user.role_id,
             skills=user.skills,
             bio=user.bio,
         )
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+
+        skillNames = []
+        if user.role_id == CANDIDATE_ROLE_ID:
+            skillNames = parseSkills(user.skills)
+            if skillNames:
+                await replaceUserSkills(db, new_user.userUlId, skillNames)
+
+        await db.commit()
+        await db.refresh(new_user)
+        if skillNames:
+            await publishUserSkills(new_user.userUlId, skillNames)
 
         return new_user
     except HTTPException as e:
@@ -41,44 +65,55 @@ def registerUserService(user: schemas.UserCreate, db: Session = Depends(get_db))
         raise e
 
 
-def userLoginService(user: schemas.UserLogin, db: Session = Depends(get_db)):
+async def userLoginService(
+    user: schemas.UserLogin, db: AsyncSession = Depends(get_async_db)
+):
     try:
-        existing = db.query(models.User).filter(models.User.email == user.email).first()
+        existing = await db.scalar(
+            select(models.User).where(models.User.email == user.email)
+        )
         if not existing:
             raise HTTPException(status_code=400, detail="Invalid Credentials")
 
-        if not verify_password(user.password, str(existing.password)):
+        if not await verifyPasswordAsync(user.password, str(existing.password)):
             raise HTTPException(status_code=400, detail="Invalid Credentials")
 
+        claims = {
+            "role_id": existing.role_id,
+            "email": existing.email,
+            "full_name": existing.full_name,
+        }
+
         if existing.role_id == 3:
             print("Recruiter logging in...")
-            token = createRecruiterToken(str(existing.userUlId))
+            token = await createRecruiterToken(str(existing.userUlId), claims)
         elif existing.role_id == 2:
             print("Candidate logging in...")
-            token = createCandidateToken(str(existing.userUlId))
+            token = await createCandidateToken(str(existing.userUlId), claims)
 
         return token
     except Exception as e:
         raise e
 
 
-def forgotPasswordService(
-    reqBody: schemas.ForgotPassword, db: Session = Depends(get_db)
+async def forgotPasswordService(
+    reqBody: schemas.ForgotPassword, db: AsyncSession = Depends(get_async_db)
 ):
     try:
-        isUserExist = (
-            db.query(models.User).filter(models.User.email == reqBody.email).first()
+        isUserExist = await db.scalar(
+            select(models.User).where(models.User.email == reqBody.email)
         )
         if not isUserExist:
             raise HTTPException(status_code=404, detail="Invalid Email")
 
-        isTokenExist = redisStore.get(str(isUserExist.userUlId))
+        isTokenExist = await redisCache.get(str(isUserExist.userUlId))
 
         if isTokenExist:
-            tokenToBeSend = isTokenExist
+            tokenToBeSend = isTokenExist.decode("utf-8")
         else:
             tokenToBeSend = generateUniqueSixDigitToken()
-            redisStore.set(str(isUserExist.userUlId), tokenToBeSend, 600)  # 10 minutes
+            # Valid for 10 minutes
+            await redisCache.set(str(isUserExist.userUlId), tokenToBeSend, ex=600)
 
         return
     except HTTPException as e:
@@ -87,25 +122,29 @@ def forgotPasswordService(
         raise e
 
 
-def resetPassword(reqBody: schemas.ResetUserPassword, db: Session = Depends(get_db)):
+async def resetPassword(
+    reqBody: schemas.ResetUserPassword, db: AsyncSession = Depends(get_async_db)
+):
     try:
-        tokenFromStore = redisStore.get(str(reqBody.ulid))
+        tokenFromStore = await redisCache.get(str(reqBody.ulid))
         if not tokenFromStore:
             raise HTTPException(status_code=400, detail="Link Expired!!")
+        tokenFromStore = tokenFromStore.decode("utf-8")
 
-        isUserExist = (
-            db.query(models.User).filter(models.User.userUlId == tokenFromStore).first()
+        isUserExist = await db.scalar(
+            select(models.User).where(models.User.userUlId == tokenFromStore)
         )
 
         if not isUserExist:
             raise HTTPException(status_code=404, detail="User not found")
 
-        isUserExist.password = models.User.type.python_type(
-            hash_password(reqBody.newPassword)
-        )
+        isUserExist.password = await hashPasswordAsync(reqBody.newPassword)
 
         db.add(isUserExist)
-        db.commit()
+        await db.commit()
+        await invalidatePrincipal(str(isUserExist.userUlId))
+        # A password change logs the user out everywhere
+        await revokeAllTokens(str(isUserExist.userUlId))
 
         return True
     except HTTPException as e:
@@ -114,7 +153,7 @@ def resetPassword(reqBody: schemas.ResetUserPassword, db: Session = Depends(get_
         raise e
 
 
-def logoutService(token: str):
+async def logoutService(token: str):
     """
     Logout service that immediately expires the provided token by adding it to blacklist.
     """
@@ -124,7 +163,7 @@ def logoutService(token: str):
             token = token[7:]
 
         # Add token to blacklist
-        success = blacklistToken(token)
+        success = await blacklistToken(token)
 
         if not success:
             raise HTTPException(
@@ -141,3 +180,28 @@ def logoutService(token: str):
             status_code=500,
             detail=f"Logout failed: {str(e)}"
         )
+
+
+async def logoutAllService(token: str):
+    """
+    Logout service that revokes every token of the token's owner by bumping
+    their token generation.
+    """
+    try:
+        if token.startswith("Bearer "):
+            token = token[7:]
+
+        token_result = await verifyRecruiterToken(token)
+        if not token_result["valid"]:
+            token_result = await verifyCandidateToken(token)
+        if not token_result["valid"]:
+            raise HTTPException(status_code=401, detail=token_result["error"])
+
+        await revokeAllTokens(token_result["data"]["userUlId"])
+
+        return {"message": "Logged out from all sessions successfully"}
+
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Logout failed: {str(e)}")
@@ -1,15 +1,42 @@
+from typing import Optional
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from middlewares.candidate import get_current_candidate
+from utils.principal import Principal
+from utils.serialization import jobData, jobFragment
+from utils.ranking import invalidateCandidateScores
+from utils.recommendations import jobIndex
+from utils.skills import parseSkills, publishUserSkills
+from utils.ulidtype import canonicalUlid
 import models, schemas
 import math
 from datetime import datetime
 from ulid import ULID
 
-from config.database import get_db
+from config.database import get_async_db
+from services import counters
+from services.skills import replaceUserSkills
+from utils.pagination import (
+    buildPagination,
+    decodeRankCursor,
+    encodeRankCursor,
+    keysetQuery,
+    splitPage,
+)
 
+SEARCH_MAX_QUERY_LENGTH = 200
+RECOMMENDATION_RETRY_AFTER_SECONDS = 5
 
-def fetchJobListing(page: int = 1, limit: int = 10, db: Session = Depends(get_db)):
+
+async def fetchJobListing(
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    includeTotal: Optional[bool] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
     try:
         if page < 1:
             page = 1
@@ -17,53 +44,94 @@ def fetchJobListing(page: int = 1, limit: int = 10, db: Session = Depends(get_db
         if limit < 1 or limit > 100:
             limit = 10
 
-        offset = (page - 1) * limit
-
-        totalCount = db.query(models.Job).count()
+        query = keysetQuery(
+            select(models.Job), models.Job.created_at, models.Job.ulid, cursor
+        )
+        if cursor is None:
+            query = query.offset((page - 1) * limit)
 
-        jobs = (
-            db.query(models.Job)
-            .order_by(models.Job.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        jobs, nextCursor = splitPage(
+            (await db.scalars(query.limit(limit + 1))).all(),
+            limit,
+            lambda job: (job.created_at, job.ulid),
         )
 
-        jobsData = []
-        for job in jobs:
-            jobsData.append(
-                {
-                    "id": job.ulid,
-                    "title": job.title,
-                    "description": job.description,
-                    "requirements": job.requirements,
-                    "created_at": (
-                        job.created_at.isoformat()
-                        if hasattr(job, "created_at")
-                        else None
-                    ),
-                }
-            )
+        jobsData = [jobFragment(job) for job in jobs]
 
-        total_pages = math.ceil(totalCount / limit) if totalCount > 0 else 1
+        # Totals default on for page mode (backwards compatible) and off for
+        # cursor mode
+        if includeTotal is None:
+            includeTotal = cursor is None
+
+        totalCount, accuracy = None, None
+        if includeTotal:
+            totalCount, accuracy = await counters.estimateRowCount(
+                db, "public.jobs", counters.countOf(models.Job)
+            )
 
         return {
             "message": "Jobs list retrieved successfully",
             "data": jobsData,
-            "pagination": {
-                "current_page": page,
-                "per_page": limit,
-                "total_items": totalCount,
-                "total_pages": total_pages,
-            },
+            "pagination": buildPagination(
+                page, limit, cursor, nextCursor, totalCount, accuracy
+            ),
+        }
+    except Exception as e:
+        raise e
+
+
+async def searchJobs(
+    q: str,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        q = (q or "").strip()
+        if not q or len(q) > SEARCH_MAX_QUERY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Search query must be 1-{SEARCH_MAX_QUERY_LENGTH} characters",
+            )
+
+        if limit < 1 or limit > 100:
+            limit = 10
+
+        # The @@ match is answered from the GIN index; only matching rows are
+        # ranked, and pages continue after the last (rank, ulid) seen
+        tsQuery = func.websearch_to_tsquery("english", q)
+        rank = func.ts_rank_cd(models.Job.search_vector, tsQuery, type_=Float)
+        query = select(models.Job, rank.label("rank")).where(
+            models.Job.search_vector.op("@@")(tsQuery)
+        )
+        if cursor is not None:
+            lastRank, lastUlid = decodeRankCursor(cursor)
+            query = query.where(tuple_(rank, models.Job.ulid) < (lastRank, lastUlid))
+        query = query.order_by(rank.desc(), models.Job.ulid.desc())
+
+        rows, nextCursor = splitPage(
+            (await db.execute(query.limit(limit + 1))).all(),
+            limit,
+            lambda row: (row.rank, row.Job.ulid),
+            encodeRankCursor,
+        )
+
+        jobsData = [{**jobData(job), "rank": jobRank} for job, jobRank in rows]
+
+        return {
+            "message": "Job search results retrieved successfully",
+            "data": jobsData,
+            "pagination": {"per_page": limit, "next_cursor": nextCursor},
         }
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise e
 
 
-def fetchJobInfo(jobId: str, db: Session = Depends(get_db)):
+async def fetchJobInfo(jobId: str, db: AsyncSession = Depends(get_async_db)):
     try:
-        job = db.query(models.Job).filter(models.Job.ulid == jobId).first()
+        job = await db.scalar(select(models.Job).where(models.Job.ulid == jobId))
 
         if not job:
             raise HTTPException(
@@ -71,60 +139,69 @@ def fetchJobInfo(jobId: str, db: Session = Depends(get_db)):
                 detail="Job not found",
             )
 
-        responseData = {
-            "message": "Job info available",
-            "data": {
-                "id": job.ulid,
-                "title": job.title,
-                "description": job.description,
-                "requirements": job.requirements,
-                "created_at": (
-                    job.created_at.isoformat() if hasattr(job, "created_at") else None
-                ),
-            },
-        }
+        responseData = {"message": "Job info available", "data": jobFragment(job)}
 
         return responseData
     except Exception as e:
         raise e
 
 
-def sendJobApplication(
-    jobId: str, current_user: models.User, db: Session = Depends(get_db)
+async def sendJobApplication(
+    jobId: str, current_user: Principal, db: AsyncSession = Depends(get_async_db)
 ):
     try:
-        job = db.query(models.Job).filter(models.Job.ulid == jobId).first()
+        jobId = canonicalUlid(jobId)
+        # One statement: insert only if the job exists, let the unique
+        # (candidate_id, job_id) index reject duplicates, and report both
+        # outcomes back
+        job = select(models.Job.ulid).where(models.Job.ulid == jobId).cte("job")
+        application = models.JobApplication
+        inserted = (
+            insert(application)
+            .from_select(
+                ["ulid", "job_id", "candidate_id", "status", "applied_at"],
+                select(
+                    literal(str(ULID()), application.ulid.type),
+                    job.c.ulid,
+                    literal(current_user.userUlId, application.candidate_id.type),
+                    literal("pending", application.status.type),
+                    literal(datetime.utcnow(), application.applied_at.type),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["candidate_id", "job_id"])
+            .returning(application.ulid)
+            .cte("inserted")
+        )
+        result = (
+            await db.execute(
+                select(
+                    select(job.c.ulid).scalar_subquery().label("job_id"),
+                    select(inserted.c.ulid).scalar_subquery().label("application_id"),
+                )
+            )
+        ).one()
 
-        if not job:
+        if result.job_id is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Job not found",
             )
 
-        isCandidateAlreadyApplied = (
-            db.query(models.JobApplication)
-            .filter(
-                models.JobApplication.candidate_id == current_user.userUlId,
-                models.JobApplication.job_id == jobId,
-            )
-            .first()
-        )
-
-        if isCandidateAlreadyApplied:
+        if result.application_id is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"You've already applied for the same job previously!!",
             )
 
-        newApplication = models.JobApplication(
-            ulid=str(ULID()),
-            job_id=jobId,
-            candidate_id=current_user.userUlId,
-            applied_at=datetime.utcnow(),
+        await counters.bumpCounters(
+            db,
+            [
+                (counters.JOB_APPLICATIONS, jobId, 1),
+                (counters.CANDIDATE_APPLICATIONS, current_user.userUlId, 1),
+            ],
         )
-
-        db.add(newApplication)
-        db.commit()
+        await counters.bumpStatusCounters(db, [(jobId, "pending", 1)])
+        await db.commit()
 
         return
     except HTTPException as e:
@@ -133,11 +210,13 @@ def sendJobApplication(
         raise e
 
 
-def fetchCandidateAppliedJobs(
+async def fetchCandidateAppliedJobs(
     page: int = 1,
     limit: int = 10,
-    current_user: models.User = Depends(get_current_candidate),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    includeTotal: Optional[bool] = None,
+    current_user: Principal = Depends(get_current_candidate),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         if page < 1:
@@ -146,21 +225,21 @@ def fetchCandidateAppliedJobs(
         if limit < 1 or limit > 100:
             limit = 10
 
-        offset = (page - 1) * limit
-
-        totalCount = (
-            db.query(models.JobApplication)
-            .filter(models.JobApplication.candidate_id == current_user.userUlId)
-            .count()
+        query = keysetQuery(
+            select(models.JobApplication, models.Job)
+            .join(models.Job, models.JobApplication.job_id == models.Job.ulid)
+            .where(models.JobApplication.candidate_id == current_user.userUlId),
+            models.JobApplication.applied_at,
+            models.JobApplication.ulid,
+            cursor,
         )
+        if cursor is None:
+            query = query.offset((page - 1) * limit)
 
-        jobApplications = (
-            db.query(models.JobApplication, models.Job)
-            .join(models.Job, models.JobApplication.job_id == models.Job.ulid)
-            .filter(models.JobApplication.candidate_id == current_user.userUlId)
-            .offset(offset)
-            .limit(limit)
-            .all()
+        jobApplications, nextCursor = splitPage(
+            (await db.execute(query.limit(limit + 1))).all(),
+            limit,
+            lambda row: (row[0].applied_at, row[0].ulid),
         )
 
         applicationsData = []
@@ -169,31 +248,38 @@ def fetchCandidateAppliedJobs(
                 {
                     "application_id": application.ulid,
                     "applied_at": application.applied_at.isoformat(),
-                    "job": {
-                        "id": job.ulid,
-                        "title": job.title,
-                        "description": job.description,
-                        "requirements": job.requirements,
-                        "created_at": (
-                            job.created_at.isoformat()
-                            if hasattr(job, "created_at")
-                            else None
-                        ),
-                    },
+                    "job": jobFragment(job),
                 }
             )
 
-        totalPages = math.ceil(totalCount / limit) if totalCount > 0 else 1
+        if includeTotal is None:
+            includeTotal = cursor is None
+
+        pagination = {"per_page": limit, "next_cursor": nextCursor}
+        if cursor is None:
+            pagination["current_page"] = page
+
+        if includeTotal:
+            totalCount = await counters.readCounter(
+                db,
+                counters.CANDIDATE_APPLICATIONS,
+                current_user.userUlId,
+                counters.countOf(
+                    models.JobApplication,
+                    models.JobApplication.candidate_id == current_user.userUlId,
+                ),
+            )
+            pagination["totalCount"] = totalCount
+            pagination["total_accuracy"] = "exact"
+            if cursor is None:
+                pagination["totalPages"] = (
+                    math.ceil(totalCount / limit) if totalCount > 0 else 1
+                )
 
         response_data = {
             "message": "Applied jobs retrieved successfully",
             "data": applicationsData,
-            "pagination": {
-                "current_page": page,
-                "per_page": limit,
-                "totalCount": totalCount,
-                "totalPages": totalPages,
-            },
+            "pagination": pagination,
         }
 
         return response_data
@@ -201,3 +287,113 @@ def fetchCandidateAppliedJobs(
         raise e
     except Exception as e:
         raise e
+
+
+async def fetchRecommendedJobs(
+    limit: int = 10,
+    current_user: Principal = Depends(get_current_candidate),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        if limit < 1 or limit > 100:
+            limit = 10
+
+        if not jobIndex.ready:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Job recommendations are not available yet, please retry",
+                headers={"Retry-After": str(RECOMMENDATION_RETRY_AFTER_SECONDS)},
+            )
+
+        skills = await db.scalar(
+            select(models.User.skills).where(
+                models.User.userUlId == current_user.userUlId
+            )
+        )
+        if not skills or not skills.strip():
+            return {
+                "message": "Add skills to your profile to get job recommendations",
+                "data": [],
+            }
+
+        matches = jobIndex.topK(skills, limit)
+        jobs = {}
+        if matches:
+            jobs = {
+                job.ulid: job
+                for job in await db.scalars(
+                    select(models.Job).where(
+                        models.Job.ulid.in_([ulid for ulid, _ in matches])
+                    )
+                )
+            }
+
+        jobsData = []
+        for ulid, score in matches:
+            job = jobs.get(ulid)
+            # Deleted since the index last heard about it
+            if job is None:
+                continue
+            jobsData.append({**jobData(job), "score": round(score, 4)})
+
+        return {
+            "message": "Recommended jobs retrieved successfully",
+            "data": jobsData,
+        }
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise e
+
+
+async def updateCandidateProfile(
+    profile: schemas.CandidateProfileUpdate,
+    current_user: Principal = Depends(get_current_candidate),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        changes = {
+            field: value
+            for field, value in (("skills", profile.skills), ("bio", profile.bio))
+            if value is not None
+        }
+        if not changes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide skills and/or bio to update",
+            )
+
+        user = (
+            await db.execute(
+                update(models.User)
+                .where(models.User.userUlId == current_user.userUlId)
+                .values(**changes)
+                .returning(models.User.skills, models.User.bio)
+                .execution_options(synchronize_session=False)
+            )
+        ).first()
+
+        skillNames = None
+        if "skills" in changes:
+            skillNames = parseSkills(profile.skills)
+            await replaceUserSkills(db, current_user.userUlId, skillNames)
+
+        await db.commit()
+        if skillNames is not None:
+            await publishUserSkills(current_user.userUlId, skillNames)
+            await invalidateCandidateScores(db, current_user.userUlId)
+
+        return {
+            "message": "Profile updated successfully",
+            "data": {
+                "skills": user.skills,
+                "parsed_skills": (
+                    skillNames if skillNames is not None else parseSkills(user.skills)
+                ),
+                "bio": user.bio,
+            },
+        }
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise e
@@ -0,0 +1,174 @@
+from sqlalchemy import (
+    Integer,
+    String,
+    column,
+    func,
+    literal,
+    select,
+    text,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import models
+from config.database import AsyncSessionLocal
+
+RECRUITER_JOBS = "recruiter_jobs"
+JOB_APPLICATIONS = "job_applications"
+CANDIDATE_APPLICATIONS = "candidate_applications"
+
+# Below this many rows the planner estimate is not worth trusting and an exact
+# count is cheap anyway.
+ESTIMATE_THRESHOLD = 10000
+
+# Keys are taken in sorted order so two writers never wait on each other
+LOCK_COUNTERS_SQL = text(
+    "SELECT pg_advisory_xact_lock(hashtextextended(key, 0)) "
+    "FROM unnest(CAST(:keys AS text[])) AS key ORDER BY key"
+)
+
+
+async def _lockCounters(db: AsyncSession, keys: list) -> None:
+    """
+    Take the transaction-level advisory lock of each (scope, owner_id).
+    Writers hold it from their bump until they commit and seeding holds it
+    from its count until the seeded row is committed, so no delta can fall
+    between a count and the insert of its result.
+    """
+    await db.execute(
+        LOCK_COUNTERS_SQL,
+        {"keys": sorted({f"{scope}:{ownerId}" for scope, ownerId in keys})},
+    )
+
+
+async def bumpCounters(db: AsyncSession, deltas: list) -> None:
+    """
+    Apply (scope, owner_id, delta) adjustments in the caller's transaction
+    with a single UPDATE ... FROM (VALUES ...). Counters that have not been
+    seeded yet are left alone; readCounter seeds them on first read.
+    """
+    if not deltas:
+        return
+
+    await _lockCounters(db, [(scope, ownerId) for scope, ownerId, _ in deltas])
+    changes = values(
+        column("scope", String),
+        column("owner_id", String),
+        column("delta", Integer),
+        name="changes",
+    ).data(deltas)
+
+    await db.execute(
+        update(models.ListingCounter)
+        .where(
+            models.ListingCounter.scope == changes.c.scope,
+            models.ListingCounter.owner_id == changes.c.owner_id,
+        )
+        .values(total=models.ListingCounter.total + changes.c.delta)
+    )
+
+
+async def readCounter(db: AsyncSession, scope: str, ownerId: str, countQuery) -> int:
+    total = await db.scalar(
+        select(models.ListingCounter.total).where(
+            models.ListingCounter.scope == scope,
+            models.ListingCounter.owner_id == ownerId,
+        )
+    )
+    if total is not None:
+        return total
+
+    return await _seedCounter(scope, ownerId, countQuery)
+
+
+async def _seedCounter(scope: str, ownerId: str, countQuery) -> int:
+    """
+    Count and store a missing counter in a transaction of its own on the
+    primary, leaving the caller's session (possibly a replica) untouched.
+    Must not be called from a transaction that already bumped this counter,
+    as it would wait on that transaction's lock.
+    """
+    async with AsyncSessionLocal() as db:
+        await _lockCounters(db, [(scope, ownerId)])
+        # Another request may have seeded it while we waited for the lock
+        total = await db.scalar(
+            select(models.ListingCounter.total).where(
+                models.ListingCounter.scope == scope,
+                models.ListingCounter.owner_id == ownerId,
+            )
+        )
+        if total is None:
+            total = await db.scalar(
+                insert(models.ListingCounter)
+                .from_select(
+                    ["scope", "owner_id", "total"],
+                    select(
+                        literal(scope),
+                        literal(ownerId),
+                        countQuery.scalar_subquery(),
+                    ),
+                )
+                .returning(models.ListingCounter.total)
+            )
+            await db.commit()
+        return total
+
+
+async def estimateRowCount(db: AsyncSession, tableName: str, countQuery) -> tuple:
+    """
+    Return (total, accuracy) for an unfiltered table using the planner's
+    reltuples estimate, falling back to an exact count for small or never
+    analyzed tables.
+    """
+    estimate = await db.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": tableName},
+    )
+    if estimate is None or estimate < ESTIMATE_THRESHOLD:
+        return await db.scalar(countQuery), "exact"
+
+    return estimate, "estimated"
+
+
+def statusCounterUpsert(deltas):
+    """
+    INSERT ... ON CONFLICT statement adding the (job_id, status, total) rows
+    of deltas, a select, onto job_status_counters. Rows must arrive ordered
+    by (job_id, status) so concurrent writers lock them in the same order.
+    """
+    stmt = insert(models.JobStatusCounter).from_select(
+        ["job_id", "status", "total"], deltas
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["job_id", "status"],
+        set_={"total": models.JobStatusCounter.total + stmt.excluded.total},
+    )
+
+
+async def bumpStatusCounters(db: AsyncSession, deltas: list) -> None:
+    """
+    Apply (job_id, status, delta) adjustments in the caller's transaction,
+    creating counters that do not exist yet.
+    """
+    if not deltas:
+        return
+
+    changes = values(
+        column("job_id", models.JobStatusCounter.job_id.type),
+        column("status", String),
+        column("total", Integer),
+        name="changes",
+    ).data(sorted(deltas))
+    await db.execute(
+        statusCounterUpsert(
+            select(changes.c.job_id, changes.c.status, changes.c.total).order_by(
+                changes.c.job_id, changes.c.status
+            )
+        )
+    )
+
+
+def countOf(model, *criteria):
+    return select(func.count()).select_from(model).where(*criteria)
@@ -1,26 +1,68 @@
-import math
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Optional
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from config.database import get_db
+from pydantic import ValidationError
+from sqlalchemy import (
+    String,
+    any_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import get_async_db, readSession
+from config.settings import BULK_JOB_MAX_ITEMS, BULK_STATUS_MAX_ITEMS
 from middlewares.recruiter import get_current_recruiter
+from utils.principal import Principal
 import models
 import schemas
 from ulid import ULID
+from services import counters
+from utils.cache import invalidateJobCache
+from utils.pagination import buildPagination, keysetQuery, splitPage
+from utils.ranking import applicantScores, rankPage
+from utils.recommendations import publishJobChanges
+from utils.serialization import dumps, jobFragment
+from utils.skills import parseSkills, skillIndex
+from utils.ulidtype import canonicalUlid
 
+EXPORT_BATCH_SIZE = 1000
+SKILL_SEARCH_RETRY_AFTER_SECONDS = 5
+APPLICATION_STATUSES = ("pending", "accepted", "rejected")
+# The columns jobFragment() reads
+JOB_COLUMNS = ("ulid", "title", "description", "requirements", "created_at", "version")
+EXPORT_COLUMNS = [
+    "application_id",
+    "candidate_name",
+    "candidate_email",
+    "status",
+    "applied_at",
+    "candidate_bio",
+    "skills",
+]
 
-def recruiterJobCreationService(
+
+async def recruiterJobCreationService(
     job_data: schemas.JobCreate,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        existing = (
-            db.query(models.Job)
-            .filter(
+        existing = await db.scalar(
+            select(models.Job).where(
                 models.Job.title == job_data.title,
                 models.Job.recruiter_id == current_user.userUlId,
             )
-            .first()
         )
         if existing:
             raise HTTPException(
@@ -36,26 +78,167 @@ def recruiterJobCreationService(
             recruiter_id=current_user.userUlId,
         )
         db.add(newJob)
-        db.commit()
-        db.refresh(newJob)
+        await counters.bumpCounters(
+            db, [(counters.RECRUITER_JOBS, current_user.userUlId, 1)]
+        )
+        await db.commit()
+        await db.refresh(newJob)
+        await invalidateJobCache()
+        await publishJobChanges(
+            upserted=[(newJob.ulid, newJob.title, newJob.requirements)]
+        )
+        return {"message": "Job created successfully!!", "data": jobFragment(newJob)}
+    except Exception as e:
+        raise e
+
+
+def parseBulkJobs(body: bytes, contentType: str) -> list:
+    """
+    Split a bulk job request into raw items. Accepts a JSON array or, with an
+    NDJSON content type, one JSON object per line. Lines that are not valid
+    JSON are returned as None so they are reported per item.
+    """
+    if "ndjson" in contentType:
+        items = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                items.append(None)
+    else:
+        try:
+            items = json.loads(body)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Request body must be a JSON array of jobs",
+            )
+        if not isinstance(items, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Request body must be a JSON array of jobs",
+            )
+
+    if len(items) > BULK_JOB_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {BULK_JOB_MAX_ITEMS} jobs can be created per request",
+        )
+
+    return items
+
+
+async def recruiterBulkJobCreationService(
+    items: list,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        results = [None] * len(items)
+        accepted = []
+        seenTitles = set()
+
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results[index] = {
+                    "index": index,
+                    "status": "invalid",
+                    "error": "Item must be a JSON object",
+                }
+                continue
+
+            try:
+                job_data = schemas.JobCreate(**item)
+            except ValidationError as e:
+                results[index] = {
+                    "index": index,
+                    "status": "invalid",
+                    "error": "; ".join(error["msg"] for error in e.errors()),
+                }
+                continue
+
+            if job_data.title in seenTitles:
+                results[index] = {
+                    "index": index,
+                    "status": "duplicate",
+                    "error": "Job with the same title appears earlier in this request",
+                }
+                continue
+
+            seenTitles.add(job_data.title)
+            accepted.append((index, job_data))
+
+        # One query for every title that already exists for this recruiter
+        existingTitles = set()
+        if accepted:
+            existingTitles = set(
+                await db.scalars(
+                    select(models.Job.title).where(
+                        models.Job.recruiter_id == current_user.userUlId,
+                        models.Job.title
+                        == any_(literal(list(seenTitles), ARRAY(String))),
+                    )
+                )
+            )
+
+        createdAt = datetime.utcnow()
+        rows = []
+        for index, job_data in accepted:
+            if job_data.title in existingTitles:
+                results[index] = {
+                    "index": index,
+                    "status": "duplicate",
+                    "error": "Job with the same title already exists for this recruiter",
+                }
+                continue
+
+            jobId = str(ULID())
+            rows.append(
+                {
+                    "ulid": jobId,
+                    "title": job_data.title,
+                    "description": job_data.description,
+                    "requirements": job_data.requirements,
+                    "recruiter_id": current_user.userUlId,
+                    "created_at": createdAt,
+                }
+            )
+            results[index] = {"index": index, "status": "created", "id": jobId}
+
+        if rows:
+            # Batched multi-row insert, all in one transaction
+            await db.execute(insert(models.Job.__table__), rows)
+            await counters.bumpCounters(
+                db, [(counters.RECRUITER_JOBS, current_user.userUlId, len(rows))]
+            )
+            await db.commit()
+            await invalidateJobCache()
+            await publishJobChanges(
+                upserted=[
+                    (row["ulid"], row["title"], row["requirements"]) for row in rows
+                ]
+            )
+
         return {
-            "message": "Job created successfully!!",
-            "data": {
-                "id": newJob.ulid,
-                "title": newJob.title,
-                "description": newJob.description,
-                "requirements": newJob.requirements,
-            },
+            "message": "Bulk job creation processed",
+            "summary": {"created": len(rows), "failed": len(items) - len(rows)},
+            "data": results,
         }
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise e
 
 
-def getRecruiterJobsService(
+async def getRecruiterJobsService(
     page: int = 1,
     limit: int = 10,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    includeTotal: Optional[bool] = None,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         if page < 1:
@@ -64,68 +247,143 @@ def getRecruiterJobsService(
         if limit < 1 or limit > 100:
             limit = 10
 
-        offset = (page - 1) * limit
+        query = keysetQuery(
+            select(models.Job).where(models.Job.recruiter_id == current_user.userUlId),
+            models.Job.created_at,
+            models.Job.ulid,
+            cursor,
+        )
+        if cursor is None:
+            query = query.offset((page - 1) * limit)
+
+        jobs, nextCursor = splitPage(
+            (await db.scalars(query.limit(limit + 1))).all(),
+            limit,
+            lambda job: (job.created_at, job.ulid),
+        )
+
+        jobsData = [jobFragment(job) for job in jobs]
+
+        if includeTotal is None:
+            includeTotal = cursor is None
+
+        totalCount = None
+        if includeTotal:
+            totalCount = await counters.readCounter(
+                db,
+                counters.RECRUITER_JOBS,
+                current_user.userUlId,
+                counters.countOf(
+                    models.Job, models.Job.recruiter_id == current_user.userUlId
+                ),
+            )
+
+        return {
+            "message": "Jobs retrieved successfully",
+            "data": jobsData,
+            "pagination": buildPagination(
+                page, limit, cursor, nextCursor, totalCount, "exact"
+            ),
+        }
+    except Exception as e:
+        raise e
+
+
+async def recruiterDashboardService(
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        if limit < 1 or limit > 100:
+            limit = 20
 
-        totalCount = (
-            db.query(models.Job)
-            .filter(models.Job.recruiter_id == current_user.userUlId)
-            .count()
+        # Everything below reads job_status_counters, so the cost follows the
+        # number of jobs and never the number of applications
+        counter = models.JobStatusCounter
+        ownJobIds = select(models.Job.ulid).where(
+            models.Job.recruiter_id == current_user.userUlId
         )
+        overall = {statusName: 0 for statusName in APPLICATION_STATUSES}
+        for statusName, total in await db.execute(
+            select(counter.status, func.sum(counter.total))
+            .where(counter.job_id.in_(ownJobIds))
+            .group_by(counter.status)
+        ):
+            overall[statusName] = int(total)
 
-        jobs = (
-            db.query(models.Job)
-            .filter(models.Job.recruiter_id == current_user.userUlId)
-            .order_by(models.Job.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        jobs, nextCursor = splitPage(
+            (
+                await db.execute(
+                    keysetQuery(
+                        select(
+                            models.Job.ulid, models.Job.title, models.Job.created_at
+                        ).where(models.Job.recruiter_id == current_user.userUlId),
+                        models.Job.created_at,
+                        models.Job.ulid,
+                        cursor,
+                    ).limit(limit + 1)
+                )
+            ).all(),
+            limit,
+            lambda job: (job.created_at, job.ulid),
         )
 
+        perJob = {
+            job.ulid: {statusName: 0 for statusName in APPLICATION_STATUSES}
+            for job in jobs
+        }
+        if perJob:
+            for jobId, statusName, total in await db.execute(
+                select(counter.job_id, counter.status, counter.total).where(
+                    counter.job_id.in_(list(perJob))
+                )
+            ):
+                perJob[jobId][statusName] = total
+
         jobsData = []
         for job in jobs:
+            applications = perJob[job.ulid]
             jobsData.append(
                 {
                     "id": job.ulid,
                     "title": job.title,
-                    "description": job.description,
-                    "requirements": job.requirements,
                     "created_at": (
-                        job.created_at.isoformat()
-                        if hasattr(job, "created_at")
-                        else None
+                        job.created_at.isoformat() if job.created_at else None
                     ),
+                    "applications": applications,
+                    "total_applications": sum(applications.values()),
                 }
             )
 
-        total_pages = math.ceil(totalCount / limit) if totalCount > 0 else 1
-
         return {
-            "message": "Jobs retrieved successfully",
-            "data": jobsData,
-            "pagination": {
-                "current_page": page,
-                "per_page": limit,
-                "total_items": totalCount,
-                "total_pages": total_pages,
+            "message": "Dashboard retrieved successfully",
+            "data": {
+                "applications": overall,
+                "total_applications": sum(overall.values()),
+                "jobs": jobsData,
             },
+            "pagination": {"per_page": limit, "next_cursor": nextCursor},
         }
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise e
 
 
-def fetchRecruiterJobInfoService(
+async def fetchRecruiterJobInfoService(
     jobId: str,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        job = (
-            db.query(models.Job)
-            .filter(
+        jobId = canonicalUlid(jobId)
+        job = await db.scalar(
+            select(models.Job).where(
                 models.Job.ulid == jobId,
                 models.Job.recruiter_id == current_user.userUlId,
             )
-            .first()
         )
 
         if not job:
@@ -134,116 +392,247 @@ def fetchRecruiterJobInfoService(
                 detail="Job not found or you do not have permission to access this job",
             )
 
-        return {
-            "message": "Job info available",
-            "data": {
-                "id": job.ulid,
-                "title": job.title,
-                "description": job.description,
-                "requirements": job.requirements,
-                "created_at": (
-                    job.created_at.isoformat() if hasattr(job, "created_at") else None
-                ),
-            },
-        }
+        return {"message": "Job info available", "data": jobFragment(job)}
     except Exception as e:
         raise e
 
 
-def deleteRecruiterJobService(
+async def deleteRecruiterJobService(
     jobId: str,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        job = (
-            db.query(models.Job)
-            .filter(
+        jobId = canonicalUlid(jobId)
+        # Ownership check and delete in one statement
+        deletedJobId = await db.scalar(
+            delete(models.Job)
+            .where(
                 models.Job.ulid == jobId,
                 models.Job.recruiter_id == current_user.userUlId,
             )
-            .first()
+            .returning(models.Job.ulid)
+            .execution_options(synchronize_session=False)
         )
 
-        if not job:
+        if deletedJobId is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job not found or you do not have permission to delete this job",
             )
 
-        db.delete(job)
-        db.commit()
+        await counters.bumpCounters(
+            db, [(counters.RECRUITER_JOBS, current_user.userUlId, -1)]
+        )
+        await db.execute(
+            delete(models.JobStatusCounter).where(
+                models.JobStatusCounter.job_id == jobId
+            )
+        )
+        await db.commit()
+        await invalidateJobCache(jobId)
+        await publishJobChanges(removed=[jobId])
     except Exception as e:
         raise e
 
 
-def updateRecruiterJobService(
+async def updateRecruiterJobService(
     jobId: str,
     job_data: schemas.JobUpdate,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        job = (
-            db.query(models.Job)
-            .filter(
-                models.Job.ulid == jobId,
-                models.Job.recruiter_id == current_user.userUlId,
+        jobId = canonicalUlid(jobId)
+        job = models.Job
+        owned = (job.ulid == jobId, job.recruiter_id == current_user.userUlId)
+        changes = {
+            field: value
+            for field, value in (
+                ("title", job_data.title),
+                ("description", job_data.description),
+                ("requirements", job_data.requirements),
             )
-            .first()
+            if value is not None
+        }
+
+        if not changes:
+            # Nothing to change: an ownership-checked read, and no write
+            existing = (
+                await db.execute(
+                    select(*(getattr(job, column) for column in JOB_COLUMNS)).where(
+                        *owned
+                    )
+                )
+            ).first()
+            if existing is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Job not found or you do not have permission to update this job",
+                )
+            return {
+                "message": "Job updated successfully",
+                "data": jobFragment(existing),
+            }
+
+        # One statement: lock the owned row, update it only if a supplied
+        # field differs, and return the job as it now is with what changed
+        existing = (
+            select(job.id, *(getattr(job, column) for column in JOB_COLUMNS))
+            .where(*owned)
+            .with_for_update()
+            .cte("existing")
         )
+        updated = (
+            update(job)
+            .where(
+                job.id == existing.c.id,
+                or_(
+                    *(
+                        getattr(job, field).is_distinct_from(value)
+                        for field, value in changes.items()
+                    )
+                ),
+            )
+            # A new version makes every worker re-encode the job
+            .values(**changes, version=job.version + 1)
+            .returning(job.id, *(getattr(job, column) for column in JOB_COLUMNS))
+            .cte("updated")
+        )
+        changed = updated.c.id.is_not(None)
+        jobInfo = (
+            await db.execute(
+                select(
+                    *(
+                        case(
+                            (changed, updated.c[column]), else_=existing.c[column]
+                        ).label(column)
+                        for column in JOB_COLUMNS
+                    ),
+                    changed.label("changed"),
+                    or_(
+                        *(
+                            existing.c[column].is_distinct_from(updated.c[column])
+                            for column in ("title", "requirements")
+                        )
+                    ).label("reindex"),
+                ).select_from(
+                    existing.outerjoin(updated, updated.c.id == existing.c.id)
+                )
+            )
+        ).first()
 
-        if not job:
+        if jobInfo is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Job not found or you do not have permission to update this job",
             )
 
-        # Update job fields
-        if job_data.title is not None:
-            job.title = models.Job.title.type.python_type(job_data.title)
-        if job_data.description is not None:
-            job.description = models.Job.description.type.python_type(
-                job_data.description
-            )
-        if job_data.requirements is not None:
-            job.requirements = models.Job.requirements.type.python_type(
-                job_data.requirements
-            )
+        await db.commit()
+        if jobInfo.changed:
+            await invalidateJobCache(jobId)
+            if jobInfo.reindex:
+                await publishJobChanges(
+                    upserted=[(jobInfo.ulid, jobInfo.title, jobInfo.requirements)]
+                )
 
-        db.commit()
-        db.refresh(job)
-
-        return {
-            "message": "Job updated successfully",
-            "data": {
-                "id": job.ulid,
-                "title": job.title,
-                "description": job.description,
-                "requirements": job.requirements,
-            },
-        }
+        return {"message": "Job updated successfully", "data": jobFragment(jobInfo)}
     except HTTPException as e:
         raise e
     except Exception as e:
         raise e
 
 
-def fetchJobApplicationService(
+def _applicationData(
+    jobApplication: models.JobApplication, candidate: models.User
+) -> dict:
+    applicationData = {
+        "application_id": jobApplication.ulid,
+        "candidate_name": candidate.full_name,
+        "candidate_email": candidate.email,
+        "status": jobApplication.status,
+        "applied_at": (
+            jobApplication.applied_at.isoformat()
+            if jobApplication.applied_at
+            else None
+        ),
+    }
+
+    if hasattr(candidate, "bio"):
+        applicationData["candidate_bio"] = candidate.bio
+
+    if hasattr(candidate, "skills"):
+        applicationData["skills"] = candidate.skills
+
+    return applicationData
+
+
+async def _fetchJobApplicationsByMatch(
+    job: models.Job, page: int, limit: int, db: AsyncSession
+):
+    ulids, scores = await applicantScores(db, job.ulid, job.requirements)
+    ranked = rankPage(ulids, scores, page, limit)
+
+    rows = {}
+    if ranked:
+        rows = {
+            jobApplication.ulid: (jobApplication, candidate)
+            for jobApplication, candidate in await db.execute(
+                select(models.JobApplication, models.User)
+                .join(
+                    models.User,
+                    models.JobApplication.candidate_id == models.User.userUlId,
+                )
+                .where(models.JobApplication.ulid.in_([ulid for ulid, _ in ranked]))
+            )
+        }
+
+    jobAppData = []
+    for ulid, score in ranked:
+        if ulid not in rows:
+            continue
+        applicationData = _applicationData(*rows[ulid])
+        applicationData["match_score"] = round(score, 4)
+        jobAppData.append(applicationData)
+
+    return {
+        "message": "Job Application retrieved successfully",
+        "data": jobAppData,
+        "pagination": buildPagination(
+            page, limit, None, None, int(ulids.size), "exact"
+        ),
+    }
+
+
+async def fetchJobApplicationService(
     jobId: str,
     page: int = 1,
     limit: int = 10,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    includeTotal: Optional[bool] = None,
+    sort: Optional[str] = None,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        isJobRelatedToRecruiter = (
-            db.query(models.Job)
-            .filter(
+        jobId = canonicalUlid(jobId)
+        if sort not in (None, "applied_at", "match"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="sort must be one of: applied_at, match",
+            )
+
+        if sort == "match" and cursor is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="sort=match supports page based pagination only",
+            )
+
+        isJobRelatedToRecruiter = await db.scalar(
+            select(models.Job).where(
                 models.Job.ulid == jobId,
                 models.Job.recruiter_id == current_user.userUlId,
             )
-            .first()
         )
 
         if not isJobRelatedToRecruiter:
@@ -258,58 +647,55 @@ def fetchJobApplicationService(
         if limit < 1 or limit > 100:
             limit = 10
 
-        offset = (page - 1) * limit
-
-        totalCount = (
-            db.query(models.JobApplication)
-            .filter(models.JobApplication.job_id == jobId)
-            .count()
-        )
+        if sort == "match":
+            return await _fetchJobApplicationsByMatch(
+                isJobRelatedToRecruiter, page, limit, db
+            )
 
-        jobApplications = (
-            db.query(models.JobApplication, models.User)
+        query = keysetQuery(
+            select(models.JobApplication, models.User)
             .join(
                 models.User, models.JobApplication.candidate_id == models.User.userUlId
             )
-            .filter(models.JobApplication.job_id == jobId)
-            .offset(offset)
-            .limit(limit)
-            .all()
+            .where(models.JobApplication.job_id == jobId),
+            models.JobApplication.applied_at,
+            models.JobApplication.ulid,
+            cursor,
         )
+        if cursor is None:
+            query = query.offset((page - 1) * limit)
 
-        jobAppData = []
-        for jobApplication, candidate in jobApplications:
-            applicationData = {
-                "application_id": jobApplication.ulid,
-                "candidate_name": candidate.full_name,
-                "candidate_email": candidate.email,
-                "status": jobApplication.status,
-                "applied_at": (
-                    jobApplication.applied_at.isoformat()
-                    if jobApplication.applied_at
-                    else None
-                ),
-            }
-
-            if hasattr(candidate, "bio"):
-                applicationData["candidate_bio"] = candidate.bio
+        jobApplications, nextCursor = splitPage(
+            (await db.execute(query.limit(limit + 1))).all(),
+            limit,
+            lambda row: (row[0].applied_at, row[0].ulid),
+        )
 
-            if hasattr(candidate, "skills"):
-                applicationData["skills"] = candidate.skills
+        jobAppData = [
+            _applicationData(jobApplication, candidate)
+            for jobApplication, candidate in jobApplications
+        ]
 
-            jobAppData.append(applicationData)
+        if includeTotal is None:
+            includeTotal = cursor is None
 
-        totalPages = math.ceil(totalCount / limit) if totalCount > 0 else 1
+        totalCount = None
+        if includeTotal:
+            totalCount = await counters.readCounter(
+                db,
+                counters.JOB_APPLICATIONS,
+                jobId,
+                counters.countOf(
+                    models.JobApplication, models.JobApplication.job_id == jobId
+                ),
+            )
 
         return {
             "message": "Job Application retrieved successfully",
             "data": jobAppData,
-            "pagination": {
-                "current_page": page,
-                "per_page": limit,
-                "total_items": totalCount,
-                "total_pages": totalPages,
-            },
+            "pagination": buildPagination(
+                page, limit, cursor, nextCursor, totalCount, "exact"
+            ),
         }
     except HTTPException as e:
         raise e
@@ -317,11 +703,11 @@ def fetchJobApplicationService(
         raise e
 
 
-def updateJobApplicationStatusService(
+async def updateJobApplicationStatusService(
     applicationId: str,
     latestStatus: str,
-    current_user: models.User = Depends(get_current_recruiter),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         allowedStatuses = {"accepted", "rejected"}
@@ -331,11 +717,39 @@ def updateJobApplicationStatusService(
                 detail="Invalid status!!",
             )
 
-        applicationInfo = (
-            db.query(models.JobApplication)
-            .filter(models.JobApplication.ulid == applicationId)
-            .first()
+        # One statement: snapshot the application and its job's owner, and
+        # update it only if it is pending and owned by the current recruiter.
+        # The error to report is derived from the snapshot: ownership from
+        # its join, so a concurrent status change is never reported as 403.
+        application = models.JobApplication
+        snapshot = (
+            select(application.status, models.Job.recruiter_id)
+            .outerjoin(models.Job, models.Job.ulid == application.job_id)
+            .where(application.ulid == applicationId)
+            .cte("snapshot")
+        )
+        updated = (
+            update(application)
+            .where(
+                application.ulid == applicationId,
+                application.status == "pending",
+                models.Job.ulid == application.job_id,
+                models.Job.recruiter_id == current_user.userUlId,
+            )
+            .values(status=latestStatus, status_updated_at=datetime.utcnow())
+            .returning(application.ulid, application.job_id)
+            .cte("updated")
         )
+        applicationInfo = (
+            await db.execute(
+                select(
+                    snapshot.c.status,
+                    snapshot.c.recruiter_id,
+                    select(updated.c.ulid).scalar_subquery().label("updated_id"),
+                    select(updated.c.job_id).scalar_subquery().label("job_id"),
+                )
+            )
+        ).first()
 
         if applicationInfo is None:
             raise HTTPException(
@@ -343,34 +757,296 @@ def updateJobApplicationStatusService(
                 detail="Job application not found",
             )
 
-        if applicationInfo.status != models.JobApplication.status.type.python_type(
-            "pending"
-        ):
+        if applicationInfo.recruiter_id != current_user.userUlId:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Job is not related with the current recruiter",
+            )
+
+        if applicationInfo.updated_id is None:
+            if applicationInfo.status != "pending":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Cannot update status. Current status of requested application is {applicationInfo.status} already.",
+                )
+
+            # Still pending in the snapshot, but a concurrent request decided
+            # it before this update could
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Cannot update status. The application was updated by another request.",
+            )
+
+        await counters.bumpStatusCounters(
+            db,
+            [
+                (applicationInfo.job_id, "pending", -1),
+                (applicationInfo.job_id, latestStatus, 1),
+            ],
+        )
+        await db.commit()
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise e
+
+
+async def bulkUpdateJobApplicationStatusService(
+    reqBody: schemas.JobApplicationBulkStatus,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        allowedStatuses = {"accepted", "rejected"}
+        if reqBody.status not in allowedStatuses:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot update status. Current status of requested application is {applicationInfo.status} already.",
+                detail="Invalid status!!",
             )
 
-        isJobRelatedToRecruiter = (
-            db.query(models.Job)
-            .filter(
-                models.Job.ulid == applicationInfo.job_id,
+        application = models.JobApplication
+        if reqBody.application_ids is not None:
+            applicationIds = list(dict.fromkeys(reqBody.application_ids))
+            if len(applicationIds) > BULK_STATUS_MAX_ITEMS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"At most {BULK_STATUS_MAX_ITEMS} applications can be updated per request",
+                )
+            targetFilter = application.ulid == any_(
+                literal(applicationIds, ARRAY(application.ulid.type))
+            )
+        else:
+            applicationIds = None
+            targetFilter = application.job_id == reqBody.job_id
+
+        # One statement: snapshot every targeted application with its job's
+        # owner, move the pending ones owned by the current recruiter, and
+        # count the outcomes from the snapshot
+        target = (
+            select(application.ulid, models.Job.recruiter_id)
+            .outerjoin(models.Job, models.Job.ulid == application.job_id)
+            .where(targetFilter)
+            .cte("target")
+        )
+        updated = (
+            update(application)
+            .where(
+                targetFilter,
+                application.status == "pending",
+                models.Job.ulid == application.job_id,
                 models.Job.recruiter_id == current_user.userUlId,
             )
-            .first()
+            .values(status=reqBody.status, status_updated_at=datetime.utcnow())
+            .returning(application.ulid, application.job_id)
+            .cte("updated")
         )
+        # Status counters move in the same statement: -n pending, +n new
+        # status for every job touched
+        changedPerJob = (
+            select(updated.c.job_id, func.count().label("changed"))
+            .group_by(updated.c.job_id)
+            .cte("changed_per_job")
+        )
+        statusDeltas = union_all(
+            select(
+                changedPerJob.c.job_id,
+                literal("pending").label("status"),
+                (-changedPerJob.c.changed).label("total"),
+            ),
+            select(
+                changedPerJob.c.job_id,
+                literal(reqBody.status).label("status"),
+                changedPerJob.c.changed,
+            ),
+        ).subquery("status_deltas")
+        countersUpdated = counters.statusCounterUpsert(
+            select(statusDeltas).order_by(
+                statusDeltas.c.job_id, statusDeltas.c.status
+            )
+        ).cte("counters_updated")
+        outcome = (
+            await db.execute(
+                select(
+                    func.count().label("matched"),
+                    func.count()
+                    .filter(target.c.recruiter_id == current_user.userUlId)
+                    .label("owned"),
+                    select(func.count())
+                    .select_from(updated)
+                    .scalar_subquery()
+                    .label("changed"),
+                )
+                .select_from(target)
+                .add_cte(countersUpdated)
+            )
+        ).one()
 
-        if isJobRelatedToRecruiter is None:
+        await db.commit()
+
+        summary = {
+            "changed": outcome.changed,
+            "skipped": outcome.owned - outcome.changed,
+            "forbidden": outcome.matched - outcome.owned,
+        }
+        if applicationIds is not None:
+            summary["not_found"] = len(applicationIds) - outcome.matched
+
+        return {"message": "Job application statuses updated", "data": summary}
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise e
+
+
+async def _streamJobApplications(
+    jobId: str, exportFormat: str, userUlId: str
+) -> AsyncIterator[bytes]:
+    if exportFormat == "csv":
+        # Header goes out before the query runs so the client sees bytes at once
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue().encode("utf-8")
+
+    # The request's session is closed before the response body is streamed,
+    # so the export opens its own for the server-side cursor
+    async with readSession(userUlId) as db:
+        result = await db.stream(
+            select(
+                models.JobApplication.ulid,
+                models.User.full_name,
+                models.User.email,
+                models.JobApplication.status,
+                models.JobApplication.applied_at,
+                models.User.bio,
+                models.User.skills,
+            )
+            .join(
+                models.User, models.JobApplication.candidate_id == models.User.userUlId
+            )
+            .where(models.JobApplication.job_id == jobId)
+            .order_by(models.JobApplication.applied_at, models.JobApplication.ulid)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        async for rows in result.partitions():
+            if exportFormat == "ndjson":
+                yield b"".join(
+                    dumps(dict(zip(EXPORT_COLUMNS, row))) + b"\n" for row in rows
+                )
+                continue
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in rows:
+                values = list(row)
+                values[4] = values[4].isoformat() if values[4] else None
+                writer.writerow(values)
+            yield buffer.getvalue().encode("utf-8")
+
+
+async def exportJobApplicationsService(
+    jobId: str,
+    exportFormat: str = "csv",
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncIterator[bytes]:
+    try:
+        jobId = canonicalUlid(jobId)
+        if exportFormat not in {"csv", "ndjson"}:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Job is not related with the current recruiter",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid format!! Use csv or ndjson",
             )
 
-        applicationInfo.status = models.JobApplication.status.type.python_type(
-            latestStatus
+        isJobRelatedToRecruiter = await db.scalar(
+            select(models.Job.id).where(
+                models.Job.ulid == jobId,
+                models.Job.recruiter_id == current_user.userUlId,
+            )
         )
 
-        db.commit()
+        if isJobRelatedToRecruiter is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provided job not linked with current recruiter",
+            )
+
+        return _streamJobApplications(jobId, exportFormat, current_user.userUlId)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise e
+
+
+async def searchCandidatesService(
+    skills: str,
+    mode: str = "all",
+    page: int = 1,
+    limit: int = 10,
+    current_user: Principal = Depends(get_current_recruiter),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        names = parseSkills(skills)
+        if not names:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide at least one skill, comma separated",
+            )
+
+        if mode not in ("all", "any"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="mode must be one of: all, any",
+            )
+
+        if not skillIndex.ready:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Candidate search is not available yet, please retry",
+                headers={"Retry-After": str(SKILL_SEARCH_RETRY_AFTER_SECONDS)},
+            )
+
+        if page < 1:
+            page = 1
+
+        if limit < 1 or limit > 100:
+            limit = 10
+
+        slots = skillIndex.match(names, mode)
+        pageUsers = skillIndex.usersOf(slots[(page - 1) * limit : page * limit])
+
+        candidates = {}
+        if pageUsers:
+            candidates = {
+                user.userUlId: user
+                for user in await db.scalars(
+                    select(models.User).where(models.User.userUlId.in_(pageUsers))
+                )
+            }
+
+        candidatesData = []
+        for userUlId in pageUsers:
+            user = candidates.get(userUlId)
+            if user is None:
+                continue
+            candidatesData.append(
+                {
+                    "id": user.userUlId,
+                    "full_name": user.full_name,
+                    "email": user.email,
+                    "skills": parseSkills(user.skills),
+                    "bio": user.bio,
+                }
+            )
+
+        return {
+            "message": "Candidates retrieved successfully",
+            "data": candidatesData,
+            "pagination": buildPagination(
+                page, limit, None, None, int(slots.size), "exact"
+            ),
+        }
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -0,0 +1,40 @@
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import models
+
+
+async def replaceUserSkills(db: AsyncSession, userUlId: str, names: list) -> None:
+    """
+    Make the user's rows in user_skills match names, in the caller's
+    transaction. Unknown names are added to the skills dictionary first.
+    """
+    skillIds = []
+    if names:
+        # DO NOTHING rather than an upsert so popular skill rows are not
+        # rewritten on every profile save; the SELECT sees names inserted
+        # concurrently by other transactions too
+        await db.execute(
+            insert(models.Skill)
+            .values([{"name": name} for name in names])
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+        skillIds = list(
+            await db.scalars(
+                select(models.Skill.id).where(models.Skill.name.in_(names))
+            )
+        )
+
+    await db.execute(
+        delete(models.UserSkill).where(
+            models.UserSkill.user_id == userUlId,
+            models.UserSkill.skill_id.not_in(skillIds),
+        )
+    )
+    if skillIds:
+        await db.execute(
+            insert(models.UserSkill)
+            .values([{"user_id": userUlId, "skill_id": skillId} for skillId in skillIds])
+            .on_conflict_do_nothing()
+        )
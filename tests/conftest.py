@@ -0,0 +1,56 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy.engine import make_url
+
+# The settings and engines are built at import time, so the environment has
+# to be in place before any app module is imported. Database tests run
+# against TEST_DATABASE_URL only, never against the DATABASE_* settings of a
+# development database.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+if TEST_DATABASE_URL:
+    url = make_url(TEST_DATABASE_URL)
+    os.environ["DATABASE_USERNAME"] = url.username or ""
+    os.environ["DATABASE_PASSWORD"] = url.password or ""
+    os.environ["DATABASE_NAME"] = url.database or ""
+    os.environ["DATABASE_HOST"] = f"{url.host}:{url.port}" if url.port else url.host
+else:
+    os.environ.setdefault("DATABASE_USERNAME", "test")
+    os.environ.setdefault("DATABASE_PASSWORD", "test")
+    os.environ.setdefault("DATABASE_NAME", "test")
+    os.environ.setdefault("DATABASE_HOST", "localhost")
+
+os.environ.setdefault("TOKEN_EXPIRY", "10")
+os.environ.setdefault("RECRUITER_TOKEN", "r" * 32)
+os.environ.setdefault("CANDIDATE_TOKEN", "c" * 32)
+# Every read and write goes to the primary under test
+os.environ["DATABASE_REPLICA_URLS"] = ""
+
+
+@pytest.fixture
+def run():
+    """
+    Run a coroutine on a fresh event loop. The async engine's pooled
+    connections belong to the loop that opened them, so the pool is disposed
+    before the loop closes.
+    """
+    from config.database import async_engine
+
+    def runner(coroutine):
+        async def main():
+            try:
+                return await coroutine
+            finally:
+                await async_engine.dispose()
+
+        return asyncio.run(main())
+
+    return runner
+
+
+@pytest.fixture
+def requiresDatabase():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
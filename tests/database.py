@@ -0,0 +1,84 @@
+"""
+Helpers for tests that run against a real Postgres with the migrations
+applied. Everything they create is removed again by cleanUp.
+"""
+from sqlalchemy import delete, select
+from ulid import ULID
+
+import models
+from config.database import AsyncSessionLocal
+from services import counters
+from services.candidate import sendJobApplication
+from services.recruiter import updateJobApplicationStatusService
+from utils.principal import Principal
+
+
+def candidate() -> Principal:
+    return Principal(userUlId=str(ULID()), role_id=2)
+
+
+async def createJobs(count: int, recruiterId: str = None) -> list:
+    jobIds = [str(ULID()) for _ in range(count)]
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            models.Job(
+                ulid=jobId,
+                title=f"Test job {jobId}",
+                description="Test",
+                requirements="Test",
+                recruiter_id=recruiterId or str(ULID()),
+            )
+            for jobId in jobIds
+        )
+        await db.commit()
+    return jobIds
+
+
+async def cleanUp(jobIds: list, candidateIds: list) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            delete(models.JobApplication).where(
+                models.JobApplication.candidate_id.in_(candidateIds)
+            )
+        )
+        await db.execute(
+            delete(models.JobStatusCounter).where(
+                models.JobStatusCounter.job_id.in_(jobIds)
+            )
+        )
+        await db.execute(
+            delete(models.ListingCounter).where(
+                models.ListingCounter.owner_id.in_(jobIds + candidateIds)
+            )
+        )
+        await db.execute(delete(models.Job).where(models.Job.ulid.in_(jobIds)))
+        await db.commit()
+
+
+async def apply(jobId: str, principal: Principal):
+    async with AsyncSessionLocal() as db:
+        return await sendJobApplication(jobId, principal, db)
+
+
+async def applicationCount(*criteria) -> int:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(counters.countOf(models.JobApplication, *criteria))
+
+
+
+async def updateStatus(applicationId: str, latestStatus: str, recruiter: Principal):
+    async with AsyncSessionLocal() as db:
+        return await updateJobApplicationStatusService(
+            applicationId, latestStatus, recruiter, db
+        )
+
+
+async def applicationIdsOf(jobId: str) -> list:
+    async with AsyncSessionLocal() as db:
+        return (
+            await db.scalars(
+                select(models.JobApplication.ulid).where(
+                    models.JobApplication.job_id == jobId
+                )
+            )
+        ).all()
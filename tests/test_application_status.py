@@ -0,0 +1,93 @@
+"""
+Single application status updates against a real Postgres with the
+migrations applied. Set TEST_DATABASE_URL to run them.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from ulid import ULID
+
+from tests.database import (
+    applicationIdsOf,
+    apply,
+    candidate,
+    cleanUp,
+    createJobs,
+    updateStatus,
+)
+from utils.principal import Principal
+
+pytestmark = pytest.mark.usefixtures("requiresDatabase")
+
+
+def recruiter() -> Principal:
+    return Principal(userUlId=str(ULID()), role_id=3)
+
+
+def statusCodes(outcomes: list) -> list:
+    return sorted(
+        outcome.status_code if isinstance(outcome, HTTPException) else 200
+        for outcome in outcomes
+    )
+
+
+def test_only_the_owner_can_decide(run):
+    owner, applicant = recruiter(), candidate()
+
+    async def scenario():
+        (jobId,) = await createJobs(1, owner.userUlId)
+        try:
+            await apply(jobId, applicant)
+            (applicationId,) = await applicationIdsOf(jobId)
+            with pytest.raises(HTTPException) as raised:
+                await updateStatus(applicationId, "accepted", recruiter())
+            return raised.value
+        finally:
+            await cleanUp([jobId], [applicant.userUlId])
+
+    assert run(scenario()).status_code == 403
+
+
+def test_decided_application_is_a_bad_request(run):
+    owner, applicant = recruiter(), candidate()
+
+    async def scenario():
+        (jobId,) = await createJobs(1, owner.userUlId)
+        try:
+            await apply(jobId, applicant)
+            (applicationId,) = await applicationIdsOf(jobId)
+            await updateStatus(applicationId, "accepted", owner)
+            with pytest.raises(HTTPException) as raised:
+                await updateStatus(applicationId, "rejected", owner)
+            return raised.value
+        finally:
+            await cleanUp([jobId], [applicant.userUlId])
+
+    error = run(scenario())
+    assert error.status_code == 400
+    assert "accepted already" in error.detail
+
+
+def test_owner_losing_a_race_is_never_forbidden(run):
+    owner, applicant = recruiter(), candidate()
+
+    async def scenario():
+        (jobId,) = await createJobs(1, owner.userUlId)
+        try:
+            await apply(jobId, applicant)
+            (applicationId,) = await applicationIdsOf(jobId)
+            return await asyncio.gather(
+                *(
+                    updateStatus(applicationId, latestStatus, owner)
+                    for latestStatus in ("accepted", "rejected") * 3
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            await cleanUp([jobId], [applicant.userUlId])
+
+    codes = statusCodes(run(scenario()))
+    assert codes.count(200) == 1
+    # Losers saw it decided (400) or lost the race inside the statement (409)
+    assert set(codes) - {200} <= {400, 409}
@@ -0,0 +1,49 @@
+"""
+Job applications against a real Postgres with the migrations applied. Set
+TEST_DATABASE_URL to run them.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from ulid import ULID
+
+import models
+from tests.database import applicationCount, apply, candidate, cleanUp, createJobs
+
+pytestmark = pytest.mark.usefixtures("requiresDatabase")
+
+
+def test_concurrent_duplicate_apply_creates_one_application(run):
+    principal = candidate()
+
+    async def scenario():
+        (jobId,) = await createJobs(1)
+        try:
+            outcomes = await asyncio.gather(
+                *(apply(jobId, principal) for _ in range(5)), return_exceptions=True
+            )
+            count = await applicationCount(
+                models.JobApplication.candidate_id == principal.userUlId
+            )
+            return outcomes, count
+        finally:
+            await cleanUp([jobId], [principal.userUlId])
+
+    outcomes, count = run(scenario())
+
+    rejected = [outcome for outcome in outcomes if isinstance(outcome, HTTPException)]
+    assert count == 1
+    assert outcomes.count(None) == 1
+    assert len(rejected) == 4
+    assert all("already applied" in error.detail for error in rejected)
+
+
+def test_apply_to_unknown_job_is_rejected(run):
+    principal = candidate()
+
+    with pytest.raises(HTTPException) as raised:
+        run(apply(str(ULID()), principal))
+
+    assert raised.value.status_code == 400
+    assert raised.value.detail == "Job not found"
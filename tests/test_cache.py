@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from utils import cache
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the few Redis commands the response cache uses.
+    Values come back as bytes, like the real client; expiry is ignored.
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    async def eval(self, script, numkeys, key, token):
+        if self.values.get(key) == token.encode():
+            del self.values[key]
+            return 1
+        return 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.keys = []
+
+    def incr(self, key):
+        self.keys.append(key)
+
+    async def execute(self):
+        results = []
+        for key in self.keys:
+            value = int(self.redis.values.get(key, b"0")) + 1
+            self.redis.values[key] = str(value).encode()
+            results.append(value)
+        return results
+
+
+class BrokenRedis:
+    async def get(self, key):
+        raise ConnectionError("Redis is down")
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "redisCache", fake)
+    return fake
+
+
+def test_concurrent_misses_build_once(redis):
+    builds = []
+
+    async def build():
+        builds.append(1)
+        await asyncio.sleep(0.1)
+        return b"body"
+
+    async def scenario():
+        return await asyncio.gather(
+            *(cache.readThrough("cache:key", build) for _ in range(5))
+        )
+
+    assert asyncio.run(scenario()) == [b"body"] * 5
+    assert len(builds) == 1
+    assert redis.values == {"cache:key": b"body"}
+
+
+def test_hits_skip_the_build(redis):
+    redis.values["cache:key"] = b"cached"
+
+    async def build():
+        raise AssertionError("built on a hit")
+
+    assert asyncio.run(cache.readThrough("cache:key", build)) == b"cached"
+
+
+def test_redis_errors_fall_back_to_build(monkeypatch):
+    monkeypatch.setattr(cache, "redisCache", BrokenRedis())
+
+    async def build():
+        return b"fresh"
+
+    assert asyncio.run(cache.readThrough("cache:key", build)) == b"fresh"
+
+
+def test_invalidation_moves_listing_and_detail_keys(redis):
+    async def keys():
+        return (
+            await cache.jobListingKey(1, 10, None, False),
+            await cache.jobDetailKey("JOB1"),
+            await cache.jobDetailKey("JOB2"),
+        )
+
+    async def scenario():
+        before = await keys()
+        await cache.invalidateJobCache("JOB1")
+        afterJob = await keys()
+        await cache.invalidateJobCache()
+        return before, afterJob, await keys()
+
+    before, afterJob, afterListing = asyncio.run(scenario())
+
+    assert afterJob[0] != before[0]
+    assert afterJob[1] != before[1]
+    assert afterJob[2] == before[2]
+    assert afterListing[0] != afterJob[0]
+    assert afterListing[1:] == afterJob[1:]
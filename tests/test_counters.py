@@ -0,0 +1,65 @@
+"""
+Listing counters against a real Postgres with the migrations applied. Set
+TEST_DATABASE_URL to run them.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import models
+from config.database import AsyncSessionLocal
+from services import counters
+from tests.database import applicationCount, apply, candidate, cleanUp, createJobs
+
+pytestmark = pytest.mark.usefixtures("requiresDatabase")
+
+
+async def readCounter(scope: str, ownerId: str, *criteria) -> int:
+    async with AsyncSessionLocal() as db:
+        return await counters.readCounter(
+            db, scope, ownerId, counters.countOf(models.JobApplication, *criteria)
+        )
+
+
+def test_counters_match_rows_when_seeded_during_applies(run):
+    principal = candidate()
+    byCandidate = models.JobApplication.candidate_id == principal.userUlId
+
+    async def scenario():
+        jobIds = await createJobs(6)
+        try:
+            # First reads seed the counter while applies are bumping it
+            await asyncio.gather(
+                *(apply(jobId, principal) for jobId in jobIds),
+                *(
+                    readCounter(
+                        counters.CANDIDATE_APPLICATIONS, principal.userUlId, byCandidate
+                    )
+                    for _ in range(3)
+                ),
+            )
+            # A rejected duplicate must not move the seeded counters
+            with pytest.raises(HTTPException):
+                await apply(jobIds[0], principal)
+
+            candidateTotal = await readCounter(
+                counters.CANDIDATE_APPLICATIONS, principal.userUlId, byCandidate
+            )
+            jobTotals = [
+                await readCounter(
+                    counters.JOB_APPLICATIONS,
+                    jobId,
+                    models.JobApplication.job_id == jobId,
+                )
+                for jobId in jobIds
+            ]
+            return candidateTotal, jobTotals, await applicationCount(byCandidate)
+        finally:
+            await cleanUp(jobIds, [principal.userUlId])
+
+    candidateTotal, jobTotals, rows = run(scenario())
+
+    assert rows == 6
+    assert candidateTotal == rows
+    assert jobTotals == [1] * 6
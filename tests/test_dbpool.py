@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import QueuePool
+
+from utils import metrics
+from utils.dbpool import instrumentedPool, reportPoolUsage
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumentedPool(QueuePool, "test"),
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.1,
+    )
+    reportPoolUsage(engine.pool, "test")
+    yield engine
+    engine.dispose()
+
+
+def gauges() -> dict:
+    snapshot = metrics.snapshot()["gauges"]
+    names = ("in_use", "idle", "overflow")
+    return {name: snapshot[f"db_pool_test_{name}"] for name in names}
+
+
+def test_gauges_follow_checkouts_and_checkins(engine):
+    first = engine.connect()
+    first.execute(text("SELECT 1"))
+    assert gauges() == {"in_use": 1, "idle": 0, "overflow": 0}
+
+    second = engine.connect()
+    second.execute(text("SELECT 1"))
+    assert gauges() == {"in_use": 2, "idle": 0, "overflow": 1}
+
+    # The pool keeps one connection; the overflow one is closed on return
+    second.close()
+    first.close()
+    assert gauges() == {"in_use": 0, "idle": 1, "overflow": 0}
+
+
+def test_checkouts_are_timed_and_timeouts_counted(engine):
+    before = metrics.snapshot()
+    timedOut = before["counters"].get("db_pool_test_timeouts_total", 0)
+    timings = before["timings"].get("db_pool_test_checkout_seconds", {})
+    checkouts = timings.get("count", 0)
+
+    connections = [engine.connect(), engine.connect()]
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    for connection in connections:
+        connection.close()
+
+    after = metrics.snapshot()
+    timing = after["timings"]["db_pool_test_checkout_seconds"]
+    assert after["counters"]["db_pool_test_timeouts_total"] == timedOut + 1
+    assert timing["count"] == checkouts + 3
+    # The failed checkout waited for pool_timeout
+    assert timing["max"] >= 0.1
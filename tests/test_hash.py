@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from utils import hash as hashing
+
+
+@pytest.fixture
+def smallPool(monkeypatch):
+    monkeypatch.setattr(hashing, "HASH_POOL_WORKERS", 1)
+    monkeypatch.setattr(hashing, "HASH_QUEUE_SIZE", 1)
+    yield
+    hashing.shutdownHashPool()
+
+
+def test_password_round_trip():
+    async def scenario():
+        hashed = await hashing.hashPasswordAsync("s3cret!")
+        return (
+            await hashing.verifyPasswordAsync("s3cret!", hashed),
+            await hashing.verifyPasswordAsync("wrong", hashed),
+        )
+
+    try:
+        assert asyncio.run(scenario()) == (True, False)
+    finally:
+        hashing.shutdownHashPool()
+
+
+def test_requests_beyond_pool_and_queue_get_503(smallPool):
+    async def scenario():
+        return await asyncio.gather(
+            *(hashing._runInPool(time.sleep, 0.3) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    outcomes = asyncio.run(scenario())
+
+    # One running and one queued are accepted, the third is turned away
+    assert outcomes[:2] == [None, None]
+    assert isinstance(outcomes[2], HTTPException)
+    assert outcomes[2].status_code == 503
+    assert outcomes[2].headers == {"Retry-After": "1"}
+    assert hashing._inFlight == 0
+
+
+def test_failures_release_their_slot(smallPool):
+    async def scenario():
+        with pytest.raises(ValueError):
+            await hashing._runInPool(int, "not a number")
+        return await hashing._runInPool(int, "42")
+
+    assert asyncio.run(scenario()) == 42
+    assert hashing._inFlight == 0
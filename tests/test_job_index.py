@@ -0,0 +1,64 @@
+from utils import recommendations
+from utils.recommendations import JobIndex, jobText
+
+
+def index(**jobs) -> JobIndex:
+    jobIndex = JobIndex()
+    jobIndex.apply({"upsert": [[ulid, text] for ulid, text in jobs.items()]})
+    return jobIndex
+
+
+def ranked(jobIndex: JobIndex, text: str, k: int = 10) -> list:
+    return [ulid for ulid, _ in jobIndex.topK(text, k)]
+
+
+def test_top_k_ranks_by_shared_terms():
+    jobIndex = index(
+        backend=jobText("Backend engineer", "python fastapi postgres"),
+        data=jobText("Data engineer", "python spark"),
+        design=jobText("Designer", "figma"),
+    )
+
+    assert ranked(jobIndex, "python fastapi postgres") == ["backend", "data"]
+    assert ranked(jobIndex, "python fastapi postgres", k=1) == ["backend"]
+    # Jobs sharing no term are never returned
+    assert ranked(jobIndex, "figma") == ["design"]
+    assert jobIndex.topK("cobol", 5) == []
+
+
+def test_upsert_replaces_and_remove_drops_a_job():
+    jobIndex = index(
+        first=jobText("Engineer", "python"), second=jobText("Engineer", "go")
+    )
+
+    jobIndex.upsert("first", jobText("Engineer", "rust"))
+    assert ranked(jobIndex, "python") == []
+    assert ranked(jobIndex, "rust") == ["first"]
+
+    jobIndex.apply({"remove": ["second"]})
+    assert ranked(jobIndex, "go") == []
+    # Removing an unknown job is a no-op
+    jobIndex.remove("missing")
+    assert ranked(jobIndex, "engineer") == ["first"]
+
+
+def test_compaction_keeps_results(monkeypatch):
+    monkeypatch.setattr(recommendations, "COMPACT_MIN_DEAD", 2)
+    jobIndex = index(
+        **{f"job{number}": f"Engineer python skill{number}" for number in range(10)}
+    )
+
+    for number in range(5):
+        jobIndex.remove(f"job{number}")
+
+    # The third removal compacted the index, leaving only the last two dead
+    assert len(jobIndex._ulids) == 7
+    assert jobIndex._dead == 2
+    assert ranked(jobIndex, "skill7") == ["job7"]
+    survivors = [f"job{number}" for number in range(5, 10)]
+    assert sorted(ranked(jobIndex, "python")) == survivors
+
+    # Slots handed out after compaction do not collide with the kept ones
+    jobIndex.upsert("job10", "Engineer python skill10")
+    assert ranked(jobIndex, "skill10") == ["job10"]
+    assert ranked(jobIndex, "skill9") == ["job9"]
@@ -0,0 +1,74 @@
+"""
+Recruiter job updates against a real Postgres with the migrations applied.
+Set TEST_DATABASE_URL to run them.
+"""
+import pytest
+from sqlalchemy import select
+from ulid import ULID
+
+import models
+import schemas
+from config.database import AsyncSessionLocal
+from services import recruiter
+from tests.database import cleanUp, createJobs
+from utils.principal import Principal
+
+pytestmark = pytest.mark.usefixtures("requiresDatabase")
+
+
+@pytest.fixture
+def sideEffects(monkeypatch):
+    """
+    Record the cache invalidations and job index changes instead of sending
+    them to Redis.
+    """
+    calls = {"invalidated": [], "published": []}
+
+    async def invalidateJobCache(jobId=None):
+        calls["invalidated"].append(jobId)
+
+    async def publishJobChanges(upserted=(), removed=()):
+        calls["published"].append(list(upserted))
+
+    monkeypatch.setattr(recruiter, "invalidateJobCache", invalidateJobCache)
+    monkeypatch.setattr(recruiter, "publishJobChanges", publishJobChanges)
+    return calls
+
+
+async def updateJob(jobId: str, owner: Principal, **fields) -> int:
+    async with AsyncSessionLocal() as db:
+        await recruiter.updateRecruiterJobService(
+            jobId, schemas.JobUpdate(**fields), owner, db
+        )
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(
+            select(models.Job.version).where(models.Job.ulid == jobId)
+        )
+
+
+@pytest.mark.parametrize(
+    "fields, version, invalidated, published",
+    [
+        # Nothing supplied, or nothing different: no write at all
+        ({}, 1, 0, 0),
+        ({"description": "Test", "requirements": "Test"}, 1, 0, 0),
+        # Outside the recommendation text: cache only
+        ({"description": "New description"}, 2, 1, 0),
+        ({"title": "New title"}, 2, 1, 1),
+    ],
+)
+def test_only_real_changes_are_written_and_published(
+    run, sideEffects, fields, version, invalidated, published
+):
+    owner = Principal(userUlId=str(ULID()), role_id=3)
+
+    async def scenario():
+        (jobId,) = await createJobs(1, owner.userUlId)
+        try:
+            return await updateJob(jobId, owner, **fields)
+        finally:
+            await cleanUp([jobId], [])
+
+    assert run(scenario()) == version
+    assert len(sideEffects["invalidated"]) == invalidated
+    assert len(sideEffects["published"]) == published
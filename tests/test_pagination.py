@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from ulid import ULID
+
+from utils.pagination import (
+    decodeCursor,
+    decodeRankCursor,
+    encodeCursor,
+    encodeRankCursor,
+    splitPage,
+)
+
+
+def test_cursor_round_trip():
+    createdAt = datetime(2026, 10, 18, 12, 30, 15, 123456)
+    ulid = str(ULID())
+
+    cursor = encodeCursor(createdAt, ulid)
+
+    assert decodeCursor(cursor) == (createdAt, ulid)
+    # Cursors travel in query strings
+    assert not set(cursor) & set("+/=")
+
+
+def test_rank_cursor_round_trip():
+    ulid = str(ULID())
+
+    assert decodeRankCursor(encodeRankCursor(0.0625, ulid)) == (0.0625, ulid)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        encodeCursor(datetime(2026, 1, 1), "x")[:-3],
+        # Valid base64 JSON of the wrong shape
+        "WyJhIl0",
+        # Two values, but not a timestamp
+        "WyJub3QtYS1kYXRlIiwiYSJd",
+    ],
+)
+def test_invalid_cursor_is_a_bad_request(cursor):
+    with pytest.raises(HTTPException) as raised:
+        decodeCursor(cursor)
+
+    assert raised.value.status_code == 400
+
+
+def test_rank_cursor_needs_a_number():
+    with pytest.raises(HTTPException) as raised:
+        decodeRankCursor(encodeCursor(datetime(2026, 1, 1), str(ULID())))
+
+    assert raised.value.status_code == 400
+
+
+def test_split_page_continues_after_the_last_row():
+    rows = [(datetime(2026, 1, day), str(ULID())) for day in range(5, 0, -1)]
+
+    page, nextCursor = splitPage(rows, 3, lambda row: row)
+
+    assert page == rows[:3]
+    assert decodeCursor(nextCursor) == rows[2]
+
+
+def test_split_page_has_no_cursor_on_the_last_page():
+    rows = [(datetime(2026, 1, day), str(ULID())) for day in range(3, 0, -1)]
+
+    assert splitPage(rows, 3, lambda row: row) == (rows, None)
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+
+from utils.ranking import ULID_DTYPE, rankPage, topUp
+
+REQUIREMENTS = "python fastapi postgres"
+WATERMARK = datetime(2026, 10, 18, 12, 0, 0)
+
+
+def application(ulid: str, skills: str, minutes: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        ulid=ulid, skills=skills, applied_at=WATERMARK + timedelta(minutes=minutes)
+    )
+
+
+def test_rank_page_orders_by_score_then_ulid():
+    ulids = np.array(["C", "A", "B", "D"], dtype=ULID_DTYPE)
+    scores = np.array([0.5, 0.9, 0.5, 0.1], dtype=np.float32)
+
+    assert [ulid for ulid, _ in rankPage(ulids, scores, 1, 3)] == ["A", "B", "C"]
+    assert [ulid for ulid, _ in rankPage(ulids, scores, 2, 3)] == ["D"]
+    assert rankPage(ulids, scores, 3, 3) == []
+
+
+def test_top_up_scores_new_applications_and_moves_the_watermark():
+    ulids, scores, watermark = topUp(
+        np.empty(0, dtype=ULID_DTYPE),
+        np.empty(0, dtype=np.float32),
+        None,
+        REQUIREMENTS,
+        [application("A", "python, fastapi", 1), application("B", "excel", 2)],
+    )
+
+    assert ulids.tolist() == [b"A", b"B"]
+    assert scores[0] > scores[1] == 0
+    assert watermark == WATERMARK + timedelta(minutes=2)
+
+
+def test_top_up_skips_rows_re_read_by_the_overlap():
+    ulids = np.array(["A"], dtype=ULID_DTYPE)
+    scores = np.array([0.75], dtype=np.float32)
+
+    # A comes back because of TOPUP_OVERLAP, and must not be scored twice
+    sameUlids, sameScores, sameWatermark = topUp(
+        ulids, scores, WATERMARK, REQUIREMENTS, [application("A", "python", -1)]
+    )
+    assert sameUlids is ulids and sameScores is scores
+    assert sameWatermark == WATERMARK
+
+    toppedUlids, toppedScores, watermark = topUp(
+        ulids,
+        scores,
+        WATERMARK,
+        REQUIREMENTS,
+        [application("A", "python", -1), application("B", "postgres", -2)],
+    )
+    assert toppedUlids.tolist() == [b"A", b"B"]
+    assert toppedScores[0] == np.float32(0.75)
+    # Late commits are older than the watermark, which never moves back
+    assert watermark == WATERMARK
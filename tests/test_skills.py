@@ -0,0 +1,64 @@
+import pytest
+
+from utils import skills
+from utils.skills import SkillIndex, parseSkills
+
+
+def index(**skillsOf) -> SkillIndex:
+    skillIndex = SkillIndex()
+    for userUlId, names in skillsOf.items():
+        skillIndex.apply({"user": userUlId, "skills": names})
+    return skillIndex
+
+
+def matched(skillIndex: SkillIndex, names: list, mode: str = "all") -> list:
+    return sorted(skillIndex.usersOf(skillIndex.match(names, mode)))
+
+
+def test_parse_skills_normalises_and_deduplicates():
+    assert parseSkills(" Python ,FastAPI;python | Machine   Learning\n") == [
+        "python",
+        "fastapi",
+        "machine learning",
+    ]
+    assert parseSkills("") == []
+
+
+# SPARSE_RATIO 1 sends every query down the sorted-array path, 64 down the
+# per-user counting path for these small indexes
+@pytest.mark.parametrize("sparseRatio", [1, 64])
+def test_all_and_any_queries(monkeypatch, sparseRatio):
+    monkeypatch.setattr(skills, "SPARSE_RATIO", sparseRatio)
+    skillIndex = index(
+        ann=["python", "sql"],
+        bob=["python", "go"],
+        cat=["sql"],
+        dan=["rust"],
+    )
+
+    assert matched(skillIndex, ["python"]) == ["ann", "bob"]
+    assert matched(skillIndex, ["python", "sql"]) == ["ann"]
+    assert matched(skillIndex, ["python", "sql"], "any") == ["ann", "bob", "cat"]
+    assert matched(skillIndex, ["python", "cobol"]) == []
+    assert matched(skillIndex, ["cobol"], "any") == []
+    assert matched(skillIndex, []) == []
+
+
+def test_set_skills_replaces_a_users_skills():
+    skillIndex = index(ann=["python", "sql"], bob=["sql"])
+
+    skillIndex.setSkills("ann", ["go"])
+
+    assert matched(skillIndex, ["python"]) == []
+    assert matched(skillIndex, ["sql"]) == ["bob"]
+    assert matched(skillIndex, ["go"]) == ["ann"]
+
+
+def test_long_all_queries_do_not_wrap_the_hit_count(monkeypatch):
+    # More skills than a uint8 counter can hold, on the counting path
+    monkeypatch.setattr(skills, "SPARSE_RATIO", 64)
+    names = [f"skill{number}" for number in range(300)]
+    skillIndex = index(ann=names, bob=names[:44], cat=[])
+
+    assert matched(skillIndex, names) == ["ann"]
+    assert matched(skillIndex, names[:256]) == ["ann"]
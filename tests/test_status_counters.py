@@ -0,0 +1,87 @@
+"""
+Per-job status counters behind the recruiter dashboard, against a real
+Postgres with the migrations applied. Set TEST_DATABASE_URL to run them.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from ulid import ULID
+
+import models
+from config.database import AsyncSessionLocal
+from tests.database import (
+    applicationIdsOf,
+    apply,
+    candidate,
+    cleanUp,
+    createJobs,
+    updateStatus,
+)
+from utils.principal import Principal
+
+pytestmark = pytest.mark.usefixtures("requiresDatabase")
+
+
+async def statusTotals(jobId: str) -> tuple:
+    """
+    Return (counted, actual): the status counters of jobId and the real
+    number of applications in each status.
+    """
+    async with AsyncSessionLocal() as db:
+        counted = dict(
+            (
+                await db.execute(
+                    select(
+                        models.JobStatusCounter.status, models.JobStatusCounter.total
+                    ).where(
+                        models.JobStatusCounter.job_id == jobId,
+                        models.JobStatusCounter.total != 0,
+                    )
+                )
+            ).all()
+        )
+        actual = dict(
+            (
+                await db.execute(
+                    select(models.JobApplication.status, func.count())
+                    .where(models.JobApplication.job_id == jobId)
+                    .group_by(models.JobApplication.status)
+                )
+            ).all()
+        )
+    return counted, actual
+
+
+def test_status_counters_match_rows_under_concurrent_updates(run):
+    recruiter = Principal(userUlId=str(ULID()), role_id=3)
+    candidates = [candidate() for _ in range(4)]
+
+    async def scenario():
+        (jobId,) = await createJobs(1, recruiter.userUlId)
+        try:
+            await asyncio.gather(*(apply(jobId, principal) for principal in candidates))
+            applicationIds = await applicationIdsOf(jobId)
+
+            # Every application gets two competing decisions; one must lose
+            outcomes = await asyncio.gather(
+                *(
+                    updateStatus(applicationId, latestStatus, recruiter)
+                    for applicationId in applicationIds
+                    for latestStatus in ("accepted", "rejected")
+                ),
+                return_exceptions=True,
+            )
+            return outcomes, await statusTotals(jobId)
+        finally:
+            await cleanUp([jobId], [principal.userUlId for principal in candidates])
+
+    outcomes, (counted, actual) = run(scenario())
+
+    assert outcomes.count(None) == len(candidates)
+    failures = [outcome for outcome in outcomes if outcome is not None]
+    assert all(isinstance(outcome, HTTPException) for outcome in failures)
+    assert sum(actual.values()) == len(candidates)
+    assert "pending" not in actual
+    assert counted == actual
@@ -0,0 +1,58 @@
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from ulid import ULID
+
+from utils.ulidtype import NIL_UUID, ULIDType, canonicalUlid
+
+dialect = postgresql.dialect()
+
+
+def test_ulid_round_trips_through_uuid():
+    ulid = ULID()
+    column = ULIDType()
+
+    bound = column.process_bind_param(str(ulid).lower(), dialect)
+
+    assert bound == ulid.to_uuid()
+    assert column.process_result_value(bound, dialect) == str(ulid)
+    assert column.process_result_value(str(bound), dialect) == str(ulid)
+
+
+def test_ordering_by_uuid_is_creation_order():
+    ulids = sorted(str(ULID.from_timestamp(second)) for second in (3, 1, 2))
+
+    bound = [ULIDType().process_bind_param(ulid, dialect) for ulid in ulids]
+
+    assert bound == sorted(bound)
+
+
+@pytest.mark.parametrize("value", ["", "not-a-ulid", "Z" * 26, "0" * 27])
+def test_malformed_ids_bind_as_nil_uuid(value):
+    assert ULIDType().process_bind_param(value, dialect) == NIL_UUID
+
+
+def test_none_and_uuid_pass_through():
+    column = ULIDType()
+    value = uuid.uuid4()
+
+    assert column.process_bind_param(None, dialect) is None
+    assert column.process_bind_param(value, dialect) is value
+    assert column.process_result_value(None, dialect) is None
+
+
+def test_canonical_ulid_upper_cases():
+    ulid = str(ULID())
+
+    assert canonicalUlid(ulid.lower()) == ulid
+    assert canonicalUlid(ulid) == ulid
+
+
+def test_canonical_ulid_rejects_malformed_ids_with_404():
+    with pytest.raises(HTTPException) as raised:
+        canonicalUlid("nope", detail="Application not found")
+
+    assert raised.value.status_code == 404
+    assert raised.value.detail == "Application not found"
@@ -0,0 +1,111 @@
+import asyncio
+import secrets
+from typing import Awaitable, Callable, Optional
+
+from redis.exceptions import RedisError
+
+from config.redis import redisCache
+from config.settings import JOB_CACHE_TTL
+from utils import metrics
+
+LISTING_VERSION_KEY = "cache:jobs:version"
+
+# Single-flight rebuild: the lock holder rebuilds a missing key while the
+# other requests poll for it, falling back to building it themselves if the
+# holder takes too long.
+LOCK_TTL_MS = 5000
+LOCK_WAIT_SECONDS = 2.0
+LOCK_POLL_SECONDS = 0.05
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _jobVersionKey(jobId: str) -> str:
+    return f"cache:job:{jobId}:version"
+
+
+async def _version(key: str) -> str:
+    try:
+        version = await redisCache.get(key)
+    except RedisError:
+        return "0"
+    return version.decode("utf-8") if version else "0"
+
+
+async def jobListingKey(
+    page: int, limit: int, cursor: Optional[str], includeTotal: Optional[bool]
+) -> str:
+    version = await _version(LISTING_VERSION_KEY)
+    return f"cache:jobs:v{version}:{page}:{limit}:{cursor or ''}:{includeTotal}"
+
+
+async def jobDetailKey(jobId: str) -> str:
+    version = await _version(_jobVersionKey(jobId))
+    return f"cache:job:{jobId}:v{version}"
+
+
+async def readThrough(key: str, build: Callable[[], Awaitable[bytes]]) -> bytes:
+    """
+    Return the cached bytes for key, or build and store them. Redis errors
+    never fail the request; the body is built from the database instead.
+    """
+    try:
+        cached = await redisCache.get(key)
+        if cached is not None:
+            metrics.increment("response_cache_hits_total")
+            return cached
+
+        metrics.increment("response_cache_misses_total")
+        lockKey = f"{key}:lock"
+        token = secrets.token_hex(8)
+        acquired = await redisCache.set(lockKey, token, nx=True, px=LOCK_TTL_MS)
+    except RedisError:
+        metrics.increment("response_cache_errors_total")
+        return await build()
+
+    if not acquired:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LOCK_WAIT_SECONDS
+        while loop.time() < deadline:
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+            try:
+                cached = await redisCache.get(key)
+            except RedisError:
+                break
+            if cached is not None:
+                return cached
+        return await build()
+
+    try:
+        body = await build()
+        try:
+            await redisCache.set(key, body, ex=JOB_CACHE_TTL)
+        except RedisError:
+            metrics.increment("response_cache_errors_total")
+        return body
+    finally:
+        try:
+            await redisCache.eval(RELEASE_LOCK_SCRIPT, 1, lockKey, token)
+        except RedisError:
+            pass
+
+
+async def invalidateJobCache(jobId: Optional[str] = None) -> None:
+    """
+    Bump the listing version, and the job's own version when given, so every
+    previously cached response becomes unreachable and ages out via its TTL.
+    """
+    try:
+        pipe = redisCache.pipeline(transaction=False)
+        pipe.incr(LISTING_VERSION_KEY)
+        if jobId is not None:
+            pipe.incr(_jobVersionKey(jobId))
+        await pipe.execute()
+    except RedisError as e:
+        metrics.increment("response_cache_errors_total")
+        print(f"Error invalidating job cache: {str(e)}")
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from sqlalchemy import event, exc
+
+from utils import metrics
+
+
+class _TimedCheckout:
+    """
+    Times every checkout, including the wait for a free connection, and
+    counts checkouts that give up after pool_timeout. The pool events only
+    fire once a connection has been handed out, so this wraps the public
+    connect() instead.
+    """
+
+    metricsName = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            metrics.increment(f"db_pool_{self.metricsName}_timeouts_total")
+            raise
+        finally:
+            metrics.observe(
+                f"db_pool_{self.metricsName}_checkout_seconds",
+                time.perf_counter() - started,
+            )
+
+
+def instrumentedPool(poolClass, name: str):
+    """
+    Subclass of poolClass reporting its checkouts as db_pool_<name>_*.
+    """
+    return type(
+        f"Instrumented{poolClass.__name__}",
+        (_TimedCheckout, poolClass),
+        {"metricsName": name},
+    )
+
+
+def reportPoolUsage(pool, name: str) -> None:
+    """
+    Keep the db_pool_<name>_in_use, _idle and _overflow gauges current from
+    the pool's connect, close, detach, checkout and checkin events. The
+    listeners carry over to the pool engine.dispose() recreates.
+    """
+    counts = {"open": 0, "inUse": 0}
+    lock = threading.Lock()
+    poolSize = pool.size()
+
+    def adjust(opened: int, checkedOut: int):
+        def listener(*args):
+            with lock:
+                counts["open"] += opened
+                counts["inUse"] += checkedOut
+                openCount, inUse = counts["open"], counts["inUse"]
+            metrics.setGauge(f"db_pool_{name}_in_use", inUse)
+            metrics.setGauge(f"db_pool_{name}_idle", max(openCount - inUse, 0))
+            # From the open count, as an overflow connection's close event
+            # fires before the pool lowers its own overflow
+            metrics.setGauge(f"db_pool_{name}_overflow", max(openCount - poolSize, 0))
+
+        return listener
+
+    event.listen(pool, "connect", adjust(1, 0))
+    event.listen(pool, "close", adjust(-1, 0))
+    # A detached connection leaves the pool while checked out, and is never
+    # checked back in
+    event.listen(pool, "detach", adjust(-1, -1))
+    event.listen(pool, "checkout", adjust(0, 1))
+    event.listen(pool, "checkin", adjust(0, -1))
@@ -1,4 +1,19 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 import bcrypt
+from fastapi import HTTPException, status
+
+from config.settings import HASH_POOL_WORKERS, HASH_QUEUE_SIZE
+from utils import metrics
+
+# bcrypt is CPU bound (~250ms per call), so it runs in a dedicated process pool
+# instead of Starlette's threadpool. Requests beyond the pool size plus the
+# queue bound are rejected straight away with a 503.
+_executor = None
+_inFlight = 0
 
 
 # Hashes a plain text password using bcrypt
@@ -12,3 +27,59 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
+
+
+def _getExecutor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=HASH_POOL_WORKERS)
+    return _executor
+
+
+def _reportQueue() -> None:
+    metrics.setGauge("password_hash_in_flight", _inFlight)
+    metrics.setGauge(
+        "password_hash_queue_depth", max(_inFlight - HASH_POOL_WORKERS, 0)
+    )
+
+
+async def _runInPool(fn, *args):
+    global _executor, _inFlight
+
+    if _inFlight >= HASH_POOL_WORKERS + HASH_QUEUE_SIZE:
+        metrics.increment("password_hash_rejected_total")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    _inFlight += 1
+    _reportQueue()
+    start = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_getExecutor(), fn, *args)
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool for the next caller
+        _executor = None
+        raise
+    finally:
+        _inFlight -= 1
+        _reportQueue()
+        metrics.observe("password_hash_seconds", time.perf_counter() - start)
+
+
+async def hashPasswordAsync(plain_password: str) -> str:
+    return await _runInPool(hash_password, plain_password)
+
+
+async def verifyPasswordAsync(plain_password: str, hashed_password: str) -> bool:
+    return await _runInPool(verify_password, plain_password, hashed_password)
+
+
+def shutdownHashPool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from config.database import async_engine
+from config.redis import redisCache
+from utils import metrics
+
+WARMUP_TIMEOUT_SECONDS = 10
+CHECK_TIMEOUT_SECONDS = 2
+REDIS_WARM_CONNECTIONS = 4
+
+
+class Readiness:
+    """
+    Tracks whether this worker has finished warming its pools. /readyz
+    reports not ready until then, so traffic is only routed to workers whose
+    first requests will not pay for opening connections.
+    """
+
+    def __init__(self):
+        self.warmed = False
+        self.errors = {}
+
+
+readiness = Readiness()
+
+
+async def _warmDatabase(count: int) -> None:
+    # Hold every connection at once so the pool really opens count of them
+    # rather than handing the same one back out
+    results = await asyncio.gather(
+        *(async_engine.connect() for _ in range(count)), return_exceptions=True
+    )
+    connections = [result for result in results if not isinstance(result, Exception)]
+    try:
+        await asyncio.gather(
+            *(connection.execute(text("SELECT 1")) for connection in connections)
+        )
+    finally:
+        await asyncio.gather(*(connection.close() for connection in connections))
+
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+
+async def _warmRedis(count: int) -> None:
+    # Concurrent commands each take their own pooled connection
+    await asyncio.gather(*(redisCache.ping() for _ in range(count)))
+
+
+async def warmPools() -> None:
+    """
+    Open the database and Redis pools concurrently. Failures are recorded
+    rather than raised: the worker still starts, and /readyz reports the
+    dependency that is down.
+    """
+    started = time.perf_counter()
+    warmups = {
+        "database": _warmDatabase(async_engine.pool.size()),
+        "redis": _warmRedis(REDIS_WARM_CONNECTIONS),
+    }
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(warmup, WARMUP_TIMEOUT_SECONDS)
+            for warmup in warmups.values()
+        ),
+        return_exceptions=True,
+    )
+
+    for name, result in zip(warmups, results):
+        if isinstance(result, BaseException):
+            readiness.errors[name] = repr(result)
+            metrics.increment("startup_warmup_errors_total")
+            print(f"Unable to warm the {name} pool: {result!r}")
+
+    metrics.observe("startup_warmup_seconds", time.perf_counter() - started)
+    readiness.warmed = True
+
+
+async def _checkDatabase() -> None:
+    async with async_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def checkDependencies() -> dict:
+    """
+    Ping the database and Redis, each bounded by CHECK_TIMEOUT_SECONDS, and
+    return {name: None or error}.
+    """
+    checks = {"database": _checkDatabase(), "redis": redisCache.ping()}
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(check, CHECK_TIMEOUT_SECONDS)
+            for check in checks.values()
+        ),
+        return_exceptions=True,
+    )
+    return {
+        name: repr(result) if isinstance(result, BaseException) else None
+        for name, result in zip(checks, results)
+    }
@@ -0,0 +1,45 @@
+import threading
+from collections import defaultdict
+
+# Minimal in-process metrics registry. Values are per worker process and are
+# exposed as JSON through the /metrics route in main.py.
+_lock = threading.Lock()
+_counters = defaultdict(float)
+_gauges = {}
+_timings = {}
+
+
+def increment(name: str, value: float = 1) -> None:
+    with _lock:
+        _counters[name] += value
+
+
+def setGauge(name: str, value: float) -> None:
+    with _lock:
+        _gauges[name] = value
+
+
+def observe(name: str, seconds: float) -> None:
+    """
+    Record a duration sample, keeping count, sum and max.
+    """
+    with _lock:
+        timing = _timings.setdefault(name, {"count": 0, "sum": 0.0, "max": 0.0})
+        timing["count"] += 1
+        timing["sum"] += seconds
+        timing["max"] = max(timing["max"], seconds)
+
+
+def snapshot() -> dict:
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "gauges": dict(_gauges),
+            "timings": {
+                name: {
+                    **timing,
+                    "avg": timing["sum"] / timing["count"] if timing["count"] else 0.0,
+                }
+                for name, timing in _timings.items()
+            },
+        }
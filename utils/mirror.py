@@ -0,0 +1,96 @@
+import asyncio
+import json
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from config.redis import redisCache, redisSubscriber
+from utils import metrics
+
+RETRY_DELAY_SECONDS = 1
+
+
+class ChannelMirror:
+    """
+    Base for per-worker in-memory structures kept current through a Redis
+    channel. Subclasses load their state in _rebuild and apply the change
+    events published on the channel in apply. Subscribing happens before the
+    rebuild, so changes committed while it runs are replayed after it.
+
+    The subscription never reconnects on its own (see redisSubscriber): any
+    failure marks the mirror not ready until it has resubscribed and rebuilt,
+    because events published while it was down are lost.
+    """
+
+    channel: str
+    name: str
+
+    def __init__(self):
+        self._ready = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def apply(self, event: dict) -> None:
+        raise NotImplementedError
+
+    async def _rebuild(self) -> None:
+        raise NotImplementedError
+
+    def tick(self) -> None:
+        """
+        Called about once a second while subscribed, for housekeeping.
+        """
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = redisSubscriber.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                await self._rebuild()
+                self._ready = True
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        self.apply(json.loads(message["data"]))
+                    self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._ready = False
+                metrics.increment(f"{self.name}_errors_total")
+                print(f"{self.name} out of sync: {str(e)}")
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._ready = False
+
+
+async def publish(channel: str, event: dict, name: str) -> None:
+    """
+    Publish a change event for every worker's mirror, this one included.
+    Failures are logged; the mirrors catch up on their next rebuild.
+    """
+    try:
+        await redisCache.publish(channel, json.dumps(event))
+    except RedisError as e:
+        metrics.increment(f"{name}_errors_total")
+        print(f"Error publishing to {channel}: {str(e)}")
@@ -0,0 +1,105 @@
+import base64
+import json
+import math
+from datetime import datetime
+from typing import Callable, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+
+def _encodeValues(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def _decodeValues(cursor: str) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != 2:
+            raise ValueError("malformed cursor")
+        return values
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def encodeCursor(createdAt: datetime, ulid: str) -> str:
+    return _encodeValues([createdAt.isoformat(), ulid])
+
+
+def decodeCursor(cursor: str) -> tuple:
+    createdAt, ulid = _decodeValues(cursor)
+    try:
+        return datetime.fromisoformat(createdAt), str(ulid)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def encodeRankCursor(rank: float, ulid: str) -> str:
+    return _encodeValues([rank, ulid])
+
+
+def decodeRankCursor(cursor: str) -> tuple:
+    rank, ulid = _decodeValues(cursor)
+    if not isinstance(rank, (int, float)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return float(rank), str(ulid)
+
+
+def keysetQuery(query, createdColumn, ulidColumn, cursor: Optional[str] = None):
+    """
+    Order a listing newest first by (created, ulid) and, when a cursor is
+    given, seek past it. The matching composite indexes live in models.py.
+    """
+    query = query.order_by(createdColumn.desc(), ulidColumn.desc())
+    if cursor:
+        createdAt, ulid = decodeCursor(cursor)
+        # A plain tuple on the right binds each value with its column's type
+        query = query.where(tuple_(createdColumn, ulidColumn) < (createdAt, ulid))
+    return query
+
+
+def splitPage(
+    rows: list, limit: int, keyOf: Callable, encode: Callable = encodeCursor
+) -> tuple:
+    """
+    Trim a result fetched with limit + 1 rows and build the cursor of the
+    next page, or None when this is the last one.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode(*keyOf(rows[-1]))
+
+
+def buildPagination(
+    page: int,
+    limit: int,
+    cursor: Optional[str],
+    nextCursor: Optional[str],
+    total: Optional[int] = None,
+    accuracy: Optional[str] = None,
+) -> dict:
+    pagination = {}
+    if cursor is None:
+        pagination["current_page"] = page
+    pagination["per_page"] = limit
+
+    if total is not None:
+        pagination["total_items"] = total
+        pagination["total_accuracy"] = accuracy
+        if cursor is None:
+            pagination["total_pages"] = math.ceil(total / limit) if total > 0 else 1
+
+    pagination["next_cursor"] = nextCursor
+    return pagination
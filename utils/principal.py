@@ -0,0 +1,59 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from config.settings import PRINCIPAL_CACHE_TTL
+
+MAX_CACHED_PRINCIPALS = 10000
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    The authenticated user as seen by request handlers. Handlers that need
+    more than these columns load the full models.User row themselves.
+    """
+
+    userUlId: str
+    role_id: int
+    email: Optional[str] = None
+    full_name: Optional[str] = None
+
+
+class PrincipalCache:
+    """
+    Per-worker TTL cache of principals verified against the database, so the
+    auth dependencies normally resolve a user without a query.
+    """
+
+    def __init__(self, ttl: int, maxSize: int = MAX_CACHED_PRINCIPALS):
+        self.ttl = ttl
+        self.maxSize = maxSize
+        self._entries = {}
+
+    def get(self, userUlId: str) -> Optional[Principal]:
+        entry = self._entries.get(userUlId)
+        if entry is None:
+            return None
+
+        expiresAt, principal = entry
+        if expiresAt < time.monotonic():
+            self._entries.pop(userUlId, None)
+            return None
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        if len(self._entries) >= self.maxSize:
+            # Drop the oldest insertion to stay bounded
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[principal.userUlId] = (
+            time.monotonic() + self.ttl,
+            principal,
+        )
+
+    def invalidate(self, userUlId: str) -> None:
+        self._entries.pop(userUlId, None)
+
+
+principalCache = PrincipalCache(PRINCIPAL_CACHE_TTL)
+
@@ -0,0 +1,181 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import models
+from config.redis import redisCache
+from utils import metrics
+from utils.vectorize import scoreTexts
+
+MATCH_CACHE_TTL = 600
+ULID_DTYPE = "S26"
+# Applications committed slightly out of applied_at order are picked up by
+# re-reading this far behind the watermark
+TOPUP_OVERLAP = timedelta(seconds=5)
+
+
+def _versionKey(jobId: str) -> str:
+    return f"match:{jobId}:version"
+
+
+async def _matchKey(jobId: str, requirements: Optional[str]) -> str:
+    # Keyed by the requirements text so editing the job starts a new vector,
+    # and by a version bumped when an applicant's skills change
+    try:
+        version = await redisCache.get(_versionKey(jobId))
+    except RedisError:
+        version = None
+    version = version.decode("utf-8") if version else "0"
+    digest = hashlib.sha1((requirements or "").encode("utf-8")).hexdigest()[:16]
+    return f"match:{jobId}:v{version}:{digest}"
+
+
+async def _readScores(key: str) -> Optional[tuple]:
+    try:
+        cached = await redisCache.hgetall(key)
+    except RedisError:
+        metrics.increment("applicant_match_cache_errors_total")
+        return None
+    if not cached:
+        return None
+
+    return (
+        np.frombuffer(cached[b"ulids"], dtype=ULID_DTYPE),
+        np.frombuffer(cached[b"scores"], dtype=np.float32),
+        datetime.fromisoformat(cached[b"watermark"].decode("utf-8")),
+    )
+
+
+async def _writeScores(
+    key: str, ulids: np.ndarray, scores: np.ndarray, watermark: datetime
+) -> None:
+    try:
+        pipe = redisCache.pipeline(transaction=True)
+        pipe.hset(
+            key,
+            mapping={
+                "ulids": ulids.tobytes(),
+                "scores": scores.tobytes(),
+                "watermark": watermark.isoformat(),
+            },
+        )
+        pipe.expire(key, MATCH_CACHE_TTL)
+        await pipe.execute()
+    except RedisError:
+        metrics.increment("applicant_match_cache_errors_total")
+
+
+async def applicantScores(
+    db: AsyncSession, jobId: str, requirements: Optional[str]
+) -> tuple:
+    """
+    Return (application ulids, match scores) for every application to the
+    job. The vector is cached in Redis and topped up with applications
+    newer than its watermark instead of being rescored on every page.
+    """
+    key = await _matchKey(jobId, requirements)
+    cached = await _readScores(key)
+
+    query = (
+        select(
+            models.JobApplication.ulid,
+            models.JobApplication.applied_at,
+            models.User.skills,
+        )
+        .join(
+            models.User, models.JobApplication.candidate_id == models.User.userUlId
+        )
+        .where(models.JobApplication.job_id == jobId)
+    )
+    if cached is None:
+        metrics.increment("applicant_match_cache_misses_total")
+        ulids = np.empty(0, dtype=ULID_DTYPE)
+        scores = np.empty(0, dtype=np.float32)
+        watermark = None
+    else:
+        metrics.increment("applicant_match_cache_hits_total")
+        ulids, scores, watermark = cached
+        query = query.where(
+            models.JobApplication.applied_at > watermark - TOPUP_OVERLAP
+        )
+
+    rows = (await db.execute(query)).all()
+    toppedUlids, toppedScores, watermark = topUp(
+        ulids, scores, watermark, requirements, rows
+    )
+    if toppedUlids.size > ulids.size and watermark is not None:
+        await _writeScores(key, toppedUlids, toppedScores, watermark)
+    return toppedUlids, toppedScores
+
+
+def topUp(
+    ulids: np.ndarray,
+    scores: np.ndarray,
+    watermark: Optional[datetime],
+    requirements: Optional[str],
+    rows: list,
+) -> tuple:
+    """
+    Append the scores of rows, applications with ulid, applied_at and
+    skills, that are not in ulids yet. Return the new (ulids, scores,
+    watermark).
+    """
+    known = set(ulids.tolist())
+    rows = [row for row in rows if row.ulid.encode("ascii") not in known]
+    if not rows:
+        return ulids, scores, watermark
+
+    ulids = np.concatenate(
+        [ulids, np.array([row.ulid for row in rows], dtype=ULID_DTYPE)]
+    )
+    scores = np.concatenate(
+        [scores, scoreTexts(requirements, [row.skills for row in rows])]
+    )
+    appliedAt = [row.applied_at for row in rows if row.applied_at is not None]
+    if watermark is not None:
+        appliedAt.append(watermark)
+    return ulids, scores, max(appliedAt) if appliedAt else None
+
+
+async def invalidateCandidateScores(db: AsyncSession, userUlId: str) -> None:
+    """
+    Bump the score version of every job the candidate applied to, after
+    their skills changed. A rescore already running when this lands writes
+    under the old version, which is never read again.
+    """
+    jobIds = (
+        await db.scalars(
+            select(models.JobApplication.job_id).where(
+                models.JobApplication.candidate_id == userUlId
+            )
+        )
+    ).all()
+    if not jobIds:
+        return
+
+    try:
+        pipe = redisCache.pipeline(transaction=False)
+        for jobId in jobIds:
+            pipe.incr(_versionKey(jobId))
+        await pipe.execute()
+    except RedisError:
+        metrics.increment("applicant_match_cache_errors_total")
+
+
+def rankPage(ulids: np.ndarray, scores: np.ndarray, page: int, limit: int) -> list:
+    """
+    Return the (ulid, score) pairs of one page, best match first and ties
+    broken by ulid.
+    """
+    order = np.lexsort((ulids, -scores))
+    offset = (page - 1) * limit
+    selected = order[offset : offset + limit]
+    return [
+        (ulid.decode("ascii"), float(score))
+        for ulid, score in zip(ulids[selected].tolist(), scores[selected].tolist())
+    ]
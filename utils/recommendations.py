@@ -0,0 +1,248 @@
+import asyncio
+import math
+import time
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import select
+
+import models
+from config.database import AsyncSessionLocal
+from utils import metrics
+from utils.mirror import ChannelMirror, publish
+from utils.vectorize import termMatrix, termVector
+
+JOBS_CHANNEL = "jobs:changed"
+
+REBUILD_BATCH_SIZE = 5000
+# Dense scoring over every slot beats sorting the matched postings once the
+# query touches more than 1/DENSE_SCORING_RATIO of the index
+DENSE_SCORING_RATIO = 8
+# Removed and replaced jobs leave dead slots behind until compaction
+COMPACT_MIN_DEAD = 10000
+COMPACT_DEAD_RATIO = 0.25
+
+
+def jobText(title: Optional[str], requirements: Optional[str]) -> str:
+    return f"{title or ''} {requirements or ''}"
+
+
+class _Postings:
+    """
+    Growable (slot, weight) arrays for one feature.
+    """
+
+    __slots__ = ("rows", "weights", "size")
+
+    def __init__(self, rows: np.ndarray, weights: np.ndarray):
+        self.rows = rows
+        self.weights = weights
+        self.size = rows.size
+
+    def append(self, row: int, weight: float) -> None:
+        if self.size == self.rows.size:
+            capacity = max(8, self.size * 2)
+            self.rows = np.resize(self.rows, capacity)
+            self.weights = np.resize(self.weights, capacity)
+        self.rows[self.size] = row
+        self.weights[self.size] = weight
+        self.size += 1
+
+    def view(self) -> tuple:
+        return self.rows[: self.size], self.weights[: self.size]
+
+
+def _buildPostings(
+    rows: np.ndarray, features: np.ndarray, weights: np.ndarray
+) -> dict:
+    order = np.argsort(features, kind="stable")
+    rows, features, weights = rows[order], features[order], weights[order]
+    unique, starts = np.unique(features, return_index=True)
+    ends = np.append(starts[1:], features.size)
+    return {
+        int(feature): _Postings(rows[start:end].copy(), weights[start:end].copy())
+        for feature, start, end in zip(unique, starts, ends)
+    }
+
+
+class JobIndex(ChannelMirror):
+    """
+    Per-worker inverted index of hashed job features (title and
+    requirements) used to recommend jobs for a candidate's skills. Postings
+    hold tf weights only; idf comes from each feature's live posting count
+    at query time, so adding a job never rewrites existing postings.
+
+    The index is built from the database on startup and kept current
+    through a pub/sub channel that the recruiter services publish to after
+    committing, which keeps every worker's copy in step.
+    """
+
+    channel = JOBS_CHANNEL
+    name = "job_index"
+
+    def __init__(self):
+        super().__init__()
+        self._load([], *termMatrix([]))
+
+    def _load(self, ulids: list, rows, features, weights) -> None:
+        self._ulids = list(ulids)
+        self._slots = {ulid: slot for slot, ulid in enumerate(self._ulids)}
+        self._alive = np.ones(max(8, len(self._ulids)), dtype=bool)
+        self._postings = _buildPostings(rows, features, weights)
+        self._live = len(self._ulids)
+        self._dead = 0
+        self._updateGauges()
+
+    def _updateGauges(self) -> None:
+        metrics.setGauge("job_index_live", self._live)
+        metrics.setGauge("job_index_dead", self._dead)
+
+    def upsert(self, ulid: str, text: str) -> None:
+        self.remove(ulid)
+
+        slot = len(self._ulids)
+        if slot == self._alive.size:
+            self._alive = np.resize(self._alive, slot * 2)
+        self._alive[slot] = True
+        self._ulids.append(ulid)
+        self._slots[ulid] = slot
+        self._live += 1
+
+        features, weights = termVector(text)
+        for feature, weight in zip(features.tolist(), weights.tolist()):
+            postings = self._postings.get(feature)
+            if postings is None:
+                postings = self._postings[feature] = _Postings(
+                    np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+                )
+            postings.append(slot, weight)
+        self._updateGauges()
+
+    def remove(self, ulid: str) -> None:
+        slot = self._slots.pop(ulid, None)
+        if slot is None:
+            return
+
+        self._alive[slot] = False
+        self._ulids[slot] = None
+        self._live -= 1
+        self._dead += 1
+        if self._dead > max(COMPACT_MIN_DEAD, self._live * COMPACT_DEAD_RATIO):
+            self._compact()
+        self._updateGauges()
+
+    def _compact(self) -> None:
+        keep = self._alive[: len(self._ulids)]
+        newSlots = (np.cumsum(keep) - 1).astype(np.int32)
+
+        postings = {}
+        for feature, featurePostings in self._postings.items():
+            rows, weights = featurePostings.view()
+            live = keep[rows]
+            if live.any():
+                postings[feature] = _Postings(newSlots[rows[live]], weights[live])
+
+        self._ulids = [ulid for ulid in self._ulids if ulid is not None]
+        self._slots = {ulid: slot for slot, ulid in enumerate(self._ulids)}
+        self._alive = np.ones(max(8, len(self._ulids)), dtype=bool)
+        self._postings = postings
+        self._dead = 0
+
+    def apply(self, event: dict) -> None:
+        for ulid in event.get("remove", ()):
+            self.remove(ulid)
+        for ulid, text in event.get("upsert", ()):
+            self.upsert(ulid, text)
+
+    def topK(self, text: str, k: int) -> list:
+        """
+        Return up to k (ulid, score) pairs for text, best first.
+        """
+        started = time.perf_counter()
+        queryFeatures, queryWeights = termVector(text)
+
+        rowParts, scoreParts = [], []
+        for feature, queryWeight in zip(
+            queryFeatures.tolist(), queryWeights.tolist()
+        ):
+            postings = self._postings.get(feature)
+            if postings is None:
+                continue
+            rows, weights = postings.view()
+            live = self._alive[rows]
+            documentFrequency = int(np.count_nonzero(live))
+            if documentFrequency == 0:
+                continue
+            idf = math.log((1 + self._live) / (1 + documentFrequency)) + 1.0
+            rowParts.append(rows[live])
+            scoreParts.append(weights[live] * (queryWeight * idf * idf))
+
+        if not rowParts:
+            return []
+
+        rows = np.concatenate(rowParts)
+        contributions = np.concatenate(scoreParts)
+        if rows.size * DENSE_SCORING_RATIO > len(self._ulids):
+            slots = None
+            scores = np.bincount(
+                rows, weights=contributions, minlength=len(self._ulids)
+            )
+        else:
+            slots, inverse = np.unique(rows, return_inverse=True)
+            scores = np.bincount(inverse, weights=contributions)
+
+        k = min(k, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        top = top[scores[top] > 0]
+        topSlots = top if slots is None else slots[top]
+
+        metrics.observe("job_recommendation_seconds", time.perf_counter() - started)
+        return [
+            (self._ulids[slot], float(score))
+            for slot, score in zip(topSlots.tolist(), scores[top].tolist())
+        ]
+
+    async def _rebuild(self) -> None:
+        ulids, rowParts, featureParts, weightParts = [], [], [], []
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(
+                select(
+                    models.Job.ulid, models.Job.title, models.Job.requirements
+                ).execution_options(yield_per=REBUILD_BATCH_SIZE)
+            )
+            async for batch in result.partitions():
+                texts = [jobText(title, requirements) for _, title, requirements in batch]
+                rows, features, weights = await asyncio.to_thread(termMatrix, texts)
+                rowParts.append(rows + len(ulids))
+                featureParts.append(features)
+                weightParts.append(weights)
+                ulids.extend(ulid for ulid, _, _ in batch)
+
+        if not ulids:
+            self._load([], *termMatrix([]))
+            return
+        self._load(
+            ulids,
+            np.concatenate(rowParts),
+            np.concatenate(featureParts),
+            np.concatenate(weightParts),
+        )
+
+
+async def publishJobChanges(upserted: list = (), removed: list = ()) -> None:
+    """
+    Tell every worker's index (this one included) about committed job
+    changes. upserted holds (ulid, title, requirements) tuples.
+    """
+    event = {
+        "upsert": [
+            [ulid, jobText(title, requirements)]
+            for ulid, title, requirements in upserted
+        ],
+        "remove": list(removed),
+    }
+    await publish(JOBS_CHANNEL, event, JobIndex.name)
+
+
+jobIndex = JobIndex()
@@ -0,0 +1,124 @@
+import time
+
+from config.redis import redisCache
+from utils import metrics
+from utils.mirror import ChannelMirror
+from utils.principal import principalCache
+
+REVOCATION_CHANNEL = "auth:revocations"
+# Per-token revocations are keyed by the token's jti; tokens issued before
+# jti existed were blacklisted under their full string
+REVOKED_PREFIX = "revoked:"
+BLACKLIST_PREFIX = "blacklist:"
+# Per-user token generation; tokens carrying an older gen are revoked
+GENERATION_PREFIX = "tokengen:"
+
+REBUILD_BATCH_SIZE = 500
+PRUNE_INTERVAL_SECONDS = 60
+
+
+class RevocationFilter(ChannelMirror):
+    """
+    Per-worker copy of the Redis revocation keys and user token generations.
+    Its channel also carries principal invalidations for principalCache.
+    It is rebuilt with a SCAN on startup and kept current through a pub/sub
+    channel, so checking a token that is not revoked needs no network
+    round-trip. While the filter is not ready, callers fall back to asking
+    Redis directly.
+    """
+
+    channel = REVOCATION_CHANNEL
+    name = "token_revocation_filter"
+
+    def __init__(self):
+        super().__init__()
+        self._revoked = {}
+        self._generations = {}
+        self._lastPrune = time.time()
+
+    def add(self, key: str, expiresAt: float) -> None:
+        self._revoked[key] = expiresAt
+        metrics.setGauge("token_revocation_filter_size", len(self._revoked))
+
+    def setGeneration(self, userUlId: str, generation: int) -> None:
+        if generation > self._generations.get(userUlId, 0):
+            self._generations[userUlId] = generation
+
+    def generation(self, userUlId: str) -> int:
+        return self._generations.get(userUlId, 0)
+
+    def contains(self, key: str) -> bool:
+        expiresAt = self._revoked.get(key)
+        if expiresAt is None:
+            return False
+        if expiresAt <= time.time():
+            self._revoked.pop(key, None)
+            return False
+        return True
+
+    def _prune(self) -> None:
+        now = time.time()
+        self._revoked = {
+            key: expiresAt
+            for key, expiresAt in self._revoked.items()
+            if expiresAt > now
+        }
+        self._lastPrune = now
+        metrics.setGauge("token_revocation_filter_size", len(self._revoked))
+
+    async def _scan(self, prefix: str):
+        batch = []
+        async for redisKey in redisCache.scan_iter(
+            match=f"{prefix}*", count=REBUILD_BATCH_SIZE
+        ):
+            batch.append(redisKey)
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _rebuild(self) -> None:
+        revoked = {}
+        for prefix in (REVOKED_PREFIX, BLACKLIST_PREFIX):
+            async for batch in self._scan(prefix):
+                revoked.update(await self._expiries(batch))
+
+        generations = {}
+        async for batch in self._scan(GENERATION_PREFIX):
+            for redisKey, generation in zip(batch, await redisCache.mget(batch)):
+                if generation is not None:
+                    userUlId = redisKey.decode("utf-8")[len(GENERATION_PREFIX) :]
+                    generations[userUlId] = int(generation)
+
+        self._revoked = revoked
+        self._generations = generations
+        metrics.setGauge("token_revocation_filter_size", len(self._revoked))
+
+    async def _expiries(self, redisKeys: list) -> dict:
+        pipe = redisCache.pipeline(transaction=False)
+        for redisKey in redisKeys:
+            pipe.ttl(redisKey)
+        ttls = await pipe.execute()
+
+        now = time.time()
+        return {
+            redisKey.decode("utf-8"): now + ttl
+            for redisKey, ttl in zip(redisKeys, ttls)
+            if ttl > 0
+        }
+
+    def apply(self, event: dict) -> None:
+        if "principal" in event:
+            principalCache.invalidate(event["principal"])
+        elif "gen" in event:
+            self.setGeneration(event["user"], event["gen"])
+        else:
+            self.add(event["key"], event["exp"])
+
+    def tick(self) -> None:
+        if time.time() - self._lastPrune > PRUNE_INTERVAL_SECONDS:
+            self._prune()
+
+
+revocationFilter = RevocationFilter()
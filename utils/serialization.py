@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+import orjson
+
+from utils import metrics
+
+MAX_CACHED_JOBS = 20000
+
+
+def dumps(payload) -> bytes:
+    """
+    Encode a response body. orjson.Fragment values are copied in as they
+    are, without being encoded again.
+    """
+    return orjson.dumps(payload)
+
+
+def jobData(job) -> dict:
+    """
+    The public JSON shape of a job. job is a models.Job or any row with the
+    same attribute names.
+    """
+    return {
+        "id": job.ulid,
+        "title": job.title,
+        "description": job.description,
+        "requirements": job.requirements,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+    }
+
+
+class JobFragmentCache:
+    """
+    Per-worker LRU of encoded jobData() bytes keyed by (ulid, version).
+    Every content change bumps the version, so entries never go stale and
+    are only ever evicted.
+    """
+
+    def __init__(self, maxSize: int = MAX_CACHED_JOBS):
+        self.maxSize = maxSize
+        self._entries = OrderedDict()
+
+    def get(self, job) -> orjson.Fragment:
+        key = (job.ulid, job.version)
+        fragment = self._entries.get(key)
+        if fragment is not None:
+            self._entries.move_to_end(key)
+            metrics.increment("job_fragment_cache_hits_total")
+            return fragment
+
+        metrics.increment("job_fragment_cache_misses_total")
+        fragment = orjson.Fragment(orjson.dumps(jobData(job)))
+        self._entries[key] = fragment
+        if len(self._entries) > self.maxSize:
+            self._entries.popitem(last=False)
+        return fragment
+
+
+jobFragments = JobFragmentCache()
+
+
+def jobFragment(job) -> orjson.Fragment:
+    return jobFragments.get(job)
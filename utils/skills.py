@@ -0,0 +1,175 @@
+import re
+import time
+
+import numpy as np
+from sqlalchemy import select
+
+import models
+from config.database import AsyncSessionLocal
+from utils import metrics
+from utils.mirror import ChannelMirror, publish
+
+SKILLS_CHANNEL = "skills:changed"
+MAX_SKILL_LENGTH = 64
+REBUILD_BATCH_SIZE = 5000
+CANDIDATE_ROLE_ID = 2
+# Lists shorter than 1/SPARSE_RATIO of all users are merged as sorted
+# arrays; longer ones through a per-user mask
+SPARSE_RATIO = 64
+
+# Keep in sync with the backfill in migrations/versions/0004_user_skills.py
+_SEPARATORS = re.compile(r"[,;|\n]")
+_WHITESPACE = re.compile(r"\s+")
+
+_EMPTY = np.empty(0, dtype=np.int32)
+
+
+def parseSkills(text: str) -> list:
+    """
+    Split a free-text skills field into unique normalised skill names,
+    keeping their original order.
+    """
+    if not text:
+        return []
+
+    names = []
+    for part in _SEPARATORS.split(text):
+        name = _WHITESPACE.sub(" ", part).strip().lower()
+        if name and len(name) <= MAX_SKILL_LENGTH and name not in names:
+            names.append(name)
+    return names
+
+
+class SkillIndex(ChannelMirror):
+    """
+    Per-worker inverted index from skill name to the sorted slots of the
+    candidates having it. Multi-skill queries are answered from these
+    arrays alone and never touch the database.
+    """
+
+    channel = SKILLS_CHANNEL
+    name = "skill_index"
+
+    def __init__(self):
+        super().__init__()
+        self._load([], {})
+
+    def _load(self, users: list, postings: dict) -> None:
+        self._users = users
+        self._slots = {userUlId: slot for slot, userUlId in enumerate(users)}
+        self._postings = postings
+        self._skillsOf = {}
+        for name, slots in postings.items():
+            for slot in slots.tolist():
+                self._skillsOf.setdefault(slot, set()).add(name)
+        metrics.setGauge("skill_index_users", len(self._users))
+        metrics.setGauge("skill_index_skills", len(self._postings))
+
+    def setSkills(self, userUlId: str, names: list) -> None:
+        slot = self._slots.get(userUlId)
+        if slot is None:
+            slot = len(self._users)
+            self._users.append(userUlId)
+            self._slots[userUlId] = slot
+
+        current = self._skillsOf.get(slot, set())
+        wanted = set(names)
+
+        for name in current - wanted:
+            slots = self._postings[name]
+            slots = slots[slots != slot]
+            if slots.size:
+                self._postings[name] = slots
+            else:
+                del self._postings[name]
+
+        for name in wanted - current:
+            slots = self._postings.get(name, _EMPTY)
+            self._postings[name] = np.insert(
+                slots, np.searchsorted(slots, slot), slot
+            ).astype(np.int32)
+
+        self._skillsOf[slot] = wanted
+        metrics.setGauge("skill_index_users", len(self._users))
+        metrics.setGauge("skill_index_skills", len(self._postings))
+
+    def apply(self, event: dict) -> None:
+        self.setSkills(event["user"], event["skills"])
+
+    def match(self, names: list, mode: str = "all") -> np.ndarray:
+        """
+        Return the sorted slots of candidates having all (or any) of names.
+        """
+        started = time.perf_counter()
+        postings = [self._postings.get(name, _EMPTY) for name in names]
+        if not postings:
+            return _EMPTY
+
+        postings.sort(key=len)
+        sparse = postings[0 if mode == "all" else -1].size * SPARSE_RATIO < len(
+            self._users
+        )
+
+        if mode == "all" and sparse:
+            # Probe the rarest skill's slots into the other lists with binary
+            # search, so the cost follows the rarest skill
+            slots = postings[0]
+            for other in postings[1:]:
+                if not slots.size or not other.size:
+                    slots = _EMPTY
+                    break
+                positions = np.searchsorted(other, slots)
+                positions[positions == other.size] = 0
+                slots = slots[other[positions] == slots]
+        elif mode == "all":
+            # Common skills: count hits per user instead of probing
+            hits = np.zeros(len(self._users), dtype=np.int32)
+            for other in postings:
+                hits[other] += 1
+            slots = np.flatnonzero(hits == len(postings)).astype(np.int32)
+        elif sparse:
+            slots = np.unique(np.concatenate(postings))
+        else:
+            mask = np.zeros(len(self._users), dtype=bool)
+            for other in postings:
+                mask[other] = True
+            slots = np.flatnonzero(mask).astype(np.int32)
+
+        metrics.observe("skill_index_query_seconds", time.perf_counter() - started)
+        return slots
+
+    def usersOf(self, slots: np.ndarray) -> list:
+        return [self._users[slot] for slot in slots.tolist()]
+
+    async def _rebuild(self) -> None:
+        users, slotsOf = [], {}
+        async with AsyncSessionLocal() as db:
+            # Ordered by user so every user's slot is assigned once and each
+            # skill's slot list comes out sorted
+            result = await db.stream(
+                select(models.UserSkill.user_id, models.Skill.name)
+                .join(models.Skill, models.Skill.id == models.UserSkill.skill_id)
+                .join(models.User, models.User.userUlId == models.UserSkill.user_id)
+                .where(models.User.role_id == CANDIDATE_ROLE_ID)
+                .order_by(models.UserSkill.user_id)
+                .execution_options(yield_per=REBUILD_BATCH_SIZE)
+            )
+            async for batch in result.partitions():
+                for userUlId, name in batch:
+                    if not users or users[-1] != userUlId:
+                        users.append(userUlId)
+                    slotsOf.setdefault(name, []).append(len(users) - 1)
+
+        self._load(
+            users,
+            {name: np.array(slots, dtype=np.int32) for name, slots in slotsOf.items()},
+        )
+
+
+async def publishUserSkills(userUlId: str, names: list) -> None:
+    await publish(
+        SKILLS_CHANNEL, {"user": userUlId, "skills": names}, SkillIndex.name
+    )
+
+
+skillIndex = SkillIndex()
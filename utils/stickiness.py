@@ -0,0 +1,64 @@
+import time
+
+from redis.exceptions import RedisError
+
+from config.redis import redisCache
+from config.settings import DATABASE_REPLICA_URLS, READ_YOUR_WRITES_SECONDS
+from utils import metrics
+
+STICKY_PREFIX = "db:wrote:"
+MAX_LOCAL_MARKS = 10000
+
+
+class WriteMarks:
+    """
+    Remembers which users committed a write in the last
+    READ_YOUR_WRITES_SECONDS, so their reads skip the replicas until those
+    have caught up. Marks are kept locally for this worker and in Redis for
+    the others.
+    """
+
+    def __init__(self, seconds: int, maxSize: int = MAX_LOCAL_MARKS):
+        self.seconds = seconds
+        self.maxSize = maxSize
+        self._expiries = {}
+
+    def _localMark(self, userUlId: str) -> bool:
+        expiresAt = self._expiries.get(userUlId)
+        if expiresAt is None:
+            return False
+        if expiresAt < time.monotonic():
+            self._expiries.pop(userUlId, None)
+            return False
+        return True
+
+    async def mark(self, userUlId: str) -> None:
+        if len(self._expiries) >= self.maxSize:
+            # Drop the oldest insertion to stay bounded
+            self._expiries.pop(next(iter(self._expiries)), None)
+        self._expiries.pop(userUlId, None)
+        self._expiries[userUlId] = time.monotonic() + self.seconds
+
+        try:
+            await redisCache.set(f"{STICKY_PREFIX}{userUlId}", 1, ex=self.seconds)
+        except RedisError:
+            metrics.increment("read_your_writes_redis_errors_total")
+
+    async def wroteRecently(self, userUlId: str) -> bool:
+        if self._localMark(userUlId):
+            return True
+        try:
+            return bool(await redisCache.exists(f"{STICKY_PREFIX}{userUlId}"))
+        except RedisError:
+            # Unknown: reading from the primary is always consistent
+            metrics.increment("read_your_writes_redis_errors_total")
+            return True
+
+
+writeMarks = WriteMarks(READ_YOUR_WRITES_SECONDS)
+
+
+async def markWrite(userUlId: str) -> None:
+    # Without replicas every read already goes to the primary
+    if DATABASE_REPLICA_URLS:
+        await writeMarks.mark(userUlId)
@@ -1,29 +1,54 @@
+import json
+import secrets
 import jwt
+from typing import Optional
 from datetime import datetime, timedelta
 from jwt import ExpiredSignatureError, InvalidTokenError
 
 from config.settings import CANDIDATE_TOKEN, EXPIRY_MINUTES, RECRUITER_TOKEN
-from config.redis import redisStore
+from config.redis import redisCache
+from utils import metrics
+from utils.principal import principalCache
+from utils.revocation import (
+    BLACKLIST_PREFIX,
+    GENERATION_PREFIX,
+    REVOCATION_CHANNEL,
+    REVOKED_PREFIX,
+    revocationFilter,
+)
 
 ALGORITHM = "HS256"
 
 
-def createRecruiterToken(userUlId: str) -> str:
+async def _tokenPayload(userUlId: str, claims: Optional[dict]) -> dict:
     expiry_minutes = int(EXPIRY_MINUTES) if EXPIRY_MINUTES is not None else 0
-    payload = {
+    return {
+        **(claims or {}),
         "userUlId": userUlId,
+        "jti": secrets.token_urlsafe(8),
+        "gen": await currentTokenGeneration(userUlId),
         "exp": datetime.utcnow() + timedelta(minutes=expiry_minutes),
     }
-    return jwt.encode(payload, RECRUITER_TOKEN, algorithm=ALGORITHM)
 
 
-def verifyRecruiterToken(token: str) -> dict:
+async def createRecruiterToken(userUlId: str, claims: Optional[dict] = None) -> str:
+    """
+    claims carries the role and minimal profile (role_id, email, full_name)
+    so the auth dependencies can authorize without loading the user.
+    """
+    return jwt.encode(
+        await _tokenPayload(userUlId, claims), RECRUITER_TOKEN, algorithm=ALGORITHM
+    )
+
+
+async def verifyRecruiterToken(token: str) -> dict:
     try:
-        # Check if token is blacklisted
-        if isTokenBlacklisted(token):
+        decoded = jwt.decode(token, RECRUITER_TOKEN, algorithms=[ALGORITHM])
+
+        # Check if token has been revoked
+        if await isTokenRevoked(token, decoded):
             return {"valid": False, "error": "Token has been revoked"}
 
-        decoded = jwt.decode(token, RECRUITER_TOKEN, algorithms=[ALGORITHM])
         return {"valid": True, "data": decoded}
     except ExpiredSignatureError:
         return {"valid": False, "error": "Token has expired"}
@@ -31,22 +56,24 @@ def verifyRecruiterToken(token: str) -> dict:
         return {"valid": False, "error": "Invalid token"}
 
 
-def createCandidateToken(userUlId: str) -> str:
-    expiry_minutes = int(EXPIRY_MINUTES) if EXPIRY_MINUTES is not None else 0
-    payload = {
-        "userUlId": userUlId,
-        "exp": datetime.utcnow() + timedelta(minutes=expiry_minutes),
-    }
-    return jwt.encode(payload, CANDIDATE_TOKEN, algorithm=ALGORITHM)
+async def createCandidateToken(userUlId: str, claims: Optional[dict] = None) -> str:
+    """
+    claims carries the role and minimal profile (role_id, email, full_name)
+    so the auth dependencies can authorize without loading the user.
+    """
+    return jwt.encode(
+        await _tokenPayload(userUlId, claims), CANDIDATE_TOKEN, algorithm=ALGORITHM
+    )
 
 
-def verifyCandidateToken(token: str) -> dict:
+async def verifyCandidateToken(token: str) -> dict:
     try:
-        # Check if token is blacklisted
-        if isTokenBlacklisted(token):
+        decoded = jwt.decode(token, CANDIDATE_TOKEN, algorithms=[ALGORITHM])
+
+        # Check if token has been revoked
+        if await isTokenRevoked(token, decoded):
             return {"valid": False, "error": "Token has been revoked"}
 
-        decoded = jwt.decode(token, CANDIDATE_TOKEN, algorithms=[ALGORITHM])
         return {"valid": True, "data": decoded}
     except ExpiredSignatureError:
         return {"valid": False, "error": "Token has expired"}
@@ -54,10 +81,18 @@ def verifyCandidateToken(token: str) -> dict:
         return {"valid": False, "error": "Invalid token"}
 
 
-def blacklistToken(token: str) -> bool:
+def _revocationKey(token: str, decoded: dict) -> str:
+    jti = decoded.get("jti")
+    if jti:
+        return f"{REVOKED_PREFIX}{jti}"
+    # Tokens issued before jti existed are revoked under their full string
+    return f"{BLACKLIST_PREFIX}{token}"
+
+
+async def blacklistToken(token: str) -> bool:
     """
-    Add a token to the blacklist in Redis.
-    The token will be stored until its natural expiration time.
+    Revoke a single token in Redis.
+    Only the token's jti is stored, until its natural expiration time.
     """
     try:
         # Decode the token to get expiration time (without verification)
@@ -71,8 +106,16 @@ def blacklistToken(token: str) -> bool:
 
             # Only blacklist if token hasn't already expired
             if ttl_seconds > 0:
-                # Store token in Redis with TTL
-                redisStore.set(f"blacklist:{token}", "revoked", ttl_seconds)
+                # Store the key in Redis with TTL and tell every worker's
+                # local revocation filter about it
+                key = _revocationKey(token, decoded)
+                pipe = redisCache.pipeline(transaction=False)
+                pipe.set(key, "1", ex=ttl_seconds)
+                pipe.publish(
+                    REVOCATION_CHANNEL, json.dumps({"key": key, "exp": exp_timestamp})
+                )
+                await pipe.execute()
+                revocationFilter.add(key, exp_timestamp)
                 return True
             else:
                 # Token is already expired, no need to blacklist
@@ -84,13 +127,65 @@ def blacklistToken(token: str) -> bool:
         return False
 
 
-def isTokenBlacklisted(token: str) -> bool:
+async def revokeAllTokens(userUlId: str) -> int:
     """
-    Check if a token is in the blacklist.
+    Revoke every token issued to a user so far by bumping their token
+    generation. Returns the new generation.
     """
+    generation = await redisCache.incr(f"{GENERATION_PREFIX}{userUlId}")
+    await redisCache.publish(
+        REVOCATION_CHANNEL, json.dumps({"user": userUlId, "gen": generation})
+    )
+    revocationFilter.setGeneration(userUlId, generation)
+    return generation
+
+
+async def invalidatePrincipal(userUlId: str) -> None:
+    """
+    Drop a changed user from every worker's principal cache. If publishing
+    fails, other workers keep the old principal for up to
+    PRINCIPAL_CACHE_TTL.
+    """
+    principalCache.invalidate(userUlId)
+    try:
+        await redisCache.publish(REVOCATION_CHANNEL, json.dumps({"principal": userUlId}))
+    except Exception as e:
+        metrics.increment("principal_invalidation_errors_total")
+        print(f"Error publishing principal invalidation: {str(e)}")
+
+
+async def currentTokenGeneration(userUlId: str) -> int:
+    if revocationFilter.ready:
+        return revocationFilter.generation(userUlId)
+
+    try:
+        generation = await redisCache.get(f"{GENERATION_PREFIX}{userUlId}")
+        return int(generation) if generation else 0
+    except Exception as e:
+        metrics.increment("token_revocation_check_errors_total")
+        print(f"Error reading token generation: {str(e)}")
+        return 0
+
+
+async def isTokenRevoked(token: str, decoded: dict) -> bool:
+    """
+    Check if a token was revoked on its own or through its user's generation.
+    Answered from the in-process revocation filter while it is in sync with
+    Redis; otherwise Redis is asked directly.
+    """
+    if decoded.get("gen", 0) < await currentTokenGeneration(decoded.get("userUlId")):
+        return True
+
+    key = _revocationKey(token, decoded)
+    if revocationFilter.ready:
+        return revocationFilter.contains(key)
+
     try:
-        result = redisStore.get(f"blacklist:{token}")
+        result = await redisCache.get(key)
         return result is not None
     except Exception as e:
+        # Fails open so a Redis outage does not log everyone out, but is
+        # counted so it can be alerted on
+        metrics.increment("token_revocation_check_errors_total")
         print(f"Error checking token blacklist: {str(e)}")
         return False
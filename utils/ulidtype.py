@@ -0,0 +1,53 @@
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.types import TypeDecorator
+from ulid import ULID
+
+NIL_UUID = uuid.UUID(int=0)
+
+
+def canonicalUlid(value: str, detail: str = "Job not found") -> str:
+    """
+    Return the canonical upper-case form of a ULID taken from a URL, or
+    raise a 404. Lookups accept any case, so ids go through this before they
+    are used in cache or counter keys.
+    """
+    try:
+        return str(ULID.from_str(value.upper()))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+class ULIDType(TypeDecorator):
+    """
+    A ULID stored in a native 16-byte uuid column while the application
+    keeps working with its 26-character string form. Both encodings are the
+    same 128 bits, so ordering by the column is still creation order.
+
+    Strings that are not valid ULIDs bind as the nil UUID, which no row
+    holds, so a lookup by a malformed id behaves like one by an unknown id
+    instead of raising a database error.
+    """
+
+    impl = UUID(as_uuid=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        try:
+            return ULID.from_str(str(value).upper()).to_uuid()
+        except ValueError:
+            return NIL_UUID
+
+    def process_literal_param(self, value, dialect):
+        return self.process_bind_param(value, dialect)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return str(ULID.from_uuid(value))
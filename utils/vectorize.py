@@ -0,0 +1,93 @@
+import re
+import zlib
+from typing import Iterable
+
+import numpy as np
+
+# Hashed bag-of-words features for free-text skills and requirements. Tokens
+# are hashed into a fixed feature space, so there is no vocabulary to build or
+# keep in sync between workers.
+N_FEATURES = 1 << 20
+
+# Keeps tech tokens such as "c++", "c#" and "node.js" whole
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has",
+        "have", "in", "is", "it", "of", "on", "or", "our", "that", "the", "to",
+        "we", "will", "with", "you", "your", "years", "year", "experience",
+    }
+)
+
+
+def tokenize(text: str) -> list:
+    if not text:
+        return []
+
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        token = token.rstrip(".")
+        if token and token not in STOP_WORDS:
+            tokens.append(token)
+    return tokens
+
+
+def termVector(text: str) -> tuple:
+    """
+    Return (features, weights) for text: sorted unique feature ids with
+    sublinear term frequencies, L2 normalised.
+    """
+    hashes = [zlib.crc32(token.encode("utf-8")) for token in tokenize(text)]
+    if not hashes:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+
+    features, counts = np.unique(
+        np.array(hashes, dtype=np.uint32) % N_FEATURES, return_counts=True
+    )
+    weights = 1.0 + np.log(counts, dtype=np.float32)
+    weights /= np.linalg.norm(weights)
+    return features.astype(np.int32), weights.astype(np.float32)
+
+
+def termMatrix(texts: Iterable[str]) -> tuple:
+    """
+    Vectorise many texts at once. Returns (rows, features, weights) in
+    coordinate form, rows being the position of each text in texts.
+    """
+    rows, features, weights = [], [], []
+    for row, text in enumerate(texts):
+        textFeatures, textWeights = termVector(text)
+        rows.append(np.full(textFeatures.size, row, dtype=np.int32))
+        features.append(textFeatures)
+        weights.append(textWeights)
+
+    if not rows:
+        return (
+            np.empty(0, dtype=np.int32),
+            np.empty(0, dtype=np.int32),
+            np.empty(0, dtype=np.float32),
+        )
+    return np.concatenate(rows), np.concatenate(features), np.concatenate(weights)
+
+
+def scoreTexts(queryText: str, texts: list) -> np.ndarray:
+    """
+    Cosine similarity of every text against queryText, computed in one pass
+    over the texts' combined features.
+    """
+    queryFeatures, queryWeights = termVector(queryText)
+    scores = np.zeros(len(texts), dtype=np.float32)
+    if queryFeatures.size == 0 or not texts:
+        return scores
+
+    rows, features, weights = termMatrix(texts)
+    positions = np.searchsorted(queryFeatures, features)
+    positions[positions == queryFeatures.size] = 0
+    matched = queryFeatures[positions] == features
+    scores += np.bincount(
+        rows[matched],
+        weights=weights[matched] * queryWeights[positions[matched]],
+        minlength=len(texts),
+    ).astype(np.float32)
+    return scores